@@ -1,31 +1,39 @@
+import argparse
+import math
 import os
-from src.helper import Colors, run_experiment, get_available_datasets, is_valid_input
-from src.generate_data import generate_weighted_graph, save_graph_to_disk
-from src.stats import save_results_to_csv, plot_results
+import sys
+from src.helper import Colors, EXPERIMENT_ENGINES, get_available_datasets, filter_datasets, is_valid_input
+from src.helper import print_source_summary
+from src.generate_data import edges_for_type, generate_weighted_graph, save_graph_to_disk
+from src.stats import save_results_to_csv, save_results_to_json, load_results_from_json, plot_results
+from src.stats import save_source_results_to_csv
+from src.runner import OK, RUN_TIMEOUT, run_isolated_benchmark, sample_sources, source_records
+from src.history import DEFAULT_HISTORY, BenchmarkHistory
+from src.load_graph import dataset_edge_count
+from src.complexity import fit_results, print_complexity_report
+from src.profiling import PROFILE_DIR, SAMPLERS, profile_datasets
 from datetime import datetime
 
-def generate_graphs():
-    """
-    Generate new graph datasets based on user input for benchmarking.
-    
-    Handles user input for graph sizes and types (dense/sparse/middle),
-    then generates and saves the corresponding graphs to the data directory.
+GRAPH_TYPES = ["random", "sparse", "middle", "dense"]
+
+# Menu benchmark: sources sampled per dataset (shared by all engines) and timed runs per source
+MENU_SOURCES = 5
+MENU_REPEATS = 3
+
+def parse_graph_specs(items):
     """
-    print("\n--- Generate New Datasets ---")
-    print("Enter a list of graph sizes (e.g., 1000, 2000 or [1000, 2000]):")
-    print("- Tips: add 'd', 's', 'm' in the end to specify graph types 'dense', 'sparse' and 'middle(average)', e.g. 100s, 200s, 300s")
-    user_input = input("Graph sizes: ").strip()
-    
-    # Parse the user input
-    if user_input.startswith("[") and user_input.endswith("]"):
-        user_input = user_input[1:-1]  # Remove brackets
+    Parse graph size specifications such as "1000", "200s", "300d" or "400m".
 
-    # Verify user input and extract graph specifications
+    Args:
+        items: List of specification strings.
+
+    Returns:
+        Tuple of (graph_sizes, invalid_input): graph_sizes is a list of
+        (size, graph_type) tuples, invalid_input the items that did not parse.
+    """
     graph_sizes = []
     invalid_input = []
-    input_list = [size.strip() for size in user_input.split(",")]
-
-    for item in input_list:
+    for item in items:
         if is_valid_input(item):
             if item.isdecimal():
                 graph_sizes.append((int(item), "random"))
@@ -35,32 +43,168 @@ def generate_graphs():
                 graph_sizes.append((int(item[:-1]), graph_type))
         else:
             invalid_input.append(item)
-    if len(invalid_input) > 0:
-        print("Found invalid input, skipping:", invalid_input)
+    return graph_sizes, invalid_input
+
+def generate_datasets(graph_sizes, data_dir="data"):
+    """
+    Generate and save one graph per (size, graph_type) specification.
 
-    data_dir = "data"
+    Args:
+        graph_sizes: List of (size, graph_type) tuples.
+        data_dir: Directory the graphs are saved to.
+
+    Returns:
+        List of the saved file paths.
+    """
     os.makedirs(data_dir, exist_ok=True)
-        
-    # Generate graphs based on specifications
-    for item in graph_sizes:
-        size = item[0]
-        type = item[1]
+    paths = []
+    for size, type in graph_sizes:
         print(f"\nGenerating graph with {size} nodes...")
-        # Calculate edges based on graph type
-        sparse_edge = size * 2
-        dense_edge = size * (size - 1) // 2
-        num_edges = sparse_edge if type == "sparse" else dense_edge if type == "dense" else (sparse_edge + dense_edge) // 2 if type == "middle" else size * 5
+        num_edges = edges_for_type(size, type)
         graph = generate_weighted_graph(num_nodes=size, num_edges=num_edges)
         filename = f"graph_n{size}_e{num_edges}_{type}.json"
         filepath = os.path.join(data_dir, filename)
         save_graph_to_disk(graph, filepath)
-    
+        paths.append(filepath)
+    return paths
+
+def generate_graphs():
+    """
+    Generate new graph datasets based on user input for benchmarking.
+
+    Handles user input for graph sizes and types (dense/sparse/middle),
+    then generates and saves the corresponding graphs to the data directory.
+    """
+    print("\n--- Generate New Datasets ---")
+    print("Enter a list of graph sizes (e.g., 1000, 2000 or [1000, 2000]):")
+    print("- Tips: add 'd', 's', 'm' in the end to specify graph types 'dense', 'sparse' and 'middle(average)', e.g. 100s, 200s, 300s")
+    user_input = input("Graph sizes: ").strip()
+
+    # Parse the user input
+    if user_input.startswith("[") and user_input.endswith("]"):
+        user_input = user_input[1:-1]  # Remove brackets
+
+    # Verify user input and extract graph specifications
+    graph_sizes, invalid_input = parse_graph_specs([size.strip() for size in user_input.split(",")])
+    if len(invalid_input) > 0:
+        print("Found invalid input, skipping:", invalid_input)
+
+    generate_datasets(graph_sizes)
     print("\nDataset generation completed.")
 
+def list_datasets(datasets):
+    """Print one line per dataset."""
+    for filepath, graph_size, graph_type in datasets:
+        print(f"Graph file: {filepath}, Size: {graph_size}, Type: {graph_type}")
+
+def print_results(results):
+    """Print benchmark results, one block per dataset."""
+    print("\nResults:")
+    for result in results:
+        print(f"{Colors.MAGENTA}Graph Size: {result[0]}{Colors.RESET}")
+        print(f"Graph Type: {result[1]}")
+        for engine, entry in zip(EXPERIMENT_ENGINES, result[2:]):
+            if math.isnan(entry[0]):
+                print(f"{engine}: no result (not run, skipped or timed out)")
+                continue
+            print(f"{engine}: Time={entry[0]:.6f}s (IQR {entry[2]:.6f}s, min {entry[3]:.6f}s), "
+                  f"Memory={entry[1]}B, Working set={entry[4]}B")
+        print()
+
+def run_benchmark(datasets, csv_path=None, json_path=None, plot_name=None, sources_csv_path=None,
+                  history_path=None, label=None, **kwargs):
+    """
+    Benchmark datasets in isolated processes and save the results.
+
+    Args:
+        datasets: List of (filepath, graph_size, graph_type) tuples.
+        csv_path: CSV file to write (None to skip).
+        json_path: JSON file to write, including every run's status (None to skip).
+        plot_name: Base name of the plots written under results/ (None to skip).
+        sources_csv_path: CSV file for the per-source times and reached counts (None to skip).
+        history_path: SQLite history the runs are appended to (None to skip).
+        label: Optional label of the history session.
+        **kwargs: Options of run_isolated_benchmark (repeats, workers, pin,
+                 timeout, warmup, engines, sources).
+
+    Returns:
+        Tuple of (results, runs) from run_isolated_benchmark.
+    """
+    timeout = kwargs.get("timeout")
+    print(f"\n{Colors.MAGENTA}Running {len(datasets)} datasets in isolated processes"
+          f"{'' if timeout is None else f' (timeout {timeout} s per run)'}...{Colors.RESET}")
+    results, runs = run_isolated_benchmark(datasets, **kwargs)
+    failed = [run for run in runs if run[4] != OK]
+    for filepath, engine, source, repeat, status, _, _ in failed:
+        print(f"{Colors.RED}{filepath} {engine} source {source} #{repeat}: {status}{Colors.RESET}")
+    print(f"{Colors.GREEN}Done ({len(runs) - len(failed)}/{len(runs)} runs completed).{Colors.RESET}")
+    records = source_records(runs)
+    print_source_summary(records)
+    fits = fit_results(results, edge_counts=[dataset_edge_count(filepath) for filepath, _, _ in datasets])
+    print_complexity_report(fits)
+
+    if plot_name is not None:
+        plot_results(results, plot_name, fits=fits)
+    if csv_path is not None:
+        result_dir, filename = os.path.split(csv_path)
+        save_results_to_csv(results, os.path.splitext(filename)[0], result_dir or ".")
+    if sources_csv_path is not None:
+        result_dir, filename = os.path.split(sources_csv_path)
+        save_source_results_to_csv(records, os.path.splitext(filename)[0], result_dir or ".")
+    if json_path is not None:
+        save_results_to_json(results, json_path, datasets, runs, params=kwargs)
+    if history_path is not None:
+        # Only the options that change individual run times key the comparison;
+        # the sources of every run are stored with it and key it as well
+        params = {"warmup": kwargs.get("warmup", 1), "pin": kwargs.get("pin", False),
+                  "workers": kwargs.get("workers")}
+        with BenchmarkHistory(history_path) as history:
+            session = history.record_runs(runs, datasets, params, label)
+        print(f"{Colors.BLUE}Runs recorded in {history_path} (session {session}).{Colors.RESET}")
+    return results, runs
+
+def compare_sessions(history_path=DEFAULT_HISTORY, current=None, baseline=None, alpha=0.05, min_ratio=1.05):
+    """
+    Compare two history sessions and print significant slowdowns per engine.
+
+    Args:
+        history_path: SQLite history file.
+        current: Session id, label or commit of the runs to check (default: latest session).
+        baseline: Session id, label or commit of the reference (default: the session before current).
+        alpha: Significance level of the Mann-Whitney U test.
+        min_ratio: Smallest median slowdown ratio worth flagging.
+
+    Returns:
+        List of compared rows (see BenchmarkHistory.compare), None if the
+        sessions could not be resolved.
+    """
+    with BenchmarkHistory(history_path) as history:
+        sessions = [row[0] for row in history.sessions()]
+        current = history.find_session(current) if current is not None else (sessions[-1] if sessions else None)
+        if baseline is not None:
+            baseline = history.find_session(baseline)
+        elif current in sessions and sessions.index(current) > 0:
+            baseline = sessions[sessions.index(current) - 1]
+        if current is None or baseline is None:
+            print("Need a current and a baseline session to compare.")
+            return None
+        rows = history.compare(current, baseline, alpha, min_ratio)
+
+    print(f"\n{Colors.MAGENTA}Session {current} vs baseline {baseline}{Colors.RESET}")
+    for dataset, engine, baseline_median, current_median, ratio, p_value, slowdown, same_machine in rows:
+        line = (f"{dataset} {engine}: {baseline_median:.6f} s -> {current_median:.6f} s "
+                f"({ratio:.2f}x, p={p_value:.3g})")
+        if not same_machine:
+            line += " [different machine]"
+        print(f"{Colors.RED}{line} SLOWER{Colors.RESET}" if slowdown else line)
+    if not rows:
+        print("No dataset and engine in common.")
+    return rows
+
 def main_menu():
     """
     Main menu interface for the Dijkstra's algorithm benchmark tool.
-    
+
     Provides options to:
     - List available datasets
     - Generate new datasets
@@ -69,7 +213,7 @@ def main_menu():
     - Exit the program
     """
     results = []  # Stores benchmark results for the current session
-    
+
     while True:
         print(f"\n{Colors.CYAN}--- Dijkstra's Algorithm Performance Comparison ---{Colors.RESET}")
         print(f"{Colors.YELLOW}1. [L]ist all datasets (graphs){Colors.RESET}")
@@ -77,61 +221,199 @@ def main_menu():
         print(f"{Colors.YELLOW}3. [R]un benchmark on all available datasets{Colors.RESET}")
         print(f"{Colors.YELLOW}4. [V]iew previous results{Colors.RESET}")
         print(f"0. [E]xit")
-        
+
         choice = input("\nEnter your choice: ").strip().lower()
 
         # Handle menu choices
         if choice in ["1", "l"]:
-            datasets = get_available_datasets()
-            for data in datasets:
-                print(f"Graph file: {data[0]}, Size: {data[1]}")
-        
+            list_datasets(get_available_datasets())
+
         elif choice in ["2", "g"]:
             generate_graphs()
-        
+
         elif choice in ["3", "r"]:
             print("\n - Running Dijkstra's algorithm on all available datasets...")
             datasets = get_available_datasets()
             if not datasets:
                 print("No datasets found in the /data folder. Please generate datasets first.")
-            else:
-                for filepath, graph_size, graph_type in datasets:
-                    print(f"\n{Colors.MAGENTA}Running benchmark on {filepath} (Size: {graph_size}, Type: {graph_type})...{Colors.RESET}")
-                    radix, binary, d_heap, fibonacci = run_experiment(filepath, graph_size)
-                    results.append((graph_size, graph_type, radix, binary, d_heap, fibonacci))
-                    print(f"{Colors.GREEN}Done.{Colors.RESET}")
+                continue
 
             # Save results with timestamp
             current_timestamp = datetime.now().strftime("%y%m%d%H%M%S")
-            filename_plot = "plot-" + current_timestamp
-            filename_csv = "results-" + current_timestamp
+            # One fresh process per (dataset, engine, source, repeat), pinned to a CPU where possible;
+            # every engine runs from the same sampled sources
+            new_results, _ = run_benchmark(
+                datasets, csv_path=os.path.join("results", "results-" + current_timestamp + ".csv"),
+                plot_name="plot-" + current_timestamp,
+                sources_csv_path=os.path.join("results", "sources-" + current_timestamp + ".csv"),
+                history_path=DEFAULT_HISTORY,
+                repeats=MENU_REPEATS, sources=sample_sources(datasets, MENU_SOURCES),
+                pin=hasattr(os, "sched_setaffinity"), timeout=RUN_TIMEOUT
+            )
+            results.extend(new_results)
 
-            if results:
-                plot_results(results, filename_plot)
-                save_results_to_csv(results, filename_csv)
-            else:
-                print("\nNo results to save/plot. Please run a benchmark first.")
-        
         elif choice in ["4", "v"]:
             if not results:
                 print("\nNo results to display. Please run a benchmark first.")
             else:
-                print("\nResults:")
-                for result in results:
-                    print(f"{Colors.MAGENTA}Graph Size: {result[0]}{Colors.RESET}")
-                    print(f"Graph Type: {result[1]}")
-                    print(f"RadixHeap: Time={result[2][0]:.6f}s, Memory={result[2][1]}B")
-                    print(f"BinaryHeap: Time={result[3][0]:.6f}s, Memory={result[3][1]}B")
-                    print(f"DHeap: Time={result[4][0]:.6f}s, Memory={result[4][1]}B")
-                    print(f"FibonacciHeap: Time={result[5][0]:.6f}s, Memory={result[5][1]}B")
-                    print()            
-        
+                print_results(results)
+
         elif choice in ["0", "e"]:
             print("\nExiting the program. Goodbye!")
             exit(0)
-        
+
         else:
             print("\nInvalid choice. Please try again.")
 
+def _add_dataset_filters(parser):
+    """Add the dataset selection options shared by the list and bench commands."""
+    parser.add_argument("--glob", help="shell pattern matched against the dataset path or file name")
+    parser.add_argument("--type", action="append", choices=GRAPH_TYPES, dest="types",
+                        help="graph type to include (repeatable)")
+    parser.add_argument("--min-size", type=int, help="smallest number of nodes")
+    parser.add_argument("--max-size", type=int, help="largest number of nodes")
+
+def _selected_datasets(args):
+    """Available datasets matching the filter options."""
+    return filter_datasets(get_available_datasets(), args.glob, args.types, args.min_size, args.max_size)
+
+def build_parser():
+    """Build the argument parser of the command line interface."""
+    parser = argparse.ArgumentParser(
+        description="Compare Dijkstra's algorithm across heap implementations. "
+                    "Run without a command for the interactive menu."
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    generate = commands.add_parser("generate", help="generate datasets into data/")
+    generate.add_argument("specs", nargs="+",
+                          help="graph sizes, optionally suffixed with s/m/d for sparse/middle/dense (e.g. 1000s)")
+
+    listing = commands.add_parser("list", help="list the datasets in data/")
+    _add_dataset_filters(listing)
+
+    bench = commands.add_parser("bench", help="benchmark datasets in isolated processes")
+    _add_dataset_filters(bench)
+    bench.add_argument("--heaps", nargs="+", choices=EXPERIMENT_ENGINES, default=EXPERIMENT_ENGINES,
+                       help="engines to run (default: all)")
+    bench.add_argument("--sources", type=int,
+                       help="number of source nodes sampled per dataset (default: node 0 only)")
+    bench.add_argument("--seed", type=int, default=0, help="seed of the source sampling")
+    bench.add_argument("--repeats", type=int, default=5, help="timed runs per dataset, engine and source")
+    bench.add_argument("--warmup", type=int, default=1, help="untimed runs before each timed run")
+    bench.add_argument("--workers", type=int, help="concurrent worker processes (default: one per CPU)")
+    bench.add_argument("--pin", action="store_true", help="pin each worker to its own CPU")
+    bench.add_argument("--timeout", type=float, default=RUN_TIMEOUT,
+                       help=f"seconds before a run is killed (default: {RUN_TIMEOUT}, 0 for none)")
+    bench.add_argument("--json", help="write results and run statuses to this JSON file")
+    bench.add_argument("--csv", help="write results to this CSV file")
+    bench.add_argument("--sources-csv", help="write per-source times and reached-node counts to this CSV file")
+    bench.add_argument("--plot", help="write plots under results/ with this base name")
+    bench.add_argument("--history", default=DEFAULT_HISTORY,
+                       help=f"SQLite history the runs are appended to (default: {DEFAULT_HISTORY})")
+    bench.add_argument("--no-history", action="store_true", help="do not record the runs")
+    bench.add_argument("--label", help="label of the recorded session (e.g. baseline)")
+    bench.add_argument("--profile", action="store_true",
+                       help="profile one search per dataset and heap instead of timing them")
+    bench.add_argument("--sampler", choices=SAMPLERS, default="signal",
+                       help="collapsed-stack sampler of --profile: SIGPROF sampling, exact "
+                            "sys.setprofile tracing or none (default: signal)")
+    bench.add_argument("--top", type=int, default=10, help="hot functions printed per profile (default: 10)")
+    bench.add_argument("--profile-dir", default=PROFILE_DIR,
+                       help=f"directory of the .pstats and .folded files (default: {PROFILE_DIR})")
+
+    report = commands.add_parser("report", help="print, convert or plot a JSON results file")
+    report.add_argument("json", help="results file written by bench --json")
+    report.add_argument("--csv", help="write the results to this CSV file")
+    report.add_argument("--plot", help="write plots under results/ with this base name")
+    report.add_argument("--fit", action="store_true",
+                        help="fit time against n, n log n and m + n log n per heap and graph type "
+                             "(and overlay the fits on --plot)")
+    report.add_argument("--confidence", type=float, default=0.95,
+                        help="confidence level of the fitted exponents (default: 0.95)")
+
+    compare = commands.add_parser("compare", help="test a recorded session against a baseline for slowdowns")
+    compare.add_argument("--history", default=DEFAULT_HISTORY, help="SQLite history file")
+    compare.add_argument("--current", help="session id, label or commit to check (default: latest)")
+    compare.add_argument("--baseline", help="session id, label or commit to compare with (default: previous)")
+    compare.add_argument("--alpha", type=float, default=0.05, help="significance level (default: 0.05)")
+    compare.add_argument("--min-ratio", type=float, default=1.05,
+                         help="smallest median slowdown ratio to flag (default: 1.05)")
+    compare.add_argument("--list", action="store_true", help="list the recorded sessions instead")
+    return parser
+
+def main(argv=None):
+    """
+    Command line entry point; without a command, start the interactive menu.
+
+    Args:
+        argv: Argument list (default sys.argv[1:]).
+
+    Returns:
+        Process exit status: 0, or 1 if no dataset matched, a run did not
+        complete or compare found a significant slowdown.
+    """
+    args = build_parser().parse_args(argv)
+
+    if args.command is None:
+        main_menu()
+        return 0
+
+    if args.command == "generate":
+        graph_sizes, invalid_input = parse_graph_specs(args.specs)
+        if invalid_input:
+            print("Found invalid input, skipping:", invalid_input)
+        generate_datasets(graph_sizes)
+        return 0
+
+    if args.command == "list":
+        list_datasets(_selected_datasets(args))
+        return 0
+
+    if args.command == "bench":
+        datasets = _selected_datasets(args)
+        if not datasets:
+            print("No datasets match the given filters.")
+            return 1
+        sources = sample_sources(datasets, args.sources, args.seed) if args.sources else None
+        if args.profile:
+            profile_datasets(datasets, args.heaps, sources, args.profile_dir, args.sampler, top=args.top)
+            return 0
+        _, runs = run_benchmark(
+            datasets, csv_path=args.csv, json_path=args.json, plot_name=args.plot,
+            sources_csv_path=args.sources_csv,
+            history_path=None if args.no_history else args.history, label=args.label,
+            repeats=args.repeats, warmup=args.warmup, workers=args.workers, pin=args.pin,
+            timeout=args.timeout or None, engines=args.heaps, sources=sources
+        )
+        return 0 if all(run[4] == OK for run in runs) else 1
+
+    if args.command == "compare":
+        if args.list:
+            with BenchmarkHistory(args.history) as history:
+                for session, created, commit, machine, label, num_runs in history.sessions():
+                    print(f"{session}  {created}  commit {commit}  machine {machine}  "
+                          f"{num_runs} runs{f'  [{label}]' if label else ''}")
+            return 0
+        rows = compare_sessions(args.history, args.current, args.baseline, args.alpha, args.min_ratio)
+        return 1 if rows is None or any(row[6] for row in rows) else 0
+
+    if args.command == "report":
+        results, document = load_results_from_json(args.json)
+        print_results(results)
+        fits = None
+        if args.fit:
+            # Files saved before the edge counts were recorded still name their datasets
+            edge_counts = [item.get("num_edges") or (item["dataset"] and dataset_edge_count(item["dataset"]))
+                           for item in document["results"]]
+            fits = fit_results(results, args.confidence, edge_counts)
+            print_complexity_report(fits, args.confidence)
+        if args.csv is not None:
+            result_dir, filename = os.path.split(args.csv)
+            save_results_to_csv(results, os.path.splitext(filename)[0], result_dir or ".")
+        if args.plot is not None:
+            plot_results(results, args.plot, fits=fits)
+        return 0
+
 if __name__ == "__main__":
-    main_menu()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import heapq
+import math
+from collections import deque
+
+def round_weight(weight, epsilon):
+    """Round a weight up to the next power of (1 + epsilon).
+
+    Args:
+        weight: A non-negative edge weight.
+        epsilon: Relative error allowed (0 keeps the weight unchanged).
+
+    Returns:
+        The rounded weight r, with weight <= r < (1 + epsilon) * weight.
+    """
+    if epsilon <= 0 or weight <= 0:
+        return weight
+    base = 1 + epsilon
+    exponent = math.ceil(math.log(weight, base))
+    # Correct for floating-point error in the logarithm
+    while base ** exponent < weight:
+        exponent += 1
+    while base ** (exponent - 1) >= weight:
+        exponent -= 1
+    return base ** exponent
+
+def approximate_shortest_path(graph, source, epsilon=0.1, counters=None):
+    """(1 + epsilon)-approximate single source shortest paths.
+
+    Edge weights are rounded up to powers of (1 + epsilon), so every path
+    gets at most (1 + epsilon) times longer, and exact shortest paths are
+    then computed on the rounded weights. Few distinct weights remain, so
+    instead of a heap over the nodes the search keeps one FIFO queue per
+    rounded weight: nodes are settled in increasing distance, so every
+    queue stays sorted and only the queue heads need comparing.
+
+    With epsilon=0 the weights are kept as they are and the result is exact
+    (fast as long as the graph has few distinct weights, e.g. small
+    integers).
+
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of
+              (neighbor, weight) tuples.
+        source: The source node.
+        epsilon: Relative error allowed.
+        counters: Optional Counter; 'queues' is increased by the number of
+                 FIFO queues used (one per distinct rounded weight).
+
+    Returns:
+        Dictionary of distances d with exact <= d <= (1 + epsilon) * exact
+        (inf for unreachable nodes).
+    """
+    INF = float('inf')
+    distances = {node: INF for node in graph}
+    distances[source] = 0
+    settled = set()
+
+    # The source starts in the queue of zero-weight edges
+    weight_classes = {0: (0, 0)}  # weight -> (queue index, rounded weight)
+    queue_indices = {0: 0}  # rounded weight -> queue index
+    queues = [deque([(0, source)])]
+    heads = [(0, 0)]  # (distance at the head, queue index) for non-empty queues
+
+    while heads:
+        current_distance, index = heapq.heappop(heads)
+        queue = queues[index]
+        _, current_node = queue.popleft()
+        if queue:
+            heapq.heappush(heads, (queue[0][0], index))
+
+        # Skip entries for nodes reached again after they were settled
+        if current_node in settled:
+            continue
+        settled.add(current_node)
+
+        for neighbor, weight in graph.get(current_node, []):
+            weight_class = weight_classes.get(weight)
+            if weight_class is None:
+                # Weights rounding to the same power of (1 + epsilon) share a queue
+                rounded = round_weight(weight, epsilon)
+                if rounded not in queue_indices:
+                    queue_indices[rounded] = len(queues)
+                    queues.append(deque())
+                weight_class = weight_classes[weight] = (queue_indices[rounded], rounded)
+            index, rounded = weight_class
+            distance = current_distance + rounded
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                queue = queues[index]
+                if not queue:
+                    heapq.heappush(heads, (distance, index))
+                queue.append((distance, neighbor))
+
+    if counters is not None:
+        counters['queues'] += len(queues)
+    return distances
@@ -0,0 +1,76 @@
+import multiprocessing as mp
+from src.dijkstra import dijkstra_shortest_path
+from src.load_graph import HEAP_TYPES
+
+# Per-worker state, filled in by _init_worker once per process
+_worker_state = {}
+
+def _pool_context():
+    """Prefer fork so workers inherit the graph copy-on-write instead of unpickling it."""
+    if "fork" in mp.get_all_start_methods():
+        return mp.get_context("fork")
+    return mp.get_context()
+
+def _init_worker(graph, heap_type, compact=False):
+    """Pool initializer: keep the graph and options in the worker process."""
+    _worker_state["graph"] = graph
+    _worker_state["heap_class"] = HEAP_TYPES[heap_type]
+    _worker_state["compact"] = compact
+
+def _run_source(source):
+    """Pool task: run one single source search on the worker's graph."""
+    heap = _worker_state["heap_class"]()
+    return source, dijkstra_shortest_path(
+        _worker_state["graph"], source, heap, compact=_worker_state["compact"]
+    )
+
+def batch_shortest_paths(graph, sources, heap_type="BinaryHeap", processes=None, chunksize=1, compact=False):
+    """Run Dijkstra from many sources, optionally over a process pool.
+
+    The graph is handed to each worker once, at pool start-up (with fork it
+    is inherited, not pickled); tasks only carry the source node. Results
+    are streamed back in the order of sources.
+
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of
+              (neighbor, weight) tuples (or a CSRGraph).
+        sources: Iterable of source nodes.
+        heap_type: Name of the heap to use, a key of HEAP_TYPES.
+        processes: Number of worker processes; None uses all cores and 1
+                  runs in the calling process.
+        chunksize: Number of sources sent to a worker per task.
+        compact: If True, each result is a (distances, predecessors) pair of
+                arrays indexed by dense node id (see dijkstra_shortest_path),
+                which are far smaller to keep, pickle and write with
+                dump_distances than a dictionary per source.
+
+    Yields:
+        Tuples of (source, distances) in the order of sources.
+    """
+    if heap_type not in HEAP_TYPES:
+        raise ValueError(f"Unknown heap type: {heap_type}")
+
+    if processes == 1:
+        heap_class = HEAP_TYPES[heap_type]
+        for source in sources:
+            yield source, dijkstra_shortest_path(graph, source, heap_class(), compact=compact)
+        return
+
+    ctx = _pool_context()
+    with ctx.Pool(processes, initializer=_init_worker, initargs=(graph, heap_type, compact)) as pool:
+        for result in pool.imap(_run_source, sources, chunksize=chunksize):
+            yield result
+
+def all_pairs_shortest_paths(graph, heap_type="BinaryHeap", processes=None, chunksize=1):
+    """Compute shortest distances between every pair of nodes.
+
+    Args:
+        graph: Adjacency list (or CSRGraph).
+        heap_type: Name of the heap to use, a key of HEAP_TYPES.
+        processes: Number of worker processes (see batch_shortest_paths).
+        chunksize: Number of sources sent to a worker per task.
+
+    Returns:
+        Dictionary mapping each source to its distances dictionary.
+    """
+    return dict(batch_shortest_paths(graph, list(graph), heap_type, processes, chunksize))
@@ -0,0 +1,466 @@
+import os, random, time
+import numpy as np
+import multiprocessing as mp
+import tracemalloc
+from src.helper import Colors, get_available_datasets, get_process_memory, measure_time, summarize_times
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.load_graph import load_graph, HEAP_TYPES
+from src.csr_graph import CSRGraph
+from src.delta_stepping import delta_stepping_shortest_path, choose_delta
+from src.dense_dijkstra import build_weight_matrix, dense_dijkstra_shortest_path
+from src.generate_data import generate_weighted_graph
+from src.batch import batch_shortest_paths
+from src.shared_graph import SharedGraph
+from src.workspace import DijkstraWorkspace
+from src.dynamic_sssp import DynamicSSSP
+from src.many_to_many import distance_matrix
+from src.k_shortest_paths import k_shortest_paths
+from src.approximate_sssp import approximate_shortest_path
+from src.heap_trace import HeapTrace, record_dijkstra_trace, replay
+
+def _timed(func, *args, **kwargs):
+    """Call func and return (result, elapsed seconds)."""
+    start_time = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start_time
+
+def _select_datasets(graph_type=None, min_size=0):
+    """Return available datasets filtered by graph type and minimum size."""
+    return [
+        (filepath, size, kind) for filepath, size, kind in get_available_datasets()
+        if (graph_type is None or kind == graph_type) and size >= min_size
+    ]
+
+def benchmark_delta_stepping(graph_type="sparse", min_size=0, source_node=0, processes=None):
+    """
+    Compare delta-stepping against the heap-based Dijkstra engines.
+
+    Args:
+        graph_type: Only datasets of this type are used (None for all).
+        min_size: Skip datasets with fewer nodes than this.
+        source_node: Source node for every search.
+        processes: Worker processes for delta-stepping (None runs in-process).
+
+    Returns:
+        List of (filepath, graph_size, {engine_name: seconds}) tuples.
+    """
+    results = []
+    for filepath, graph_size, kind in _select_datasets(graph_type, min_size):
+        print(f"\n{Colors.MAGENTA}Delta-stepping benchmark on {filepath} (Size: {graph_size}, Type: {kind})...{Colors.RESET}")
+        graph, _ = load_graph(filepath)
+        timings = {}
+
+        expected = None
+        for heap_type, heap_class in HEAP_TYPES.items():
+            expected, timings[heap_type] = _timed(dijkstra_shortest_path, graph, source_node, heap_class())
+
+        csr, timings["CSR build"] = _timed(CSRGraph.from_adjacency, graph)
+        delta = choose_delta(csr)
+        distances, timings["DeltaStepping"] = _timed(
+            delta_stepping_shortest_path, csr, source_node, delta=delta, processes=processes
+        )
+        if distances != expected:
+            print(f"{Colors.RED}Delta-stepping distances differ from Dijkstra!{Colors.RESET}")
+
+        for name, seconds in timings.items():
+            print(f"{name}: {seconds:.6f} seconds")
+        print(f"(delta = {delta:g})")
+        results.append((filepath, graph_size, timings))
+    return results
+
+def benchmark_dense_crossover(num_nodes=1000, densities=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0), source_node=0):
+    """
+    Sweep edge density on a fixed node count to locate where the heapless
+    dense engine overtakes the heap-based engines.
+
+    Args:
+        num_nodes: Number of nodes of every generated graph.
+        densities: Fractions of the n(n-1)/2 possible edges to generate.
+        source_node: Source node for every search.
+
+    Returns:
+        List of (density, {engine_name: seconds}) tuples.
+    """
+    results = []
+    max_edges = num_nodes * (num_nodes - 1) // 2
+    for density in densities:
+        data = generate_weighted_graph(num_nodes, max(num_nodes, int(max_edges * density)))
+        graph = build_graph_from_edges(data["nodes"], data["edges"])
+        print(f"\n{Colors.MAGENTA}Density {density:.2f} ({len(data['edges'])} edges, {num_nodes} nodes)...{Colors.RESET}")
+
+        timings = {}
+        for heap_type, heap_class in HEAP_TYPES.items():
+            _, timings[heap_type] = _timed(dijkstra_shortest_path, graph, source_node, heap_class())
+        weight_matrix = build_weight_matrix(graph)
+        _, timings["DenseDijkstra"] = _timed(dense_dijkstra_shortest_path, graph, source_node, weight_matrix)
+
+        for name, seconds in timings.items():
+            print(f"{name}: {seconds:.6f} seconds")
+        results.append((density, timings))
+    return results
+
+def benchmark_batch(data_file, num_sources=1000, heap_type="BinaryHeap", process_counts=None, seed=0):
+    """
+    Measure multi-source throughput (sources/second) for several pool sizes.
+
+    Args:
+        data_file: Path to graph data file.
+        num_sources: Number of sources, sampled with the given seed.
+        heap_type: Name of the heap to use, a key of HEAP_TYPES.
+        process_counts: Pool sizes to try; defaults to 1, 2, 4, ... up to the core count.
+        seed: Seed for source sampling.
+
+    Returns:
+        List of (processes, sources_per_second) tuples.
+    """
+    graph, nodes = load_graph(data_file)
+    sources = random.Random(seed).choices(nodes, k=num_sources)
+    if process_counts is None:
+        cores = os.cpu_count() or 1
+        process_counts = [1]
+        while process_counts[-1] * 2 <= cores:
+            process_counts.append(process_counts[-1] * 2)
+
+    print(f"\n{Colors.MAGENTA}Batch benchmark on {data_file}: {num_sources} sources, {heap_type}{Colors.RESET}")
+    results = []
+    for processes in process_counts:
+        chunksize = max(1, num_sources // (processes * 16))
+        start_time = time.perf_counter()
+        for _ in batch_shortest_paths(graph, sources, heap_type, processes, chunksize):
+            pass
+        elapsed = time.perf_counter() - start_time
+        throughput = num_sources / elapsed
+        print(f"{processes} process(es): {throughput:.1f} sources/second")
+        results.append((processes, throughput))
+    return results
+
+def _memory_probe_worker(graph, shared_name, source_node, barrier, queue):
+    """Worker for benchmark_shared_memory: search once, then report memory.
+
+    Exactly one of graph (received pickled) and shared_name (attached) is set.
+    """
+    shared = None
+    if shared_name is not None:
+        shared = SharedGraph.attach(shared_name)
+        graph = shared.graph
+    dijkstra_shortest_path(graph, source_node, HEAP_TYPES["BinaryHeap"]())
+    barrier.wait()  # Measure while every worker is alive so PSS splits shared pages
+    queue.put(get_process_memory())
+    barrier.wait()
+    if shared is not None:
+        graph = None
+        shared.close()
+
+def benchmark_shared_memory(data_file, workers=8, source_node=0):
+    """
+    Compare worker memory for a pickled graph copy versus a shared-memory graph.
+
+    Each of the workers runs one search, then reports its RSS and PSS
+    (/proc/self/smaps_rollup). Workers are started with spawn so that the
+    pickled case really gets one private copy per worker.
+
+    Args:
+        data_file: Path to graph data file.
+        workers: Number of worker processes.
+        source_node: Source node for the search in each worker.
+
+    Returns:
+        Dictionary mapping mode ('pickled', 'shared') to the summed
+        {'rss': bytes, 'pss': bytes} over all workers.
+    """
+    graph, _ = load_graph(data_file)
+    ctx = mp.get_context("spawn")
+    totals = {}
+
+    with SharedGraph.publish(graph) as shared:
+        for mode in ("pickled", "shared"):
+            barrier = ctx.Barrier(workers)
+            queue = ctx.Queue()
+            args = (graph, None) if mode == "pickled" else (None, shared.name)
+            procs = [
+                ctx.Process(target=_memory_probe_worker, args=args + (source_node, barrier, queue))
+                for _ in range(workers)
+            ]
+            for proc in procs:
+                proc.start()
+            reports = [queue.get() for _ in procs]
+            for proc in procs:
+                proc.join()
+
+            totals[mode] = {
+                key: sum(report[key] or 0 for report in reports) for key in ("rss", "pss")
+            }
+            print(f"{mode}: total RSS {totals[mode]['rss'] / 2**20:.1f} MiB, "
+                  f"total PSS {totals[mode]['pss'] / 2**20:.1f} MiB across {workers} workers")
+    return totals
+
+def benchmark_workspace(data_file, num_queries=100000, max_settled=10, heap_type="BinaryHeap", seed=0, full_sample=5):
+    """
+    Compare many small queries through a reused DijkstraWorkspace with
+    fresh dijkstra_shortest_path calls.
+
+    Args:
+        data_file: Path to graph data file.
+        num_queries: Number of queries, from sources sampled with the given seed.
+        max_settled: Every query stops after settling this many nodes.
+        heap_type: Name of the heap to use, a key of HEAP_TYPES.
+        seed: Seed for source sampling.
+        full_sample: Number of queries actually run for the full-search
+                    baseline; its time is extrapolated to num_queries.
+
+    Returns:
+        Dictionary mapping each mode to (seconds, peak traced bytes over up
+        to 100 queries).
+    """
+    graph, nodes = load_graph(data_file)
+    sources = random.Random(seed).choices(nodes, k=num_queries)
+    heap_class = HEAP_TYPES[heap_type]
+    workspace = DijkstraWorkspace(graph, heap_class())
+
+    modes = {
+        "full (fresh dict + heap)": lambda s: dijkstra_shortest_path(graph, s, heap_class()),
+        "cutoff (fresh heap)": lambda s: dijkstra_shortest_path(graph, s, heap_class(), max_settled=max_settled),
+        "workspace": lambda s: workspace.query(s, max_settled=max_settled),
+    }
+    print(f"\n{Colors.MAGENTA}Workspace benchmark on {data_file}: {num_queries} queries, k={max_settled}, {heap_type}{Colors.RESET}")
+    results = {}
+    for mode, query in modes.items():
+        # The full search is far slower; time a slice and scale it up
+        count = num_queries if mode != "full (fresh dict + heap)" else min(num_queries, full_sample)
+        start_time = time.perf_counter()
+        for source in sources[:count]:
+            query(source)
+        elapsed = (time.perf_counter() - start_time) * num_queries / count
+
+        tracemalloc.start()
+        for source in sources[:min(count, 100)]:
+            query(source)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f"{mode}: {elapsed:.3f} seconds for {num_queries} queries"
+              f"{' (extrapolated)' if count < num_queries else ''}, peak {peak} B")
+        results[mode] = (elapsed, peak)
+    return results
+
+def benchmark_dynamic_sssp(data_file, num_updates=1000, heap_type="BinaryHeap", source_node=0,
+                           check_every=50, seed=0):
+    """
+    Replay a stream of random edge updates and compare incremental repair
+    with recomputing from scratch.
+
+    The stream mixes weight increases, decreases, deletions and insertions.
+    Every check_every updates a full dijkstra_shortest_path run is timed
+    (and its distances compared with the repaired ones); the full
+    recomputation cost of the whole stream is extrapolated from those runs.
+
+    Args:
+        data_file: Path to graph data file.
+        num_updates: Number of updates in the stream.
+        heap_type: Name of the heap to use, a key of HEAP_TYPES.
+        source_node: Source of the maintained tree.
+        check_every: Interval between full recomputations.
+        seed: Seed for the update stream.
+
+    Returns:
+        Tuple of (total repair seconds, extrapolated total recompute seconds).
+    """
+    rng = random.Random(seed)
+    graph, nodes = load_graph(data_file)
+    heap_class = HEAP_TYPES[heap_type]
+    dynamic = DynamicSSSP(graph, source_node, heap_class)
+    edges = [(u, v) for u in graph for v, _ in graph[u] if u < v]
+
+    print(f"\n{Colors.MAGENTA}Dynamic SSSP benchmark on {data_file}: {num_updates} updates, {heap_type}{Colors.RESET}")
+    repair_time, full_time, full_runs = 0.0, 0.0, 0
+    for i in range(1, num_updates + 1):
+        kind = rng.random()
+        start_time = time.perf_counter()
+        if kind < 0.1 and edges:
+            u, v = edges.pop(rng.randrange(len(edges)))
+            dynamic.delete_edge(u, v)
+        elif kind < 0.2:
+            u, v = rng.sample(nodes, 2)
+            dynamic.insert_edge(u, v, rng.randint(1, 10))
+            edges.append((u, v))
+        elif edges:
+            u, v = rng.choice(edges)
+            dynamic.update_edge(u, v, rng.randint(1, 10))
+        repair_time += time.perf_counter() - start_time
+
+        if i % check_every == 0:
+            expected, elapsed = _timed(dijkstra_shortest_path, graph, source_node, heap_class())
+            full_time += elapsed
+            full_runs += 1
+            if expected != dynamic.dist:
+                print(f"{Colors.RED}Repaired distances differ from a full run after {i} updates!{Colors.RESET}")
+
+    full_total = full_time / max(1, full_runs) * num_updates
+    print(f"Incremental repair: {repair_time:.6f} seconds total, {repair_time / num_updates * 1e6:.1f} us/update")
+    print(f"Full recomputation: {full_total:.6f} seconds total (extrapolated from {full_runs} runs)")
+    return repair_time, full_total
+
+def benchmark_many_to_many(data_file, num_origins=100, num_targets=100, heap_type="BinaryHeap",
+                           ball_sizes=(1, 64, 1024), seed=0):
+    """
+    Compare distance_matrix with one full dijkstra_shortest_path per origin.
+
+    Args:
+        data_file: Path to graph data file.
+        num_origins: Number of origins, sampled with the given seed.
+        num_targets: Number of targets, sampled with the given seed.
+        heap_type: Name of the heap to use, a key of HEAP_TYPES.
+        ball_sizes: Backward ball sizes to try (1 disables the backward pass).
+        seed: Seed for origin and target sampling.
+
+    Returns:
+        Dictionary mapping each mode to seconds.
+    """
+    rng = random.Random(seed)
+    graph, nodes = load_graph(data_file)
+    origins = rng.sample(nodes, num_origins)
+    targets = rng.sample(nodes, num_targets)
+    heap_class = HEAP_TYPES[heap_type]
+    out = np.empty((num_origins, num_targets))
+
+    print(f"\n{Colors.MAGENTA}Many-to-many benchmark on {data_file}: "
+          f"{num_origins} x {num_targets}, {heap_type}{Colors.RESET}")
+    start_time = time.perf_counter()
+    for row, origin in enumerate(origins):
+        distances = dijkstra_shortest_path(graph, origin, heap_class())
+        out[row] = [distances[target] for target in targets]
+    naive_time = time.perf_counter() - start_time
+    expected = out.copy()
+    print(f"Naive full Dijkstra per origin: {naive_time:.6f} seconds")
+
+    results = {"naive": naive_time}
+    for ball_size in ball_sizes:
+        _, elapsed = _timed(distance_matrix, graph, origins, targets, heap_type, out=out, ball_size=ball_size)
+        if not np.array_equal(out, expected):
+            print(f"{Colors.RED}Matrix with ball_size={ball_size} differs from the naive one!{Colors.RESET}")
+        print(f"distance_matrix (ball_size={ball_size}): {elapsed:.6f} seconds "
+              f"({naive_time / elapsed:.2f}x)")
+        results[f"ball_size={ball_size}"] = elapsed
+    return results
+
+def benchmark_k_shortest_paths(graph_type=None, min_size=0, k=10, num_queries=5, heap_type="BinaryHeap",
+                               processes=(1, None), seed=0):
+    """
+    Time k-shortest-path queries between random node pairs on every dataset.
+
+    Args:
+        graph_type: Only datasets of this type are used (None for all).
+        min_size: Skip datasets with fewer nodes than this.
+        k: Number of paths per query.
+        num_queries: Number of (source, target) pairs, sampled with the given seed.
+        heap_type: Name of the heap to use, a key of HEAP_TYPES.
+        processes: Spur search process counts to compare (1 is sequential,
+                  None uses all cores).
+        seed: Seed for pair sampling.
+
+    Returns:
+        List of (filepath, graph_size, {process_count: seconds per query}) tuples.
+    """
+    results = []
+    for filepath, graph_size, kind in _select_datasets(graph_type, min_size):
+        print(f"\n{Colors.MAGENTA}k-shortest-paths benchmark on {filepath} "
+              f"(Size: {graph_size}, Type: {kind}), k={k}...{Colors.RESET}")
+        graph, nodes = load_graph(filepath)
+        rng = random.Random(seed)
+        pairs = [tuple(rng.sample(nodes, 2)) for _ in range(num_queries)]
+
+        timings = {}
+        for count in processes:
+            start_time = time.perf_counter()
+            found = [len(k_shortest_paths(graph, s, t, k, heap_type, processes=count)) for s, t in pairs]
+            timings[count] = (time.perf_counter() - start_time) / num_queries
+            label = "all cores" if count is None else f"{count} process{'es' if count != 1 else ''}"
+            print(f"{label}: {timings[count]:.6f} seconds/query ({sum(found)} paths found)")
+        results.append((filepath, graph_size, timings))
+    return results
+
+def benchmark_approximate(graph_types=("random", "dense"), min_size=0, epsilons=(0, 0.05, 0.1, 0.5), source_node=0):
+    """
+    Report speedup versus error of approximate_shortest_path against the exact heaps.
+
+    Args:
+        graph_types: Dataset types to use.
+        min_size: Skip datasets with fewer nodes than this.
+        epsilons: Error bounds to try (0 is the exact mode of the same queue).
+        source_node: Source node for every search.
+
+    Returns:
+        List of (filepath, graph_size, timings, errors) tuples: timings maps
+        each heap type and "eps=<epsilon>" to seconds, errors maps
+        "eps=<epsilon>" to (max, mean) relative error over reached nodes.
+    """
+    results = []
+    for graph_type in graph_types:
+        for filepath, graph_size, kind in _select_datasets(graph_type, min_size):
+            print(f"\n{Colors.MAGENTA}Approximate SSSP benchmark on {filepath} (Size: {graph_size}, Type: {kind})...{Colors.RESET}")
+            graph, _ = load_graph(filepath)
+            timings, errors = {}, {}
+
+            exact = None
+            for heap_type, heap_class in HEAP_TYPES.items():
+                exact, timings[heap_type] = _timed(dijkstra_shortest_path, graph, source_node, heap_class())
+                print(f"{heap_type}: {timings[heap_type]:.6f} seconds")
+            fastest = min(timings.values())
+            reached = [(node, d) for node, d in exact.items() if 0 < d < float('inf')]
+
+            for epsilon in epsilons:
+                name = f"eps={epsilon:g}"
+                distances, timings[name] = _timed(approximate_shortest_path, graph, source_node, epsilon)
+                relative = [distances[node] / d - 1 for node, d in reached]
+                errors[name] = (max(relative, default=0.0), sum(relative) / max(1, len(relative)))
+                print(f"{name}: {timings[name]:.6f} seconds ({fastest / timings[name]:.2f}x vs fastest heap), "
+                      f"max error {errors[name][0]:.4%}, mean error {errors[name][1]:.4%}")
+            results.append((filepath, graph_size, timings, errors))
+    return results
+
+def benchmark_heap_replay(data_file, source_node=0, record_with="BinaryHeap", trace_file=None, warmup=1, repeats=5):
+    """
+    Time every heap on the heap operations of one Dijkstra run, without the graph search.
+
+    The trace is recorded once (or loaded from trace_file) and replayed
+    into a fresh heap of each type, so the times are pure heap throughput.
+    Throughput counts only the operations a heap applied: a trace with
+    duplicate pushes (e.g. recorded with FibonacciHeap) turns into
+    decrease-keys and skipped pops on the heaps that merge them.
+
+    Args:
+        data_file: Path to graph data file.
+        source_node: Source node of the recorded search.
+        record_with: Heap type whose Dijkstra run is recorded, a key of HEAP_TYPES.
+        trace_file: Trace to load if it exists, otherwise where to save the
+                   recorded one (None to neither load nor save).
+        warmup: Number of untimed replays per heap.
+        repeats: Number of timed replays per heap.
+
+    Returns:
+        Dictionary mapping each heap type to (median seconds, million applied
+        ops/s, skipped ops).
+    """
+    if trace_file is not None and os.path.exists(trace_file):
+        trace = HeapTrace.load(trace_file)
+        print(f"\n{Colors.MAGENTA}Heap replay benchmark: trace {trace_file}{Colors.RESET}")
+    else:
+        graph, _ = load_graph(data_file)
+        _, trace = record_dijkstra_trace(graph, source_node, HEAP_TYPES[record_with]())
+        if trace_file is not None:
+            trace.save(trace_file)
+        print(f"\n{Colors.MAGENTA}Heap replay benchmark on {data_file}: trace of {record_with}{Colors.RESET}")
+    counts = trace.counts()
+    print(f"{len(trace)} operations: {counts['pushes']} pushes, {counts['pops']} pops, "
+          f"{counts['decrease_keys']} decrease-keys")
+
+    results = {}
+    for heap_type, heap_class in HEAP_TYPES.items():
+        skipped = []
+        samples = measure_time(lambda heap: skipped.append(replay(trace, heap)),
+                               setup=heap_class, warmup=warmup, repeats=repeats)
+        median = summarize_times(samples)[0]
+        results[heap_type] = (median, (len(trace) - skipped[-1]) / median / 1e6, skipped[-1])
+        note = f", {skipped[-1]} ops skipped" if skipped[-1] else ""
+        print(f"{heap_type}: {median:.6f} seconds ({results[heap_type][1]:.2f} M ops/s{note})")
+    return results
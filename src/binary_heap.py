@@ -18,6 +18,12 @@ class BinaryHeap:
         """Check if the heap is empty."""
         return self.size == 0
 
+    def clear(self):
+        """Remove all elements, keeping the allocated containers for reuse."""
+        self.heap.clear()
+        self.position_map.clear()
+        self.size = 0
+
     def push(self, priority, value):
         """
         Insert a value with given priority into the heap.
@@ -89,7 +95,7 @@ class BinaryHeap:
         return value in self.position_map
 
     def _bubble_up(self, index):
-        """Move an element up the heap to maintain heap property."""
+        """Move an element up the heap to maintain heap property; return its final index."""
         while index > 0:
             parent = (index - 1) // 2
             if self.heap[index][0] < self.heap[parent][0]:
@@ -97,9 +103,10 @@ class BinaryHeap:
                 index = parent
             else:
                 break
+        return index
 
     def _bubble_down(self, index):
-        """Move an element down the heap to maintain heap property."""
+        """Move an element down the heap to maintain heap property; return its final index."""
         while True:
             left = 2 * index + 1
             right = 2 * index + 2
@@ -114,7 +121,7 @@ class BinaryHeap:
                 self._swap(index, smallest)
                 index = smallest
             else:
-                break
+                return index
 
     def _swap(self, i, j):
         """Swap two elements in the heap and update their positions."""
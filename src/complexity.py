@@ -0,0 +1,116 @@
+import math
+from collections import defaultdict
+
+import numpy as np
+from scipy.stats import t as student_t
+
+from src.stats import RESULT_ENGINES
+
+# Cost models the measured times are regressed against, as functions of the
+# node count n and edge count m. A fitted exponent of 1 means the times grow
+# like the model.
+MODELS = {
+    "n": lambda n, m: n,
+    "n log n": lambda n, m: n * math.log2(n),
+    "m + n log n": lambda n, m: m + n * math.log2(n),
+}
+
+# Models that depend on the edge count, fitted only where it is known
+EDGE_MODELS = {"m + n log n"}
+
+def fit_power_law(x, y, confidence=0.95):
+    """
+    Fit y = c * x^b by least squares on log y = log c + b log x.
+
+    Args:
+        x: Positive model values (e.g. node counts).
+        y: Positive measured times.
+        confidence: Confidence level of the exponent interval.
+
+    Returns:
+        Dictionary with the exponent "b", its confidence interval
+        ("b_low", "b_high"; NaN with fewer than three points), the
+        coefficient "c", the coefficient of determination "r2" (in log
+        space) and the number of "points".
+    """
+    log_x, log_y = np.log(np.asarray(x, dtype=float)), np.log(np.asarray(y, dtype=float))
+    points = len(log_x)
+    if points < 2 or np.ptp(log_x) == 0:
+        raise ValueError("at least two distinct sizes are needed for a fit")
+    b, log_c = np.polyfit(log_x, log_y, 1)
+    residuals = log_y - (log_c + b * log_x)
+    total = np.sum((log_y - log_y.mean()) ** 2)
+    r2 = 1.0 - np.sum(residuals ** 2) / total if total > 0 else 1.0
+    half_width = math.nan
+    if points > 2:
+        stderr = math.sqrt(np.sum(residuals ** 2) / (points - 2) / np.sum((log_x - log_x.mean()) ** 2))
+        half_width = student_t.ppf((1 + confidence) / 2, points - 2) * stderr
+    return {"b": float(b), "b_low": float(b - half_width), "b_high": float(b + half_width),
+            "c": float(math.exp(log_c)), "r2": float(r2), "points": points}
+
+def fit_results(results, confidence=0.95, edge_counts=None):
+    """
+    Fit every engine's time against the cost models, per graph type.
+
+    Times (and edge counts) of datasets with the same size and type are
+    averaged first; engines without a time (NaN) at a size are left out of
+    that size. The EDGE_MODELS are only fitted when the edge count of every
+    size is known.
+
+    Args:
+        results: List of result tuples (same format as save_results_to_csv).
+        confidence: Confidence level of the exponent intervals.
+        edge_counts: Optional list with the edge count of each result's
+                    dataset (None where unknown), e.g. from
+                    load_graph.dataset_edge_count.
+
+    Returns:
+        Dictionary mapping (graph_type, engine) to a dictionary mapping each
+        fitted MODELS name to its fit_power_law result. Pairs with fewer
+        than two distinct sizes are omitted.
+    """
+    times = defaultdict(lambda: defaultdict(list))
+    edges = defaultdict(lambda: defaultdict(list))
+    for i, item in enumerate(results):
+        graph_size, graph_type = item[0], item[1]
+        if edge_counts is not None and edge_counts[i] is not None:
+            edges[graph_type][graph_size].append(edge_counts[i])
+        for engine, entry in zip(RESULT_ENGINES, item[2:]):
+            if not math.isnan(entry[0]) and entry[0] > 0 and graph_size > 1:
+                times[(graph_type, engine)][graph_size].append(entry[0])
+
+    fits = {}
+    for (graph_type, engine), by_size in times.items():
+        if len(by_size) < 2:
+            continue
+        sizes = sorted(by_size)
+        averages = [sum(by_size[n]) / len(by_size[n]) for n in sizes]
+        counts = edges[graph_type]
+        m = [sum(counts[n]) / len(counts[n]) if counts[n] else None for n in sizes]
+        fits[(graph_type, engine)] = {
+            name: fit_power_law([model(n, m_n) for n, m_n in zip(sizes, m)], averages, confidence)
+            for name, model in MODELS.items()
+            if name not in EDGE_MODELS or None not in m
+        }
+    return fits
+
+def print_complexity_report(fits, confidence=0.95):
+    """
+    Print the fitted exponents of fit_results.
+
+    The "n" column is the empirical exponent of time vs node count; the
+    other columns are exponents against the cost models, where 1 means the
+    engine scales like the model and the interval tells whether the
+    difference is significant.
+    """
+    if not fits:
+        print("Not enough sizes per graph type to fit a complexity model.")
+        return
+    print(f"\nEmpirical complexity: time ~ model^b ({confidence:.0%} confidence intervals)")
+    for graph_type, engine in sorted(fits, key=lambda key: (key[0], RESULT_ENGINES.index(key[1]))):
+        columns = []
+        for name, fit in fits[(graph_type, engine)].items():
+            interval = "" if math.isnan(fit["b_low"]) else f" [{fit['b_low']:.2f}, {fit['b_high']:.2f}]"
+            columns.append(f"{name}: b={fit['b']:.2f}{interval}")
+        points = next(iter(fits[(graph_type, engine)].values()))["points"]
+        print(f"{graph_type:>7} {engine:<14} ({points} sizes)  " + "  ".join(columns))
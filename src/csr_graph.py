@@ -0,0 +1,134 @@
+import operator
+from collections.abc import Mapping
+
+import numpy as np
+
+from src.dijkstra import has_dense_ids
+
+class _RangeIndex:
+    """Node-to-index lookup for graphs whose nodes are exactly 0..n-1.
+
+    Acts like the node_index dictionary without storing one entry per node.
+    """
+
+    def __init__(self, n):
+        self.n = n
+
+    def __getitem__(self, node):
+        try:
+            index = operator.index(node)  # Also accepts NumPy integers
+        except TypeError:
+            raise KeyError(node) from None
+        if 0 <= index < self.n:
+            return index
+        raise KeyError(node)
+
+    def __contains__(self, node):
+        try:
+            self[node]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, node, default=None):
+        return node if node in self else default
+
+class CSRGraph(Mapping):
+    """
+    Compressed sparse row (CSR) view of an adjacency-list graph.
+
+    The neighbours of the node at dense index i are stored in
+    indices[indptr[i]:indptr[i + 1]] with matching weights. The class also
+    behaves like the dict-of-lists graph from build_graph_from_edges, so it
+    can be handed to dijkstra_shortest_path unchanged.
+
+    Attributes:
+        nodes: List of node ids (or a range when nodes are 0..n-1); position
+              in the list is the dense index.
+        node_index: Mapping from node ids to dense indices.
+        indptr: int64 array of length n + 1 with row offsets.
+        indices: int64 array of neighbour dense indices.
+        weights: float64 array of edge weights.
+    """
+
+    def __init__(self, nodes, indptr, indices, weights):
+        """Initialize a CSR graph from already built arrays."""
+        if isinstance(nodes, range) and nodes.start == 0 and nodes.step == 1:
+            self.nodes = nodes
+            self.node_index = _RangeIndex(len(nodes))
+        else:
+            self.nodes = list(nodes)
+            self.node_index = {node: i for i, node in enumerate(self.nodes)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        """
+        Build a CSRGraph from an adjacency list.
+
+        Args:
+            graph: Adjacency list where keys are nodes and values are lists of
+                  (neighbor, weight) tuples.
+
+        Returns:
+            A CSRGraph with the same nodes and edges.
+        """
+        nodes = list(graph)
+        if has_dense_ids(nodes):
+            nodes = range(len(nodes))  # Dense ids already; skip the lookup table
+            node_index = _RangeIndex(len(nodes))
+        else:
+            node_index = {node: i for i, node in enumerate(nodes)}
+
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        for i, node in enumerate(nodes):
+            indptr[i + 1] = indptr[i] + len(graph[node])
+
+        num_edges = int(indptr[-1])
+        indices = np.empty(num_edges, dtype=np.int64)
+        weights = np.empty(num_edges, dtype=np.float64)
+        pos = 0
+        for node in nodes:
+            for neighbor, weight in graph[node]:
+                indices[pos] = node_index[neighbor]
+                weights[pos] = weight
+                pos += 1
+        return cls(nodes, indptr, indices, weights)
+
+    @property
+    def num_nodes(self):
+        """Number of nodes in the graph."""
+        return len(self.nodes)
+
+    @property
+    def num_edges(self):
+        """Number of directed adjacency entries (undirected edges count twice)."""
+        return len(self.indices)
+
+    def degrees(self):
+        """Return an int64 array with the out-degree of every node."""
+        return np.diff(self.indptr)
+
+    def __getitem__(self, node):
+        """Return the (neighbor, weight) list of a node, like the adjacency list."""
+        i = self.node_index[node]
+        start, end = self.indptr[i], self.indptr[i + 1]
+        nodes = self.nodes
+        return [
+            (nodes[j], w)
+            for j, w in zip(self.indices[start:end].tolist(), self.weights[start:end].tolist())
+        ]
+
+    def __iter__(self):
+        """Iterate over node ids in dense index order."""
+        return iter(self.nodes)
+
+    def __len__(self):
+        """Return the number of nodes."""
+        return len(self.nodes)
+
+    def __contains__(self, node):
+        """Check if a node exists in the graph."""
+        return node in self.node_index
@@ -20,6 +20,12 @@ class DHeap:
         """Check if the heap is empty."""
         return self.size == 0
 
+    def clear(self):
+        """Remove all elements, keeping the allocated containers for reuse."""
+        self.heap.clear()
+        self.position_map.clear()
+        self.size = 0
+
     def push(self, priority, value):
         """
         Insert a value with given priority into the heap.
@@ -91,7 +97,7 @@ class DHeap:
         return value in self.position_map
 
     def _bubble_up(self, index):
-        """Move an element up the heap to maintain heap property."""
+        """Move an element up the heap to maintain heap property; return its final index."""
         while index > 0:
             parent = (index - 1) // self.d
             if self.heap[index][0] < self.heap[parent][0]:
@@ -99,9 +105,10 @@ class DHeap:
                 index = parent
             else:
                 break
+        return index
 
     def _bubble_down(self, index):
-        """Move an element down the heap to maintain heap property."""
+        """Move an element down the heap to maintain heap property; return its final index."""
         while True:
             smallest = index
             first_child = self.d * index + 1
@@ -116,7 +123,7 @@ class DHeap:
                 self._swap(index, smallest)
                 index = smallest
             else:
-                break
+                return index
 
     def _swap(self, i, j):
         """Swap two elements in the heap and update their positions."""
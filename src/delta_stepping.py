@@ -0,0 +1,190 @@
+import multiprocessing as mp
+
+import numpy as np
+
+from src.csr_graph import CSRGraph
+
+# Arrays shared with pool workers; set by _init_worker in each (forked) worker
+_worker_arrays = {}
+
+def choose_delta(csr):
+    """Choose a bucket width from the edge weight distribution.
+
+    Uses the Meyer-Sanders rule of thumb delta = max_weight / average_degree,
+    clamped so that a bucket is never narrower than the lightest edge (which
+    would leave every light-edge set empty) nor wider than the heaviest one.
+
+    Args:
+        csr: A CSRGraph.
+
+    Returns:
+        A positive float bucket width.
+    """
+    if csr.num_edges == 0:
+        return 1.0
+    min_weight = float(csr.weights.min())
+    max_weight = float(csr.weights.max())
+    avg_degree = csr.num_edges / max(1, csr.num_nodes)
+    delta = max_weight / max(1.0, avg_degree)
+    delta = min(max(delta, min_weight), max_weight)
+    return delta if delta > 0 else 1.0
+
+def _split_light_heavy(csr, delta):
+    """Split the CSR edges into light (weight <= delta) and heavy sub-graphs.
+
+    Args:
+        csr: A CSRGraph.
+        delta: The bucket width.
+
+    Returns:
+        Tuple ((light_indptr, light_indices, light_weights),
+               (heavy_indptr, heavy_indices, heavy_weights)).
+    """
+    is_light = csr.weights <= delta
+    rows = np.repeat(np.arange(csr.num_nodes), csr.degrees())
+
+    parts = []
+    for mask in (is_light, ~is_light):
+        counts = np.bincount(rows[mask], minlength=csr.num_nodes)
+        indptr = np.zeros(csr.num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        parts.append((indptr, csr.indices[mask], csr.weights[mask]))
+    return parts[0], parts[1]
+
+def _expand(indptr, indices, weights, frontier, frontier_dist):
+    """Compute candidate distances over all out-edges of a frontier.
+
+    Args:
+        indptr, indices, weights: CSR arrays of the edge set to relax.
+        frontier: int64 array of dense node indices.
+        frontier_dist: float64 array with the distance of each frontier node.
+
+    Returns:
+        Tuple (targets, candidates) of equal length arrays.
+    """
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+    # Edge positions: start of each row repeated, plus an offset within the row
+    row_offsets = np.cumsum(counts) - counts
+    edge_idx = np.repeat(starts - row_offsets, counts) + np.arange(total)
+    candidates = np.repeat(frontier_dist, counts) + weights[edge_idx]
+    return indices[edge_idx], candidates
+
+def _init_worker(light, heavy):
+    """Pool initializer: keep the light/heavy CSR arrays in the worker."""
+    _worker_arrays["light"] = light
+    _worker_arrays["heavy"] = heavy
+
+def _expand_in_worker(args):
+    """Pool task: expand one chunk of a frontier over light or heavy edges."""
+    kind, frontier, frontier_dist = args
+    indptr, indices, weights = _worker_arrays[kind]
+    return _expand(indptr, indices, weights, frontier, frontier_dist)
+
+class _Relaxer:
+    """Relax a frontier either in-process or split across a process pool."""
+
+    def __init__(self, light, heavy, processes, parallel_threshold):
+        self.edges = {"light": light, "heavy": heavy}
+        self.processes = processes
+        self.parallel_threshold = parallel_threshold
+        self.pool = None
+        if processes and processes > 1:
+            # fork shares the arrays with the workers without pickling them
+            ctx = mp.get_context("fork")
+            self.pool = ctx.Pool(processes, initializer=_init_worker, initargs=(light, heavy))
+
+    def expand(self, kind, frontier, frontier_dist):
+        indptr, indices, weights = self.edges[kind]
+        if self.pool is None or len(frontier) < self.parallel_threshold:
+            return _expand(indptr, indices, weights, frontier, frontier_dist)
+        chunks = [
+            (kind, f, d)
+            for f, d in zip(np.array_split(frontier, self.processes),
+                            np.array_split(frontier_dist, self.processes))
+        ]
+        parts = self.pool.map(_expand_in_worker, chunks)
+        return (np.concatenate([p[0] for p in parts]),
+                np.concatenate([p[1] for p in parts]))
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+
+def _apply(dist, buckets, delta, targets, candidates):
+    """Apply candidate distances and file improved nodes into buckets."""
+    improving = candidates < dist[targets]
+    if not improving.any():
+        return
+    targets = targets[improving]
+    candidates = candidates[improving]
+    np.minimum.at(dist, targets, candidates)
+
+    improved = np.unique(targets)
+    bucket_ids = (dist[improved] // delta).astype(np.int64)
+    order = np.argsort(bucket_ids, kind="stable")
+    improved, bucket_ids = improved[order], bucket_ids[order]
+    split_at = np.flatnonzero(np.diff(bucket_ids)) + 1
+    for group, bucket_id in zip(np.split(improved, split_at), bucket_ids[np.r_[0, split_at]]):
+        buckets.setdefault(int(bucket_id), []).append(group)
+
+def delta_stepping_shortest_path(graph, source, delta=None, processes=None, parallel_threshold=50000):
+    """Delta-stepping single source shortest paths with vectorized relaxations.
+
+    Nodes are kept in buckets of width delta. Each bucket is settled in
+    phases: all light edges (weight <= delta) of the current bucket are
+    relaxed as one NumPy batch until the bucket stops refilling, then the
+    heavy edges of everything settled in it are relaxed once.
+
+    Args:
+        graph: Adjacency list (as from load_graph) or a CSRGraph.
+        source: The source node.
+        delta: Bucket width; chosen with choose_delta() when None.
+        processes: If greater than 1, frontiers with at least
+                  parallel_threshold nodes are expanded across a process pool.
+        parallel_threshold: Minimum frontier size handed to the pool.
+
+    Returns:
+        Dictionary containing shortest distance from source to each node.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+    if delta is None:
+        delta = choose_delta(csr)
+
+    light, heavy = _split_light_heavy(csr, delta)
+    relaxer = _Relaxer(light, heavy, processes, parallel_threshold)
+
+    dist = np.full(csr.num_nodes, np.inf)
+    settled = np.zeros(csr.num_nodes, dtype=bool)
+    src = csr.node_index[source]
+    dist[src] = 0.0
+    buckets = {0: [np.array([src], dtype=np.int64)]}
+
+    try:
+        while buckets:
+            current = min(buckets)
+            settled_here = []
+            while current in buckets:
+                frontier = np.unique(np.concatenate(buckets.pop(current)))
+                # Drop entries that moved to another bucket or were settled earlier
+                frontier = frontier[~settled[frontier] & ((dist[frontier] // delta) == current)]
+                if len(frontier) == 0:
+                    continue
+                settled_here.append(frontier)
+                targets, candidates = relaxer.expand("light", frontier, dist[frontier])
+                _apply(dist, buckets, delta, targets, candidates)
+
+            if not settled_here:
+                continue
+            done = np.unique(np.concatenate(settled_here))
+            settled[done] = True
+            targets, candidates = relaxer.expand("heavy", done, dist[done])
+            _apply(dist, buckets, delta, targets, candidates)
+    finally:
+        relaxer.close()
+
+    return dict(zip(csr.nodes, dist.tolist()))
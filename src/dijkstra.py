@@ -1,3 +1,5 @@
+from array import array
+
 def build_graph_from_edges(nodes, edges):
     """Build adjacency list representation from edges.
     
@@ -19,7 +21,7 @@ def build_graph_from_edges(nodes, edges):
             graph[u].append((v, 1))
     return graph
 
-def dijkstra_shortest_path(graph, source, heap):
+def dijkstra_shortest_path(graph, source, heap, max_distance=None, max_settled=None, compact=False):
     """Dijkstra's shortest path algorithm using a generic heap.
     
     Args:
@@ -27,10 +29,28 @@ def dijkstra_shortest_path(graph, source, heap):
               (neighbor, weight) tuples.
         source: The source node.
         heap: A heap object supporting push(), pop(), and is_empty().
+        max_distance: If given, stop once the closest unsettled node is
+                     farther than this ("everything within distance R").
+        max_settled: If given, stop after settling this many nodes
+                    ("the k closest nodes", the source included).
+        compact: If True, return arrays indexed by dense node id (the
+                position of the node in iteration order of graph) instead
+                of a dictionary. Cannot be combined with the cutoffs.
         
     Returns:
         Dictionary containing shortest distance from source to each node.
+        With a cutoff, only the settled nodes are included, and the heap may
+        be left non-empty. With compact=True, a tuple of (distances,
+        predecessors) as array('d') and array('q'), with -1 for the source
+        and unreached nodes; wrap them with numpy.frombuffer for NumPy views.
     """
+    if compact:
+        if max_distance is not None or max_settled is not None:
+            raise ValueError("compact output cannot be combined with cutoffs")
+        return _compact_dijkstra(graph, source, heap)
+    if max_distance is not None or max_settled is not None:
+        return _bounded_dijkstra(graph, source, heap, max_distance, max_settled)
+
     INF = float('inf')
     distances = {node: INF for node in graph}
     distances[source] = 0
@@ -60,6 +80,183 @@ def dijkstra_shortest_path(graph, source, heap):
     
     return distances
 
+def has_dense_ids(nodes):
+    """Return True if the nodes are exactly 0..n-1 in order, i.e. already dense ids."""
+    return all(node == i for i, node in enumerate(nodes))
+
+def _compact_dijkstra(graph, source, heap):
+    """Dijkstra keeping distances and predecessors in flat arrays.
+
+    Args:
+        graph, source, heap: As for dijkstra_shortest_path.
+
+    Returns:
+        Tuple of (distances array('d'), predecessors array('q')) indexed by
+        dense node id.
+    """
+    nodes = list(graph)
+    n = len(nodes)
+    index = None if has_dense_ids(nodes) else {node: i for i, node in enumerate(nodes)}
+
+    # The loop only touches the arrays, so no per-node dictionary is ever built
+    distances = array('d', [float('inf')]) * n
+    predecessors = array('q', [-1]) * n
+    distances[source if index is None else index[source]] = 0
+
+    # Initialize heap
+    if hasattr(heap, 'contains') and heap.contains(source):
+        heap.decrease_key(source, 0)
+    else:
+        heap.push(0, source)
+
+    while not heap.is_empty():
+        current_node, current_distance = heap.pop()
+        current_id = current_node if index is None else index[current_node]
+
+        # Skip if we've already found a better path
+        if current_distance > distances[current_id]:
+            continue
+
+        for neighbor, weight in graph.get(current_node, []):
+            neighbor_id = neighbor if index is None else index[neighbor]
+            distance = current_distance + weight
+            if distance < distances[neighbor_id]:
+                distances[neighbor_id] = distance
+                predecessors[neighbor_id] = current_id
+                if hasattr(heap, 'contains') and heap.contains(neighbor):
+                    heap.decrease_key(neighbor, distance)
+                else:
+                    heap.push(distance, neighbor)
+
+    return distances, predecessors
+
+def iter_dijkstra(graph, source, heap):
+    """Incremental Dijkstra that yields nodes as they are settled.
+
+    Nothing is computed ahead of the consumer: the edges of a node are only
+    relaxed when the generator is resumed after yielding it, and state is
+    kept only for touched nodes, so stopping early wastes no work.
+    
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of 
+              (neighbor, weight) tuples.
+        source: The source node.
+        heap: A heap object supporting push(), pop(), and is_empty(), popping
+             in nondecreasing priority order (every heap in HEAP_TYPES does).
+        
+    Yields:
+        Tuples of (node, distance, predecessor) in settle order, i.e. by
+        nondecreasing distance, each reached node once; the predecessor of
+        the source is None.
+    """
+    INF = float('inf')
+    distances = {source: 0}  # Tentative distances of touched nodes only
+    predecessors = {source: None}
+
+    if hasattr(heap, 'contains') and heap.contains(source):
+        heap.decrease_key(source, 0)
+    else:
+        heap.push(0, source)
+
+    while not heap.is_empty():
+        current_node, current_distance = heap.pop()
+
+        # Skip if we've already found a better path
+        if current_distance > distances.get(current_node, INF):
+            continue
+        if current_distance == INF:
+            return  # Only unreachable nodes are left
+
+        yield current_node, current_distance, predecessors[current_node]
+
+        for neighbor, weight in graph.get(current_node, []):
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, INF):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_node
+                if hasattr(heap, 'contains') and heap.contains(neighbor):
+                    heap.decrease_key(neighbor, distance)
+                else:
+                    heap.push(distance, neighbor)
+
+def _bounded_dijkstra(graph, source, heap, max_distance, max_settled):
+    """Dijkstra with cutoffs, keeping state only for the nodes it touches.
+
+    Args:
+        graph, source, heap: As for dijkstra_shortest_path.
+        max_distance: Distance cutoff, or None.
+        max_settled: Cutoff on the number of settled nodes, or None.
+
+    Returns:
+        Dictionary of settled nodes and their shortest distances, in settle order.
+    """
+    settled = {}
+    if max_settled is not None and max_settled <= 0:
+        return settled
+
+    for node, distance, _ in iter_dijkstra(graph, source, heap):
+        if max_distance is not None and distance > max_distance:
+            break
+        settled[node] = distance
+        if max_settled is not None and len(settled) >= max_settled:
+            break
+    return settled
+
+def multi_source_dijkstra(graph, sources, heap):
+    """Multi-source Dijkstra: distance to, and identity of, the nearest source.
+
+    Equivalent to a single search from a virtual super-source joined to every
+    source, so a Voronoi-style partition of the graph costs one run instead
+    of one run per source. Ties go to the source whose search settles first.
+    
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of 
+              (neighbor, weight) tuples.
+        sources: Iterable of source nodes (all start at distance 0), or a
+                dictionary mapping each source to its starting offset.
+        heap: A heap object supporting push(), pop(), and is_empty().
+        
+    Returns:
+        A tuple of (distances, owners) dictionaries, where owners maps each
+        node to its nearest source (None if no source reaches it).
+    """
+    INF = float('inf')
+    offsets = sources if isinstance(sources, dict) else {source: 0 for source in sources}
+    distances = {node: INF for node in graph}
+    owners = {node: None for node in graph}
+
+    # Seed the heap with every source
+    for source, offset in offsets.items():
+        if offset >= distances[source]:
+            continue
+        distances[source] = offset
+        owners[source] = source
+        if hasattr(heap, 'contains') and heap.contains(source):
+            heap.decrease_key(source, offset)
+        else:
+            heap.push(offset, source)
+
+    while not heap.is_empty():
+        current_node, current_distance = heap.pop()
+        
+        # Skip if we've already found a better path
+        if current_distance > distances[current_node]:
+            continue
+        
+        # Explore neighbors; they inherit the owner of the node reaching them
+        owner = owners[current_node]
+        for neighbor, weight in graph.get(current_node, []):
+            distance = current_distance + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                owners[neighbor] = owner
+                if hasattr(heap, 'contains') and heap.contains(neighbor):
+                    heap.decrease_key(neighbor, distance)
+                else:
+                    heap.push(distance, neighbor)
+    
+    return distances, owners
+
 def main():
     """Example usage of Dijkstra's algorithm with different heaps."""
     from src.radix_heap import RadixHeap
@@ -0,0 +1,86 @@
+import struct
+import sys
+from array import array
+
+# Record header: magic, format version, flags, source dense id, number of nodes
+_HEADER = struct.Struct("<4sBB2xqq")
+_MAGIC = b"DSSP"
+_VERSION = 1
+_HAS_PREDECESSORS = 0x01
+
+def write_array(file, values):
+    """Write an array in little-endian byte order (also used by heap_trace)."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    values.tofile(file)
+
+def read_array(file, typecode, n):
+    """Read n little-endian items of typecode, raising EOFError if truncated."""
+    values = array(typecode)
+    data = file.read(n * values.itemsize)
+    if len(data) < n * values.itemsize:
+        raise EOFError("Truncated array data")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def dump_distances(file, source, distances, predecessors=None):
+    """Append one shortest-path result to a binary file.
+
+    Records are self-describing and can be written back to back, so the
+    results of an all-sources run can be streamed to one file as they are
+    produced (see batch_shortest_paths with compact=True).
+
+    Args:
+        file: File object opened for binary writing (or appending).
+        source: Dense id of the source node.
+        distances: array('d') (or sequence of floats) indexed by dense node id.
+        predecessors: Optional array('q') of predecessor dense ids.
+    """
+    if not isinstance(distances, array) or distances.typecode != "d":
+        distances = array("d", distances)
+    flags = 0
+    if predecessors is not None:
+        if not isinstance(predecessors, array) or predecessors.typecode != "q":
+            predecessors = array("q", predecessors)
+        if len(predecessors) != len(distances):
+            raise ValueError("distances and predecessors must have the same length")
+        flags |= _HAS_PREDECESSORS
+
+    file.write(_HEADER.pack(_MAGIC, _VERSION, flags, source, len(distances)))
+    write_array(file, distances)
+    if predecessors is not None:
+        write_array(file, predecessors)
+
+def load_distances(file):
+    """Read the next record written by dump_distances.
+
+    Args:
+        file: File object opened for binary reading.
+
+    Returns:
+        Tuple of (source, distances, predecessors), with predecessors None if
+        they were not stored, or None at end of file.
+    """
+    header = file.read(_HEADER.size)
+    if not header:
+        return None
+    if len(header) < _HEADER.size:
+        raise EOFError("Truncated distance record header")
+    magic, version, flags, source, n = _HEADER.unpack(header)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not a distance record (bad magic or version)")
+
+    distances = read_array(file, "d", n)
+    predecessors = read_array(file, "q", n) if flags & _HAS_PREDECESSORS else None
+    return source, distances, predecessors
+
+def iter_distances(file):
+    """Yield every (source, distances, predecessors) record left in file."""
+    while True:
+        record = load_distances(file)
+        if record is None:
+            return
+        yield record
@@ -0,0 +1,159 @@
+from src.binary_heap import BinaryHeap
+from src.dijkstra import iter_dijkstra
+
+class DynamicSSSP:
+    """
+    Single source shortest paths kept up to date under edge updates.
+
+    Holds the distances and a shortest-path tree from one source over an
+    undirected adjacency list (as built by build_graph_from_edges), and
+    repairs them after each edge change in the style of Ramalingam and Reps:
+    a weight decrease or insertion is propagated by a Dijkstra search seeded
+    at the improved endpoint; a weight increase or deletion of a tree edge
+    invalidates only the subtree hanging below it, which is re-seeded from
+    its unaffected neighbours and settled again. Changes to non-tree edges
+    that do not shorten any path cost O(degree).
+
+    The graph is modified in place; if an SSSPCache is given, it is told to
+    invalidate the graph on every change.
+
+    Attributes:
+        graph: The adjacency list being maintained.
+        source: The source node.
+        dist: Dictionary of shortest distances (inf for unreachable nodes).
+        parent: Dictionary of shortest-path tree parents (None for the
+               source and unreachable nodes).
+    """
+
+    def __init__(self, graph, source, heap_factory=BinaryHeap, cache=None):
+        """
+        Compute the initial shortest-path tree.
+
+        Args:
+            graph: Undirected adjacency list of (neighbor, weight) tuples.
+            source: The source node.
+            heap_factory: Callable returning an empty heap (a heap class).
+            cache: Optional SSSPCache holding results for this graph.
+        """
+        self.graph = graph
+        self.source = source
+        self.heap_factory = heap_factory
+        self.cache = cache
+        self.recompute()
+
+    def recompute(self):
+        """Rebuild distances and the tree from scratch."""
+        INF = float('inf')
+        self.dist = {node: INF for node in self.graph}
+        self.parent = {node: None for node in self.graph}
+        self.children = {node: set() for node in self.graph}
+        for node, distance, predecessor in iter_dijkstra(self.graph, self.source, self.heap_factory()):
+            self.dist[node] = distance
+            self._set_parent(node, predecessor)
+
+    def edge_weight(self, u, v):
+        """Return the weight of edge (u, v), or None if there is no such edge."""
+        weights = [weight for neighbor, weight in self.graph[u] if neighbor == v]
+        return min(weights) if weights else None
+
+    def update_edge(self, u, v, weight):
+        """
+        Set the weight of edge (u, v), inserting it if it does not exist.
+
+        Args:
+            u, v: Endpoints of the undirected edge.
+            weight: The new non-negative weight.
+        """
+        old_weight = self.edge_weight(u, v)
+        self._set_edge(u, v, weight)
+        if old_weight is None or weight < old_weight:
+            self._repair_decrease(u, v, weight)
+        elif weight > old_weight:
+            self._repair_increase(u, v)
+
+    def insert_edge(self, u, v, weight):
+        """Insert edge (u, v); same as update_edge."""
+        self.update_edge(u, v, weight)
+
+    def delete_edge(self, u, v):
+        """Remove edge (u, v) if present."""
+        if self.edge_weight(u, v) is None:
+            return
+        self._set_edge(u, v, None)
+        self._repair_increase(u, v)
+
+    def _set_edge(self, u, v, weight):
+        """Replace every (u, v) entry in both adjacency lists by one edge (or none)."""
+        for a, b in ((u, v), (v, u)):
+            self.graph[a] = [(n, w) for n, w in self.graph[a] if n != b]
+            if weight is not None:
+                self.graph[a].append((b, weight))
+        if self.cache is not None:
+            self.cache.invalidate(self.graph)
+
+    def _set_parent(self, node, parent):
+        """Move node under a new parent in the shortest-path tree."""
+        old_parent = self.parent[node]
+        if old_parent is not None:
+            self.children[old_parent].discard(node)
+        self.parent[node] = parent
+        if parent is not None:
+            self.children[parent].add(node)
+
+    def _relax(self, heap, node, distance, parent):
+        """Lower the distance of node and (re)insert it into the heap."""
+        self.dist[node] = distance
+        self._set_parent(node, parent)
+        if hasattr(heap, 'contains') and heap.contains(node):
+            heap.decrease_key(node, distance)
+        else:
+            heap.push(distance, node)
+
+    def _propagate(self, heap):
+        """Run Dijkstra from the seeded heap, lowering distances where possible."""
+        while not heap.is_empty():
+            current_node, current_distance = heap.pop()
+            if current_distance > self.dist[current_node]:
+                continue
+            for neighbor, weight in self.graph[current_node]:
+                distance = current_distance + weight
+                if distance < self.dist[neighbor]:
+                    self._relax(heap, neighbor, distance, current_node)
+
+    def _repair_decrease(self, u, v, weight):
+        """Propagate a cheaper (or new) edge from whichever endpoint it improves."""
+        heap = self.heap_factory()
+        for a, b in ((u, v), (v, u)):
+            if self.dist[a] + weight < self.dist[b]:
+                self._relax(heap, b, self.dist[a] + weight, a)
+        self._propagate(heap)
+
+    def _repair_increase(self, u, v):
+        """Re-settle the subtree that hung below edge (u, v), if it was a tree edge."""
+        if self.parent[v] == u:
+            root = v
+        elif self.parent[u] == v:
+            root = u
+        else:
+            return  # Not in the tree: no shortest path used it
+
+        # Collect and invalidate the affected subtree
+        INF = float('inf')
+        affected = [root]
+        for node in affected:
+            affected.extend(self.children[node])
+        affected_set = set(affected)
+        for node in affected:
+            self.dist[node] = INF
+            self._set_parent(node, None)
+
+        # Seed every affected node with its best distance through an unaffected neighbour
+        heap = self.heap_factory()
+        for node in affected:
+            best, best_parent = INF, None
+            for neighbor, weight in self.graph[node]:
+                if neighbor not in affected_set and self.dist[neighbor] + weight < best:
+                    best, best_parent = self.dist[neighbor] + weight, neighbor
+            if best_parent is not None:
+                self._relax(heap, node, best, best_parent)
+        self._propagate(heap)
@@ -0,0 +1,180 @@
+import csv
+import glob
+import math
+import os
+
+from src.approximate_sssp import approximate_shortest_path
+from src.dense_dijkstra import DENSE_MAX_NODES, dense_dijkstra_shortest_path
+from src.dijkstra import dijkstra_shortest_path
+from src.generate_data import edges_for_type
+from src.graph_stats import GraphStats
+from src.load_graph import HEAP_TYPES
+
+# Engine names accepted by run_engine
+ENGINES = ["BucketQueue", "DenseDijkstra"] + list(HEAP_TYPES)
+
+def run_engine(engine, graph, source):
+    """
+    Run one named shortest-path engine.
+
+    Args:
+        engine: "BucketQueue" (exact per-weight FIFO queues), "DenseDijkstra"
+               or a key of HEAP_TYPES.
+        graph: Adjacency list where keys are nodes and values are lists of
+              (neighbor, weight) tuples.
+        source: The source node.
+
+    Returns:
+        Dictionary containing shortest distance from source to each node.
+    """
+    if engine == "BucketQueue":
+        return approximate_shortest_path(graph, source, epsilon=0)
+    if engine == "DenseDijkstra":
+        return dense_dijkstra_shortest_path(graph, source)
+    if engine in HEAP_TYPES:
+        return dijkstra_shortest_path(graph, source, HEAP_TYPES[engine]())
+    raise ValueError(f"Unknown engine: {engine}")
+
+def _estimated_density(graph_size, graph_type):
+    """Density of a generated dataset, from the edge counts run.py uses per type."""
+    n = graph_size
+    if n < 2 or graph_type not in ("sparse", "dense", "middle", "random"):
+        return None
+    return min(1.0, 2 * edges_for_type(n, graph_type) / (n * (n - 1)))
+
+class EngineSelector:
+    """
+    Picks a shortest-path engine from GraphStats.
+
+    Rules, in order:
+    1. Near-complete graphs (density >= dense_min_density) small enough for
+       an n x n matrix use the heapless DenseDijkstra.
+    2. Small non-negative integer weights (max_weight <= bucket_max_weight)
+       use integer_engine, by default the bucket queue (one FIFO queue per
+       distinct weight, Dial style).
+    3. Everything else uses default_heap.
+
+    The thresholds can be fitted to stored benchmark results with
+    calibrate(), and every call can override the choice.
+
+    Attributes:
+        dense_min_density: Density from which DenseDijkstra is chosen.
+        dense_max_nodes: Largest graph DenseDijkstra is chosen for.
+        bucket_max_weight: Largest integer weight for integer_engine.
+        integer_engine: Engine for small integer weights.
+        default_heap: Heap used otherwise, a key of HEAP_TYPES.
+    """
+
+    def __init__(self, dense_min_density=0.5, dense_max_nodes=DENSE_MAX_NODES, bucket_max_weight=64,
+                 integer_engine="BucketQueue", default_heap="DHeap"):
+        """Initialize the rules; the defaults follow the repository benchmarks."""
+        if integer_engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {integer_engine}")
+        if default_heap not in HEAP_TYPES:
+            raise ValueError(f"Unknown heap type: {default_heap}")
+        self.dense_min_density = dense_min_density
+        self.dense_max_nodes = dense_max_nodes
+        self.bucket_max_weight = bucket_max_weight
+        self.integer_engine = integer_engine
+        self.default_heap = default_heap
+
+    def choose(self, stats):
+        """
+        Return the name of the engine to use for a graph.
+
+        Args:
+            stats: GraphStats of the graph.
+
+        Returns:
+            An engine name accepted by run_engine.
+        """
+        if stats.num_nodes <= self.dense_max_nodes and stats.density >= self.dense_min_density:
+            return "DenseDijkstra"
+        if stats.integer_weights and stats.min_weight >= 0 and stats.max_weight <= self.bucket_max_weight:
+            return self.integer_engine
+        return self.default_heap
+
+    def shortest_paths(self, graph, source, stats=None, engine=None):
+        """
+        Run the engine chosen for graph (or the one given).
+
+        Args:
+            graph: Adjacency list where keys are nodes and values are lists of
+                  (neighbor, weight) tuples.
+            source: The source node.
+            stats: GraphStats of graph, e.g. from load_graph_with_stats;
+                  computed from the adjacency list if omitted.
+            engine: Engine name overriding the selection for this call.
+
+        Returns:
+            Dictionary containing shortest distance from source to each node.
+        """
+        if engine is None:
+            engine = self.choose(stats if stats is not None else GraphStats.from_graph(graph))
+        return run_engine(engine, graph, source)
+
+    @classmethod
+    def calibrate(cls, csv_paths=None, **kwargs):
+        """
+        Fit the dense threshold and default heap to stored benchmark results.
+
+        Rows come from the CSV files written by save_results_to_csv. The
+        density of each row is estimated from its graph type and size. The
+        dense threshold is the one that best separates rows where
+        DenseDijkstra was fastest from the others, and the default heap is
+        the heap that was fastest on most remaining rows. The integer-weight
+        rule is not fitted (the CSVs have no bucket queue column).
+
+        Args:
+            csv_paths: List of CSV paths; defaults to results/*.csv.
+            **kwargs: Other EngineSelector arguments, kept as given.
+
+        Returns:
+            A calibrated EngineSelector (defaults where there is no data).
+        """
+        if csv_paths is None:
+            csv_paths = sorted(glob.glob(os.path.join("results", "*.csv")))
+
+        rows = []  # (density, {engine: seconds})
+        for path in csv_paths:
+            with open(path, newline='') as f:
+                for row in csv.DictReader(f):
+                    try:
+                        density = _estimated_density(int(row["Graph Size"]), row["Graph Type"])
+                    except (KeyError, ValueError):
+                        continue
+                    times = {}
+                    for engine in ["DenseDijkstra"] + list(HEAP_TYPES):
+                        # Median column, or the single-run column of older files
+                        value = row.get(f"{engine} Time Median (s)", row.get(f"{engine} Time (s)"))
+                        try:
+                            seconds = float(value)
+                        except (TypeError, ValueError):
+                            continue
+                        if not math.isnan(seconds):
+                            times[engine] = seconds
+                    if density is not None and times:
+                        rows.append((density, times))
+
+        if rows and "dense_min_density" not in kwargs:
+            dense_rows = [(density, min(times, key=times.get) == "DenseDijkstra")
+                          for density, times in rows if "DenseDijkstra" in times]
+            if any(wins for _, wins in dense_rows):
+                # Threshold with the fewest misclassified rows (ties keep the higher one)
+                candidates = sorted({density for density, _ in dense_rows}, reverse=True)
+                kwargs["dense_min_density"] = min(
+                    candidates,
+                    key=lambda t: sum((density >= t) != wins for density, wins in dense_rows)
+                )
+
+        if rows and "default_heap" not in kwargs:
+            threshold = kwargs.get("dense_min_density", 0.5)
+            wins = {heap_type: 0 for heap_type in HEAP_TYPES}
+            for density, times in rows:
+                heap_times = {name: t for name, t in times.items() if name in HEAP_TYPES}
+                if density < threshold and heap_times:
+                    wins[min(heap_times, key=heap_times.get)] += 1
+            if any(wins.values()):
+                kwargs["default_heap"] = max(wins, key=wins.get)
+
+        return cls(**kwargs)
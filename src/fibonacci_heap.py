@@ -38,6 +38,11 @@ class FibonacciHeap:
         """Check if the heap is empty."""
         return self.min_node is None
 
+    def clear(self):
+        """Remove all elements."""
+        self.min_node = None
+        self.count = 0
+
     def push(self, priority, value):
         """
         Insert a value with given priority into the heap.
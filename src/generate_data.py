@@ -28,6 +28,26 @@ def generate_weighted_graph(num_nodes, num_edges, weight_range=(1, 10)):
         "edges": list(edges)
     }
 
+def edges_for_type(num_nodes, graph_type):
+    """Number of edges of a generated graph of the given type.
+
+    Args:
+        num_nodes: Number of nodes in the graph.
+        graph_type: "sparse", "dense", "middle" or "random".
+
+    Returns:
+        The edge count used by the dataset generator.
+    """
+    sparse_edge = num_nodes * 2
+    dense_edge = num_nodes * (num_nodes - 1) // 2
+    if graph_type == "sparse":
+        return sparse_edge
+    if graph_type == "dense":
+        return dense_edge
+    if graph_type == "middle":
+        return (sparse_edge + dense_edge) // 2
+    return num_nodes * 5
+
 def save_graph_to_disk(graph, filename):
     """Save a graph to a JSON file.
     
@@ -0,0 +1,66 @@
+class GraphStats:
+    """
+    Cheap summary statistics of a graph, used to pick a shortest-path engine.
+
+    Attributes:
+        num_nodes: Number of nodes (n).
+        num_edges: Number of adjacency entries (undirected edges count twice).
+        integer_weights: True if every weight is an integer value.
+        min_weight: Smallest edge weight (0 for a graph without edges).
+        max_weight: Largest edge weight (0 for a graph without edges).
+        average_degree: num_edges / num_nodes.
+        density: num_edges / (n * (n - 1)), 1.0 for a complete graph.
+    """
+
+    def __init__(self, num_nodes, num_edges, integer_weights, min_weight, max_weight):
+        """Initialize from already computed counts; see from_edges and from_graph."""
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self.integer_weights = integer_weights
+        self.min_weight = min_weight
+        self.max_weight = max_weight
+        self.average_degree = num_edges / num_nodes if num_nodes else 0.0
+        self.density = num_edges / (num_nodes * (num_nodes - 1)) if num_nodes > 1 else 0.0
+
+    @classmethod
+    def from_edges(cls, nodes, edges):
+        """
+        Compute statistics from the node and edge lists of a dataset file.
+
+        Args:
+            nodes: List of nodes.
+            edges: List of (u, v, weight) undirected or (u, v) directed edges,
+                  as accepted by build_graph_from_edges.
+
+        Returns:
+            A GraphStats instance.
+        """
+        weights = [edge[2] if len(edge) == 3 else 1 for edge in edges]
+        num_entries = sum(2 if len(edge) == 3 else 1 for edge in edges)
+        return cls._from_weights(len(nodes), num_entries, weights)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Compute statistics from an adjacency list (or CSRGraph).
+
+        Args:
+            graph: Adjacency list where keys are nodes and values are lists of
+                  (neighbor, weight) tuples.
+
+        Returns:
+            A GraphStats instance.
+        """
+        weights = [weight for node in graph for _, weight in graph[node]]
+        return cls._from_weights(len(graph), len(weights), weights)
+
+    @classmethod
+    def _from_weights(cls, num_nodes, num_edges, weights):
+        """Build the statistics from the flat list of edge weights."""
+        integer_weights = all(float(weight).is_integer() for weight in weights)
+        return cls(num_nodes, num_edges, integer_weights, min(weights, default=0), max(weights, default=0))
+
+    def __repr__(self):
+        return (f"GraphStats(n={self.num_nodes}, m={self.num_edges}, "
+                f"integer_weights={self.integer_weights}, max_weight={self.max_weight}, "
+                f"average_degree={self.average_degree:.2f}, density={self.density:.4f})")
@@ -0,0 +1,83 @@
+import resource
+import sys
+
+def deep_sizeof(obj):
+    """
+    Return the total size in bytes of an object and everything it references.
+
+    Follows containers (lists, tuples, sets, dicts) and instance attributes
+    (__dict__ and __slots__); each object is counted once, so shared and
+    cyclic references (Fibonacci heap node rings) are handled.
+
+    Args:
+        obj: The object to measure.
+
+    Returns:
+        Size in bytes.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, type):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        if hasattr(current, '__dict__'):
+            stack.append(vars(current))
+        for slot in getattr(type(current), '__slots__', ()):
+            if hasattr(current, slot):
+                stack.append(getattr(current, slot))
+    return total
+
+def peak_rss():
+    """Return the peak resident set size of this process in bytes (a lifetime high-water mark)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # kB on Linux
+
+class HeapMemorySampler:
+    """
+    Heap wrapper that records the heap's own footprint while Dijkstra runs.
+
+    Every sample_every-th pop (and once when wrapped), the deep size of the
+    wrapped heap is measured and the peak kept. All other attributes are
+    passed through, so dijkstra_shortest_path sees the same interface
+    (including whether the heap has contains()).
+
+    Attributes:
+        heap: The wrapped heap.
+        sample_every: Number of pops between samples.
+        peak_bytes: Largest deep size seen so far.
+        samples: Number of samples taken.
+    """
+
+    def __init__(self, heap, sample_every=1):
+        """Wrap a heap and take the first sample."""
+        self.heap = heap
+        self.sample_every = max(1, sample_every)
+        self.peak_bytes = 0
+        self.samples = 0
+        self._pops = 0
+        self.sample()
+
+    def sample(self):
+        """Measure the heap now and update the peak."""
+        self.peak_bytes = max(self.peak_bytes, deep_sizeof(self.heap))
+        self.samples += 1
+
+    def pop(self):
+        """Pop from the wrapped heap, sampling its size beforehand every sample_every pops."""
+        self._pops += 1
+        if self._pops % self.sample_every == 0:
+            self.sample()
+        return self.heap.pop()
+
+    def __getattr__(self, name):
+        return getattr(self.heap, name)
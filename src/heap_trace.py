@@ -0,0 +1,176 @@
+import struct
+from array import array
+
+from src.dijkstra import dijkstra_shortest_path
+from src.distance_io import read_array, write_array
+from src.fibonacci_heap import FibonacciHeap
+
+# Operation codes
+PUSH, POP, DECREASE_KEY = 0, 1, 2
+
+# File header: magic, format version, number of operations, number of push/decrease_key arguments
+_HEADER = struct.Struct("<4sB3xqq")
+_MAGIC = b"HTRC"
+_VERSION = 1
+
+class HeapTrace:
+    """
+    A recorded sequence of heap operations.
+
+    Pops carry no arguments, so only pushes and decrease-keys store a
+    (value, priority) pair: one byte per operation plus 16 bytes per
+    argument pair. Values must be integers (node ids).
+
+    Attributes:
+        ops: array('B') of operation codes (PUSH, POP, DECREASE_KEY).
+        values: array('q') of values, one per push or decrease-key.
+        priorities: array('d') of priorities, one per push or decrease-key.
+    """
+
+    def __init__(self, ops=None, values=None, priorities=None):
+        """Initialize a trace, empty by default."""
+        self.ops = ops if ops is not None else array('B')
+        self.values = values if values is not None else array('q')
+        self.priorities = priorities if priorities is not None else array('d')
+
+    def __len__(self):
+        """Return the number of operations."""
+        return len(self.ops)
+
+    def counts(self):
+        """Return a dictionary with the number of pushes, pops and decrease-keys."""
+        return {
+            'pushes': self.ops.count(PUSH),
+            'pops': self.ops.count(POP),
+            'decrease_keys': self.ops.count(DECREASE_KEY),
+        }
+
+    def save(self, path):
+        """Write the trace to a binary file (little-endian)."""
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(self.ops), len(self.values)))
+            write_array(f, self.ops)
+            write_array(f, self.values)
+            write_array(f, self.priorities)
+
+    @classmethod
+    def load(cls, path):
+        """Read a trace written by save()."""
+        with open(path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise EOFError("Truncated heap trace header")
+            magic, version, num_ops, num_args = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("Not a heap trace (bad magic or version)")
+            ops = read_array(f, 'B', num_ops)
+            values = read_array(f, 'q', num_args)
+            priorities = read_array(f, 'd', num_args)
+        return cls(ops, values, priorities)
+
+class RecordingHeap:
+    """
+    Heap wrapper that records every push, pop and decrease_key into a HeapTrace.
+
+    Other attributes (is_empty, contains, ...) are passed through, so
+    Dijkstra behaves exactly as with the wrapped heap.
+
+    Attributes:
+        heap: The wrapped heap.
+        trace: The HeapTrace being recorded.
+    """
+
+    def __init__(self, heap, trace=None):
+        """Wrap a heap, appending to trace (a new HeapTrace by default)."""
+        self.heap = heap
+        self.trace = trace if trace is not None else HeapTrace()
+
+    def push(self, priority, value):
+        self._record(PUSH, value, priority)
+        return self.heap.push(priority, value)
+
+    def pop(self):
+        self.trace.ops.append(POP)
+        return self.heap.pop()
+
+    def decrease_key(self, value, new_priority):
+        self._record(DECREASE_KEY, value, new_priority)
+        return self.heap.decrease_key(value, new_priority)
+
+    def _record(self, op, value, priority):
+        if not isinstance(value, int):
+            raise TypeError(f"Heap traces need integer values, got {type(value).__name__}")
+        self.trace.ops.append(op)
+        self.trace.values.append(value)
+        self.trace.priorities.append(priority)
+
+    def __getattr__(self, name):
+        return getattr(self.heap, name)
+
+def record_dijkstra_trace(graph, source, heap):
+    """
+    Run dijkstra_shortest_path and record the heap operations it issues.
+
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of
+              (neighbor, weight) tuples.
+        source: The source node.
+        heap: A heap object; the trace reflects its interface (FibonacciHeap
+             has no contains(), so Dijkstra pushes duplicates instead of
+             decrease-keys).
+
+    Returns:
+        Tuple of (distances, trace).
+    """
+    recorder = RecordingHeap(heap)
+    distances = dijkstra_shortest_path(graph, source, recorder)
+    return distances, recorder.trace
+
+def replay(trace, heap):
+    """
+    Drive a heap through a recorded trace.
+
+    FibonacciHeap takes node handles in decrease_key; replay keeps the
+    handle returned by every push and maps decrease-keys onto them. A heap
+    that breaks ties between equal priorities differently from the recorded
+    one may see a decrease-key for a value it already popped, or a pop on
+    an empty heap; those operations are skipped and counted.
+
+    Args:
+        trace: The HeapTrace to replay.
+        heap: An empty heap.
+
+    Returns:
+        Number of operations that could not be applied.
+    """
+    push, pop, decrease_key = heap.push, heap.pop, heap.decrease_key
+    values, priorities = trace.values, trace.priorities
+    handles = {} if isinstance(heap, FibonacciHeap) else None
+    skipped = 0
+    arg = 0
+    for op in trace.ops:
+        if op == POP:
+            try:
+                value, _ = pop()
+            except IndexError:
+                skipped += 1
+                continue
+            if handles is not None:
+                handles.pop(value, None)
+        elif op == PUSH:
+            node = push(priorities[arg], values[arg])
+            if handles is not None:
+                handles[values[arg]] = node
+            arg += 1
+        else:
+            if handles is None:
+                if decrease_key(values[arg], priorities[arg]) is False:
+                    skipped += 1
+            else:
+                node = handles.get(values[arg])
+                if node is None:
+                    skipped += 1
+                else:
+                    decrease_key(node, priorities[arg])
+            arg += 1
+    return skipped
@@ -1,8 +1,19 @@
+import fnmatch
+import gc
 import json
-import os, re, time
+import math
+import os, random, re, time
+import statistics
 import tracemalloc
 from src.dijkstra import dijkstra_shortest_path
-from src.load_graph import load_graph_into_radix_heap, load_graph_into_binary_heap, load_graph_into_d_heap, load_graph_into_fibonacci_heap, load_graph
+from src.load_graph import load_graph, HEAP_TYPES
+from src.dense_dijkstra import build_weight_matrix, dense_dijkstra_shortest_path, DENSE_MAX_NODES
+from src.heap_memory import HeapMemorySampler, deep_sizeof, peak_rss
+from src.instrumented import INSTRUMENTED_HEAP_TYPES, counted_dijkstra_shortest_path
+from collections import Counter, defaultdict
+
+# Engines measured by run_experiment, in the order of its result tuple
+EXPERIMENT_ENGINES = list(HEAP_TYPES) + ["DenseDijkstra"]
 
 class Colors:
     """
@@ -17,34 +28,6 @@ class Colors:
     WHITE = "\033[97m"
     RESET = "\033[0m"  # Reset to default
 
-def run_dijkstra(graph, source_node, heap, heap_type):
-    """
-    Execute Dijkstra's algorithm using a specified heap implementation.
-    
-    Args:
-        graph: The graph represented as an adjacency list.
-        source_node: Starting node for the algorithm.
-        heap: Heap implementation (Radix, Binary, etc.).
-        heap_type: String identifier for the heap type (for logging).
-        
-    Returns:
-        Dictionary of shortest distances from source_node.
-    """
-    print(f"\nRunning Dijkstra's algorithm with {heap_type} from source node {source_node}...")
-    
-    # Initialize source node distance to 0
-    heap.push(0, source_node)
-    
-    # Time the algorithm execution
-    start_time = time.time()
-    shortest_distances = dijkstra_shortest_path(graph, source_node, heap)
-    end_time = time.time()
-    
-    time_consumed = end_time - start_time
-    print(f"\n{Colors.GREEN}Time consumed by Dijkstra's algorithm ({heap_type}): {Colors.RESET}{time_consumed:.6f} seconds")
-    
-    return shortest_distances
-
 def get_available_datasets():
     """
     Scan the data directory for available graph datasets.
@@ -111,63 +94,329 @@ def get_available_datasets():
 
     return datasets
 
-def run_experiment(data_file, graph_size):
+def filter_datasets(datasets, pattern=None, graph_types=None, min_size=None, max_size=None):
+    """
+    Select datasets by file name and properties.
+
+    Args:
+        datasets: List of (filepath, node_count, graph_type) tuples.
+        pattern: Shell-style pattern matched against the path or the file name.
+        graph_types: Collection of graph types to keep (None for all).
+        min_size: Smallest node count to keep (None for no bound).
+        max_size: Largest node count to keep (None for no bound).
+
+    Returns:
+        The matching datasets, in their original order.
+    """
+    return [
+        (filepath, size, graph_type) for filepath, size, graph_type in datasets
+        if (pattern is None or fnmatch.fnmatch(filepath, pattern)
+            or fnmatch.fnmatch(os.path.basename(filepath), pattern))
+        and (graph_types is None or graph_type in graph_types)
+        and (min_size is None or size >= min_size)
+        and (max_size is None or size <= max_size)
+    ]
+
+def measure_time(run, setup=None, warmup=1, repeats=5):
+    """
+    Time a callable over several repeats.
+
+    Each repeat calls setup() first (untimed) and passes its result to run.
+    The timed region covers only run, measured with perf_counter_ns, with
+    the garbage collector disabled (a collection is forced before it, so
+    garbage from earlier repeats is not charged to this one).
+
+    Args:
+        run: Callable taking the value returned by setup (or None).
+        setup: Optional callable preparing fresh input for each repeat.
+        warmup: Number of untimed repeats run first.
+        repeats: Number of timed repeats.
+
+    Returns:
+        List of elapsed times in seconds, one per timed repeat.
+    """
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for i in range(warmup + repeats):
+            arg = setup() if setup is not None else None
+            gc.collect()
+            gc.disable()
+            start_time = time.perf_counter_ns()
+            run(arg)
+            elapsed = time.perf_counter_ns() - start_time
+            if gc_was_enabled:
+                gc.enable()
+            if i >= warmup:
+                samples.append(elapsed / 1e9)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+def summarize_times(samples):
+    """
+    Summarize timing samples.
+
+    Args:
+        samples: List of elapsed times in seconds.
+
+    Returns:
+        Tuple of (median, interquartile range, minimum).
+    """
+    if len(samples) < 2:
+        return samples[0], 0.0, samples[0]
+    q1, _, q3 = statistics.quantiles(samples, n=4, method='inclusive')
+    return statistics.median(samples), q3 - q1, min(samples)
+
+def _filled_heap(heap_type, nodes, source_node, heap_types=HEAP_TYPES):
+    """Build the starting heap of a timed search: every node at infinity, the source at 0."""
+    heap = heap_types[heap_type]()
+    for node in nodes:
+        heap.push(float('inf'), node)
+    heap.push(0, source_node)
+    return heap
+
+def measure_engine(graph, nodes, engine, source_node=0, warmup=1, repeats=5, memory_samples=100,
+                   measure_memory=True):
+    """
+    Measure one engine on a loaded graph (see run_experiment for the measurements).
+
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of
+              (neighbor, weight) tuples.
+        nodes: List of nodes.
+        engine: A key of HEAP_TYPES or "DenseDijkstra".
+        source_node: Source node of every search.
+        warmup: Number of untimed runs.
+        repeats: Number of timed runs.
+        memory_samples: Approximate number of heap size samples per run.
+        measure_memory: If False, skip the memory and counting passes
+                       (memory, working set and peak RSS are NaN, counters empty).
+                       The dense engine only counts reached nodes.
+
+    Returns:
+        Tuple of (time, memory, time_iqr, time_min, working_set, peak_rss, counters).
+    """
+    nan = float('nan')
+    if engine == "DenseDijkstra":
+        # The n x n matrix plays the role of the heap
+        if len(nodes) > DENSE_MAX_NODES:
+            return (nan,) * 6 + (Counter(),)
+        weight_matrix = build_weight_matrix(graph)
+        samples = measure_time(
+            lambda _: dense_dijkstra_shortest_path(graph, source_node, weight_matrix),
+            warmup=warmup, repeats=repeats
+        )
+        median, iqr, minimum = summarize_times(samples)
+        if not measure_memory:
+            return (median, nan, iqr, minimum, nan, nan, Counter())
+
+        memory = deep_sizeof(weight_matrix)
+        tracemalloc.start()
+        distances = dense_dijkstra_shortest_path(graph, source_node, weight_matrix)
+        working_set = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        counters = Counter(reached=sum(distance < float('inf') for distance in distances.values()))
+        return (median, memory, iqr, minimum, working_set, peak_rss(), counters)
+
+    samples = measure_time(
+        lambda heap: dijkstra_shortest_path(graph, source_node, heap),
+        setup=lambda: _filled_heap(engine, nodes, source_node),
+        warmup=warmup, repeats=repeats
+    )
+    median, iqr, minimum = summarize_times(samples)
+    if not measure_memory:
+        return (median, nan, iqr, minimum, nan, nan, Counter())
+
+    # Untimed memory passes: the heap's own footprint, then the search's working set
+    sampler = HeapMemorySampler(_filled_heap(engine, nodes, source_node),
+                                max(1, len(nodes) // memory_samples))
+    dijkstra_shortest_path(graph, source_node, sampler)
+    memory = sampler.peak_bytes
+    del sampler
+
+    heap = _filled_heap(engine, nodes, source_node)
+    tracemalloc.start()
+    dijkstra_shortest_path(graph, source_node, heap)
+    working_set = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del heap
+
+    # Untimed counting pass; filling the heap is setup, not search work
+    heap = _filled_heap(engine, nodes, source_node, INSTRUMENTED_HEAP_TYPES)
+    heap.counters.clear()
+    _, counters = counted_dijkstra_shortest_path(graph, source_node, heap)
+    return (median, memory, iqr, minimum, working_set, peak_rss(), counters)
+
+def sample_nodes(nodes, count, seed=0):
+    """
+    Draw a seeded sample of source nodes.
+
+    The sample depends only on the node list, count and seed, so every
+    engine (and every later run) gets the same sources.
+
+    Args:
+        nodes: Sequence of nodes to draw from.
+        count: Number of sources (capped at the number of nodes).
+        seed: Seed of the sampling.
+
+    Returns:
+        Sorted list of distinct source nodes.
+    """
+    nodes = list(nodes)
+    return sorted(random.Random(seed).sample(nodes, min(count, len(nodes))))
+
+def _combine_sources(measurements):
+    """Merge measure_engine tuples of several sources: time statistics over the
+    per-source medians, memory and counters of the first source."""
+    if len(measurements) == 1:
+        return measurements[0]
+    medians = [measurement[0] for measurement in measurements]
+    median, iqr, _ = summarize_times(medians)
+    minimum = min(measurement[3] for measurement in measurements)
+    _, memory, _, _, working_set, rss, counters = measurements[0]
+    return (median, memory, iqr, minimum, working_set, rss, counters)
+
+def run_experiment(data_file, graph_size, warmup=1, repeats=5, memory_samples=100, num_sources=None, seed=0,
+                   per_source=None):
     """
     Run benchmark comparing different heap implementations on a graph.
+
+    Every engine is timed over warmup + repeats runs (see measure_time);
+    building the pre-filled heap is untimed setup. Memory is measured in
+    separate untimed passes, after the graph is loaded, so the loader is
+    never counted:
+    - memory: peak deep size of the heap itself, sampled at pops (for the
+      dense engine, the weight matrix that takes the heap's place);
+    - working set: tracemalloc peak of the search alone (heap growth plus
+      the distances dictionary), tracemalloc being too slow to overlap a
+      timed run;
+    - peak RSS: the process high-water mark after the engine ran, which
+      only grows, so it is meaningful per engine only in a fresh process
+      (see src.runner).
+    A last untimed pass runs the instrumented heap with
+    counted_dijkstra_shortest_path to collect operation counts.
+
+    With num_sources, every engine runs from the same seeded sample of
+    sources, so per-source times can be compared pairwise; the returned
+    time is the median of the per-source medians and the IQR their spread.
     
     Args:
         data_file: Path to graph data file.
         graph_size: Number of nodes in the graph.
+        warmup: Number of untimed runs per engine.
+        repeats: Number of timed runs per engine.
+        memory_samples: Approximate number of heap size samples per run.
+        num_sources: Number of sampled sources (None for node 0 only).
+        seed: Seed of the source sampling.
+        per_source: Optional list extended with one (data_file, engine,
+                   source, seconds, reached) record per engine and source.
         
     Returns:
-        Tuple of (time, memory) measurements for each heap type.
+        Tuple of (time, memory, time_iqr, time_min, working_set, peak_rss,
+        counters) measurements for each heap type, followed by the heapless
+        dense engine (NaN and no counters for graphs above DENSE_MAX_NODES).
+        time is the median in seconds, the next four are bytes, and
+        counters is a Counter of operation counts (of the first source).
     """
     # Load and build the graph
     graph, nodes = load_graph(data_file)
-    source_node = 0  # Use first node as source
-    
-    # Benchmark RadixHeap
-    tracemalloc.start()
-    radix_heap = load_graph_into_radix_heap(data_file)
-    start_time = time.time()
-    _ = run_dijkstra(graph, source_node, radix_heap, "RadixHeap")
-    radix_time = time.time() - start_time
-    radix_memory = tracemalloc.get_traced_memory()[1]  # Peak memory usage
-    tracemalloc.stop()
-    
-    # Benchmark BinaryHeap
-    tracemalloc.start()
-    binary_heap = load_graph_into_binary_heap(data_file)
-    start_time = time.time()
-    _ = run_dijkstra(graph, source_node, binary_heap, "BinaryHeap")
-    binary_time = time.time() - start_time
-    binary_memory = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
-    
-    # Benchmark DHeap
-    tracemalloc.start()
-    d_heap = load_graph_into_d_heap(data_file)
-    start_time = time.time()
-    _ = run_dijkstra(graph, source_node, d_heap, "DHeap")
-    d_heap_time = time.time() - start_time
-    d_heap_memory = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
-    
-    # Benchmark FibonacciHeap
-    tracemalloc.start()
-    fibonacci_heap = load_graph_into_fibonacci_heap(data_file)
-    start_time = time.time()
-    _ = run_dijkstra(graph, source_node, fibonacci_heap, "FibonacciHeap")
-    fibonacci_time = time.time() - start_time
-    fibonacci_memory = tracemalloc.get_traced_memory()[1]
-    tracemalloc.stop()
+    sources = [0] if num_sources is None else sample_nodes(nodes, num_sources, seed)
+    source_label = f"source node {sources[0]}" if len(sources) == 1 else f"{len(sources)} sampled source nodes"
+
+    measurements = []
+    for engine in EXPERIMENT_ENGINES:
+        if engine == "DenseDijkstra" and len(nodes) > DENSE_MAX_NODES:
+            print(f"\nSkipping DenseDijkstra: graph has more than {DENSE_MAX_NODES} nodes.")
+        elif engine == "DenseDijkstra":
+            print(f"\nRunning heapless dense Dijkstra from {source_label}...")
+        else:
+            print(f"\nRunning Dijkstra's algorithm with {engine} from {source_label} "
+                  f"({warmup} warmup + {repeats} timed runs each)...")
+        # The counting pass of every source gives its reached-node count
+        per_engine = [measure_engine(graph, nodes, engine, source, warmup, repeats, memory_samples)
+                      for source in sources]
+        if per_source is not None:
+            per_source.extend((data_file, engine, source, measurement[0], measurement[6].get('reached'))
+                              for source, measurement in zip(sources, per_engine))
+        measurement = _combine_sources(per_engine)
+        median, memory, iqr, minimum, working_set, _, counters = measurement
+
+        if engine == "DenseDijkstra" and len(nodes) <= DENSE_MAX_NODES:
+            print(f"{Colors.GREEN}Time consumed by Dijkstra's algorithm (DenseDijkstra): {Colors.RESET}"
+                  f"median {median:.6f} s, IQR {iqr:.6f} s, min {minimum:.6f} s; "
+                  f"matrix {memory} B, working set {working_set} B")
+        elif engine != "DenseDijkstra":
+            print(f"{Colors.GREEN}Time consumed by Dijkstra's algorithm ({engine}): {Colors.RESET}"
+                  f"median {median:.6f} s, IQR {iqr:.6f} s, min {minimum:.6f} s; "
+                  f"heap {memory} B, working set {working_set} B; "
+                  f"{counters['pops']} pops, {counters['decrease_keys']} decrease-keys, "
+                  f"{counters['stale_pops']} stale pops")
+        measurements.append(measurement)
     
-    return (
-        (radix_time, radix_memory),
-        (binary_time, binary_memory),
-        (d_heap_time, d_heap_memory),
-        (fibonacci_time, fibonacci_memory)
-    )
+    return tuple(measurements)
+
+def print_source_summary(records, baseline="BinaryHeap"):
+    """
+    Print per-source time distributions and reached-node counts.
+
+    Engines are compared pairwise: for every source run by both an engine
+    and the baseline, the ratio of their times is taken, and the median
+    ratio is reported.
+
+    Args:
+        records: (data_file, engine, source, seconds, reached) tuples, as
+                collected by run_experiment(per_source=...); NaN seconds
+                (skipped or failed runs) are ignored.
+        baseline: Engine the others are compared with.
+    """
+    by_dataset = defaultdict(lambda: defaultdict(dict))
+    for data_file, engine, source, seconds, reached in records:
+        by_dataset[data_file][engine][source] = (seconds, reached)
+
+    for data_file, engines in by_dataset.items():
+        reached = {}
+        for per_source in engines.values():
+            reached.update({source: count for source, (_, count) in per_source.items() if count is not None})
+        print(f"\n{Colors.MAGENTA}Per-source results on {data_file} ({len(reached)} sources){Colors.RESET}")
+        if reached:
+            counts = sorted(reached.values())
+            print(f"Reached nodes: min {counts[0]}, median {statistics.median(counts):g}, max {counts[-1]}")
+
+        base = engines.get(baseline, {})
+        for engine, per_source in engines.items():
+            times = sorted(seconds for seconds, _ in per_source.values() if not math.isnan(seconds))
+            if not times:
+                print(f"{engine}: no result")
+                continue
+            line = (f"{engine}: per-source time min {times[0]:.6f} s, median {statistics.median(times):.6f} s, "
+                    f"max {times[-1]:.6f} s")
+            ratios = [seconds / base[source][0] for source, (seconds, _) in per_source.items()
+                      if source in base and base[source][0] > 0 and not math.isnan(seconds)]
+            if engine != baseline and ratios:
+                line += f"; paired vs {baseline}: median {statistics.median(ratios):.2f}x over {len(ratios)} sources"
+            print(line)
+
+def get_process_memory():
+    """
+    Read the memory footprint of the current process.
+
+    Returns:
+        Dictionary with 'rss' (resident set size) and 'pss' (proportional
+        set size, shared pages divided among the processes mapping them) in
+        bytes. Values are None where /proc is not available.
+    """
+    memory = {'rss': None, 'pss': None}
+    try:
+        with open('/proc/self/smaps_rollup', 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in ('Rss', 'Pss'):
+                    memory[key.lower()] = int(value.split()[0]) * 1024  # kB
+    except OSError:
+        pass
+    return memory
 
 def is_valid_input(s):
     """
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import math
+import os
+import platform
+import sqlite3
+import subprocess
+import statistics
+from datetime import datetime
+
+from scipy.stats import mannwhitneyu
+
+# Default location of the benchmark history database
+DEFAULT_HISTORY = os.path.join("results", "history.sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    session TEXT NOT NULL,
+    created TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    dataset_sha256 TEXT NOT NULL,
+    graph_size INTEGER,
+    graph_type TEXT,
+    engine TEXT NOT NULL,
+    source INTEGER,
+    repeat INTEGER,
+    status TEXT NOT NULL,
+    seconds REAL,
+    reached INTEGER,
+    params TEXT NOT NULL,
+    commit_hash TEXT,
+    machine TEXT NOT NULL,
+    label TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_lookup ON runs (dataset_sha256, engine, params, session);
+"""
+
+def file_sha256(path):
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def git_commit():
+    """Return the commit of the benchmarked code (suffixed with "-dirty" for uncommitted changes), or None outside git."""
+    repository = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repository,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=repository,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + "-dirty" if dirty else commit
+
+def machine_fingerprint():
+    """
+    Identify the machine and interpreter results were measured on.
+
+    Returns:
+        A short hex digest of the host name, CPU model and count, OS and
+        Python version; equal fingerprints mean comparable hardware and
+        software.
+    """
+    cpu_model = platform.processor()
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    cpu_model = line.split(':', 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    description = "|".join([platform.node(), platform.machine(), cpu_model, str(os.cpu_count()),
+                            platform.system(), platform.release(), platform.python_implementation(),
+                            platform.python_version()])
+    return hashlib.sha256(description.encode()).hexdigest()[:16]
+
+class BenchmarkHistory:
+    """
+    Benchmark runs stored in a SQLite database.
+
+    Every run is stored with the checksum of its dataset file, the engine,
+    the timing parameters, the git commit and the machine fingerprint, and
+    belongs to a session (one benchmark invocation). Sessions can then be
+    compared with compare().
+
+    Attributes:
+        path: Path of the database file.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY):
+        """Open (and create if needed) the database at path."""
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record_runs(self, runs, datasets, params, label=None):
+        """
+        Append a session of runs.
+
+        Args:
+            runs: (filepath, engine, source, repeat, status, seconds, reached)
+                 tuples, as returned by run_isolated_benchmark.
+            datasets: List of (filepath, graph_size, graph_type) tuples of the runs.
+            params: Dictionary of parameters that affect the timings; runs
+                   are only compared with runs of equal parameters.
+            label: Optional free-form session label (e.g. "baseline").
+
+        Returns:
+            The new session id (a timestamp).
+        """
+        created = datetime.now().isoformat(timespec='seconds')
+        session = datetime.now().strftime("%y%m%d%H%M%S%f")
+        info = {filepath: (file_sha256(filepath), graph_size, graph_type)
+                for filepath, graph_size, graph_type in datasets}
+        params_key = json.dumps(params, sort_keys=True)
+        commit, machine = git_commit(), machine_fingerprint()
+        rows = [
+            (session, created, filepath, *info[filepath], engine, source, repeat, status,
+             None if math.isnan(seconds) else seconds, reached, params_key, commit, machine, label)
+            for filepath, engine, source, repeat, status, seconds, reached in runs
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO runs (session, created, dataset, dataset_sha256, graph_size, graph_type, engine, "
+                "source, repeat, status, seconds, reached, params, commit_hash, machine, label) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        return session
+
+    def sessions(self):
+        """
+        List the stored sessions, oldest first.
+
+        Returns:
+            List of (session, created, commit, machine, label, num_runs) tuples.
+        """
+        return self._conn.execute(
+            "SELECT session, MIN(created), commit_hash, machine, label, COUNT(*) FROM runs "
+            "GROUP BY session ORDER BY session"
+        ).fetchall()
+
+    def find_session(self, key):
+        """
+        Resolve a session id, label or commit (prefix) to the latest matching session.
+
+        Returns:
+            The session id, or None if nothing matches.
+        """
+        row = self._conn.execute(
+            "SELECT session FROM runs WHERE session = ? OR label = ? OR commit_hash LIKE ? "
+            "ORDER BY session DESC LIMIT 1", (key, key, key + "%")
+        ).fetchone()
+        return row[0] if row else None
+
+    def samples(self, session):
+        """
+        Return the completed run times of a session.
+
+        Returns:
+            Dictionary mapping (dataset_sha256, engine, params, sources) to
+            a tuple of (dataset path, machine, list of seconds), sources
+            being the sorted tuple of source nodes the engine ran from on
+            that dataset. Times from different source sets measure different
+            searches, so they never share a key.
+        """
+        grouped = {}
+        sources = {}
+        for dataset, sha, engine, params, machine, source, seconds in self._conn.execute(
+                "SELECT dataset, dataset_sha256, engine, params, machine, source, seconds FROM runs "
+                "WHERE session = ? AND status = 'ok' AND seconds IS NOT NULL ORDER BY id", (session,)):
+            grouped.setdefault((sha, engine, params), (dataset, machine, []))[2].append(seconds)
+            sources.setdefault((sha, engine, params), set()).add(source)
+        return {key + (tuple(sorted(sources[key])),): value for key, value in grouped.items()}
+
+    def compare(self, current, baseline, alpha=0.05, min_ratio=1.05):
+        """
+        Test a session's run times against a baseline session.
+
+        For every (dataset checksum, engine, parameters, source set)
+        present in both sessions, a one-sided Mann-Whitney U test checks whether the current
+        times are stochastically larger than the baseline times. A slowdown
+        is flagged when the p-value is below alpha and the median ratio
+        exceeds min_ratio.
+
+        Args:
+            current: Session id of the runs to check.
+            baseline: Session id of the reference runs.
+            alpha: Significance level.
+            min_ratio: Smallest current/baseline median ratio worth flagging
+                      (by default a 5% slowdown).
+
+        Returns:
+            List of (dataset, engine, baseline_median, current_median, ratio,
+            p_value, slowdown, same_machine) tuples, sorted by dataset and engine.
+        """
+        baseline_samples = self.samples(baseline)
+        rows = []
+        for key, (dataset, machine, times) in self.samples(current).items():
+            if key not in baseline_samples:
+                continue
+            _, baseline_machine, reference = baseline_samples[key]
+            current_median, baseline_median = statistics.median(times), statistics.median(reference)
+            ratio = current_median / baseline_median if baseline_median > 0 else float('inf')
+            p_value = mannwhitneyu(times, reference, alternative='greater').pvalue
+            slowdown = p_value < alpha and ratio > min_ratio
+            rows.append((dataset, key[1], baseline_median, current_median, ratio, p_value, slowdown,
+                         machine == baseline_machine))
+        return sorted(rows)
@@ -0,0 +1,231 @@
+from collections import Counter
+
+from src.dijkstra import dijkstra_shortest_path
+from src.radix_heap import RadixHeap
+from src.binary_heap import BinaryHeap
+from src.d_heap import DHeap
+from src.fibonacci_heap import FibonacciHeap
+
+# Instrumented variants live in their own subclasses, and the search is
+# counted through wrappers, so the plain heaps and dijkstra_shortest_path pay
+# nothing for counting.
+
+class _CountedSiftMixin:
+    """Counting push/pop/decrease_key and sifts for the array-based heaps.
+
+    sift_steps counts the swaps of the sift loops (through _swap) and
+    comparisons their priority comparisons, derived from the index the
+    plain sift methods return so the loops themselves are not copied.
+    """
+
+    def push(self, priority, value):
+        if value in self.position_map:
+            return self.decrease_key(value, priority)  # Counted there
+        self.counters['pushes'] += 1
+        return super().push(priority, value)
+
+    def pop(self):
+        self.counters['pops'] += 1
+        if self.size:
+            self.counters['sift_steps'] -= 1  # Moving the last entry to the root also goes through _swap
+        return super().pop()
+
+    def decrease_key(self, value, new_priority):
+        self.counters['decrease_keys'] += 1
+        return super().decrease_key(value, new_priority)
+
+    def _swap(self, i, j):
+        self.counters['sift_steps'] += 1
+        super()._swap(i, j)
+
+    def _bubble_up(self, index):
+        steps = self.counters['sift_steps']
+        index = super()._bubble_up(index)
+        # One comparison per step, plus the one that stopped it below the root
+        self.counters['comparisons'] += self.counters['sift_steps'] - steps + (index > 0)
+        return index
+
+    def _bubble_down(self, index):
+        steps = self.counters['sift_steps']
+        index = super()._bubble_down(index)
+        # Every level on the path compared all of its children; walk it back up from the final index
+        d = getattr(self, 'd', 2)
+        level = index
+        comparisons = self._children(level)
+        for _ in range(self.counters['sift_steps'] - steps):
+            level = (level - 1) // d
+            comparisons += self._children(level)
+        self.counters['comparisons'] += comparisons
+        return index
+
+    def _children(self, index):
+        """Number of children of the entry at index."""
+        d = getattr(self, 'd', 2)
+        return max(0, min(d, self.size - d * index - 1))
+
+class InstrumentedBinaryHeap(_CountedSiftMixin, BinaryHeap):
+    """BinaryHeap that counts its operations in self.counters."""
+
+    def __init__(self):
+        super().__init__()
+        self.counters = Counter()
+
+class InstrumentedDHeap(_CountedSiftMixin, DHeap):
+    """DHeap that counts its operations in self.counters."""
+
+    def __init__(self, d=2):
+        super().__init__(d)
+        self.counters = Counter()
+
+class InstrumentedFibonacciHeap(FibonacciHeap):
+    """FibonacciHeap that counts operations, links and cuts in self.counters."""
+
+    def __init__(self):
+        super().__init__()
+        self.counters = Counter()
+
+    def push(self, priority, value):
+        self.counters['pushes'] += 1
+        return super().push(priority, value)
+
+    def pop(self):
+        self.counters['pops'] += 1
+        return super().pop()
+
+    def decrease_key(self, node, new_priority):
+        self.counters['decrease_keys'] += 1
+        return super().decrease_key(node, new_priority)
+
+    def _link(self, child, parent):
+        self.counters['links'] += 1
+        self.counters['comparisons'] += 1  # The priority test that chose the parent
+        super()._link(child, parent)
+
+    def _cut(self, node, parent):
+        self.counters['cuts'] += 1
+        super()._cut(node, parent)
+
+    def _cascading_cut(self, node):
+        if node.parent is not None and node.marked:
+            self.counters['cascading_cuts'] += 1
+        super()._cascading_cut(node)
+
+class InstrumentedRadixHeap(RadixHeap):
+    """RadixHeap that counts operations and bucket redistributions in self.counters."""
+
+    def __init__(self):
+        super().__init__()
+        self.counters = Counter()
+        self._reinserting = False  # decrease_key re-pushes internally
+
+    def push(self, priority, value):
+        if value in self.position_map:
+            return self.decrease_key(value, priority)  # Counted there
+        if not self._reinserting:
+            self.counters['pushes'] += 1
+        return super().push(priority, value)
+
+    def pop(self):
+        self.counters['pops'] += 1
+        return super().pop()
+
+    def decrease_key(self, value, new_priority):
+        self.counters['decrease_keys'] += 1
+        self._reinserting = True
+        try:
+            return super().decrease_key(value, new_priority)
+        finally:
+            self._reinserting = False
+
+    def _redistribute_bucket(self, bucket_idx):
+        self.counters['redistributions'] += 1
+        self.counters['redistributed_items'] += len(self.buckets[bucket_idx])
+        super()._redistribute_bucket(bucket_idx)
+
+# Instrumented heap classes by the HEAP_TYPES name of the heap they count
+INSTRUMENTED_HEAP_TYPES = {
+    "RadixHeap": InstrumentedRadixHeap,
+    "BinaryHeap": InstrumentedBinaryHeap,
+    "DHeap": InstrumentedDHeap,
+    "FibonacciHeap": InstrumentedFibonacciHeap,
+}
+
+class _CountingGraph:
+    """Read-only view of an adjacency list counting the edges handed out by get().
+
+    dijkstra_shortest_path only iterates the graph and calls get() on the
+    nodes it scans, so the count is the number of relaxations.
+    """
+
+    def __init__(self, graph, counters):
+        self.graph = graph
+        self.counters = counters
+
+    def __iter__(self):
+        return iter(self.graph)
+
+    def get(self, node, default=None):
+        edges = self.graph.get(node, default)
+        self.counters['relaxations'] += len(edges)
+        return edges
+
+class _CountingSearchHeap:
+    """Heap wrapper counting the search events dijkstra_shortest_path causes.
+
+    The search pushes (or decreases) a node once per improved distance and
+    skips a popped entry whose priority is above the node's best distance,
+    which is the smallest priority it gave the node. All other attributes
+    are passed through, like HeapMemorySampler.
+    """
+
+    def __init__(self, heap, counters):
+        self.heap = heap
+        self.counters = counters
+        self._best = {}
+
+    def push(self, priority, value):
+        self._improved(value, priority)
+        return self.heap.push(priority, value)
+
+    def decrease_key(self, value, new_priority):
+        self._improved(value, new_priority)
+        return self.heap.decrease_key(value, new_priority)
+
+    def pop(self):
+        value, priority = self.heap.pop()
+        if priority > self._best.get(value, float('inf')):
+            self.counters['stale_pops'] += 1
+        return value, priority
+
+    def _improved(self, value, priority):
+        self.counters['improvements'] += 1
+        self._best[value] = priority
+
+    def __getattr__(self, name):
+        return getattr(self.heap, name)
+
+def counted_dijkstra_shortest_path(graph, source, heap):
+    """dijkstra_shortest_path with operation counters.
+
+    Runs dijkstra_shortest_path itself (full run, no cutoffs) on counting
+    views of the graph and heap, counting relaxations (edges examined),
+    improvements (relaxations that lowered a distance), stale pops
+    (entries popped after their node got a smaller distance) and reached
+    nodes (finite distance, source included).
+
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of
+              (neighbor, weight) tuples.
+        source: The source node.
+        heap: A heap object; if it is instrumented, its counters are merged
+             into the result.
+
+    Returns:
+        Tuple of (distances, counters), counters being a Counter.
+    """
+    counters = Counter()
+    distances = dijkstra_shortest_path(_CountingGraph(graph, counters), source, _CountingSearchHeap(heap, counters))
+    counters['improvements'] -= 1  # The source's own push is not a relaxation
+    counters['reached'] = sum(distance < float('inf') for distance in distances.values())
+    counters.update(getattr(heap, 'counters', {}))
+    return distances, counters
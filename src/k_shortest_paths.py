@@ -0,0 +1,161 @@
+from src.batch import _pool_context
+from src.binary_heap import BinaryHeap
+from src.load_graph import HEAP_TYPES
+
+# Per-worker state, filled in by _init_worker once per process
+_worker_state = {}
+
+def shortest_path(graph, source, target, heap, banned_nodes=(), banned_edges=()):
+    """Point-to-point Dijkstra over a masked graph.
+
+    The search stops as soon as the target is settled. Nodes and edges are
+    masked by skipping them during relaxation, so the graph is never copied.
+
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of
+              (neighbor, weight) tuples.
+        source: The source node.
+        target: The target node.
+        heap: A heap object supporting push(), pop(), and is_empty(), popping
+             in nondecreasing priority order, so that the target's first
+             pop is final (every heap in HEAP_TYPES does).
+        banned_nodes: Set of nodes the path may not visit.
+        banned_edges: Set of directed (u, v) pairs the path may not use.
+
+    Returns:
+        Tuple of (distance, path), where path lists the nodes from source to
+        target; (inf, []) if the target cannot be reached.
+    """
+    INF = float('inf')
+    if source in banned_nodes or target in banned_nodes:
+        return INF, []
+    distances = {source: 0}  # Tentative distances of touched nodes only
+    predecessors = {source: None}
+    heap.push(0, source)
+
+    while not heap.is_empty():
+        current_node, current_distance = heap.pop()
+
+        # Skip if we've already found a better path
+        if current_distance > distances.get(current_node, INF):
+            continue
+        if current_node == target:
+            path = []
+            while current_node is not None:
+                path.append(current_node)
+                current_node = predecessors[current_node]
+            return current_distance, path[::-1]
+
+        for neighbor, weight in graph.get(current_node, []):
+            if neighbor in banned_nodes or (current_node, neighbor) in banned_edges:
+                continue
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, INF):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_node
+                if hasattr(heap, 'contains') and heap.contains(neighbor):
+                    heap.decrease_key(neighbor, distance)
+                else:
+                    heap.push(distance, neighbor)
+    return INF, []
+
+def _prefix_costs(graph, path):
+    """Return the cumulative cost of path at each of its nodes."""
+    costs = [0]
+    for u, v in zip(path, path[1:]):
+        costs.append(costs[-1] + min(weight for neighbor, weight in graph[u] if neighbor == v))
+    return costs
+
+def _init_worker(graph, heap_type, target):
+    """Pool initializer: keep the graph and query in the worker process."""
+    _worker_state["graph"] = graph
+    _worker_state["heap_class"] = HEAP_TYPES[heap_type]
+    _worker_state["target"] = target
+
+def _spur_in_worker(task):
+    """Pool task: run one spur search on the worker's graph."""
+    spur_node, banned_nodes, banned_edges = task
+    return shortest_path(
+        _worker_state["graph"], spur_node, _worker_state["target"],
+        _worker_state["heap_class"](), banned_nodes, banned_edges
+    )
+
+def _spur_tasks(path, found):
+    """Yield (spur_node, banned_nodes, banned_edges) for every spur of path.
+
+    For the spur at position i, the root path[:i + 1] must stay fixed: its
+    other nodes are banned, and so is the next edge of every accepted path
+    sharing that root, so the spur search finds a new deviation.
+    """
+    for i in range(len(path) - 1):
+        root = path[:i + 1]
+        banned_edges = {(p[i], p[i + 1]) for p in found if len(p) > i + 1 and p[:i + 1] == root}
+        yield path[i], set(root[:-1]), banned_edges
+
+def k_shortest_paths(graph, source, target, k, heap_type="BinaryHeap", processes=1):
+    """Yen's algorithm for the k shortest loopless paths.
+
+    Each accepted path spawns one spur search per node on it; these are
+    independent of each other and can be spread over a process pool (the
+    graph is handed to the workers once, as in batch_shortest_paths).
+
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of
+              (neighbor, weight) tuples.
+        source: The source node.
+        target: The target node.
+        k: Maximum number of paths to return.
+        heap_type: Name of the heap to use, a key of HEAP_TYPES.
+        processes: Number of worker processes for the spur searches; 1
+                  (the default) runs them in the calling process and None
+                  uses all cores.
+
+    Returns:
+        List of up to k (cost, path) tuples in order of increasing cost.
+    """
+    if heap_type not in HEAP_TYPES:
+        raise ValueError(f"Unknown heap type: {heap_type}")
+    heap_class = HEAP_TYPES[heap_type]
+
+    _, path = shortest_path(graph, source, target, heap_class())
+    if not path or k <= 0:
+        return []
+    found = [path]
+    costs = {tuple(path): _prefix_costs(graph, path)}
+    candidates = BinaryHeap()  # tuple(path) -> cost; pushing a duplicate is a no-op
+
+    pool = None
+    if processes != 1:
+        pool = _pool_context().Pool(processes, initializer=_init_worker, initargs=(graph, heap_type, target))
+    try:
+        while len(found) < k:
+            last = found[-1]
+            last_costs = costs[tuple(last)]
+            tasks = list(_spur_tasks(last, found))
+            if pool is None:
+                spurs = [
+                    shortest_path(graph, spur_node, target, heap_class(), banned_nodes, banned_edges)
+                    for spur_node, banned_nodes, banned_edges in tasks
+                ]
+            else:
+                spurs = pool.map(_spur_in_worker, tasks)
+
+            for i, (_, spur_path) in enumerate(spurs):
+                if not spur_path:
+                    continue
+                candidate = tuple(last[:i] + spur_path)
+                if candidate not in costs:
+                    spur_costs = _prefix_costs(graph, spur_path)
+                    costs[candidate] = last_costs[:i] + [last_costs[i] + c for c in spur_costs]
+                candidates.push(costs[candidate][-1], candidate)
+
+            if candidates.is_empty():
+                break
+            candidate, _ = candidates.pop()
+            found.append(list(candidate))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return [(costs[tuple(path)][-1], path) for path in found]
@@ -3,8 +3,43 @@ from src.binary_heap import BinaryHeap
 from src.d_heap import DHeap
 from src.fibonacci_heap import FibonacciHeap
 from src.dijkstra import build_graph_from_edges
+from src.graph_stats import GraphStats
 
 import json
+import os
+import re
+
+# Heap implementations by name, in the order the benchmark reports them
+HEAP_TYPES = {
+    "RadixHeap": RadixHeap,
+    "BinaryHeap": BinaryHeap,
+    "DHeap": DHeap,
+    "FibonacciHeap": FibonacciHeap,
+}
+
+# Name of a generated dataset file: graph_n{size}_e{edges}_{type}.json
+_DATASET_NAME = re.compile(r"graph_n(\d+)_e(\d+)_")
+
+def dataset_edge_count(filepath):
+    """Return the number of edges of a dataset file.
+
+    The count is read from a generated dataset's file name, otherwise from
+    the edge list in the file.
+
+    Args:
+        filepath: Path to the JSON file containing graph data.
+
+    Returns:
+        Number of edges, or None if the name has no count and the file
+        does not exist.
+    """
+    match = _DATASET_NAME.match(os.path.basename(filepath))
+    if match:
+        return int(match.group(2))
+    if not os.path.exists(filepath):
+        return None
+    with open(filepath, 'r') as f:
+        return len(json.load(f).get("edges", []))
 
 def load_graph(filepath):
     """Load the graph from a JSON file.
@@ -28,6 +63,25 @@ def load_graph(filepath):
     graph = build_graph_from_edges(nodes, edges)
     return graph, nodes
 
+def load_graph_with_stats(filepath):
+    """Load the graph from a JSON file together with its GraphStats.
+
+    The statistics are computed from the edge list while it is in memory
+    anyway, so engine selection needs no extra pass over the graph.
+    
+    Args:
+        filepath: Path to the JSON file containing graph data.
+        
+    Returns:
+        A tuple of (graph, nodes, stats).
+    """
+    with open(filepath, 'r') as f:
+        graph_data = json.load(f)
+
+    nodes = graph_data.get("nodes", [])
+    edges = graph_data.get("edges", [])
+    return build_graph_from_edges(nodes, edges), nodes, GraphStats.from_edges(nodes, edges)
+
 def load_graph_into_radix_heap(filepath):
     """Load graph nodes into a RadixHeap with initial infinity priority.
     
@@ -0,0 +1,137 @@
+import numpy as np
+
+from src.dijkstra import iter_dijkstra
+from src.load_graph import HEAP_TYPES
+
+def _target_balls(reverse_graph, targets, heap_class, ball_size):
+    """Run a bounded backward search from every target.
+
+    Args:
+        reverse_graph: Graph with every edge reversed (the graph itself if
+                      undirected).
+        targets: List of target nodes; the column of a target is its position.
+        heap_class: Heap class used for the backward searches.
+        ball_size: Number of nodes settled around each target.
+
+    Returns:
+        Tuple of (buckets, radii): buckets maps a node to a list of
+        (column, distance to that target) entries; radii[column] is a
+        distance below which every node is in the target's ball (inf if the
+        ball holds the whole component).
+    """
+    INF = float('inf')
+    buckets = {}
+    radii = []
+    for column, target in enumerate(targets):
+        radius = INF
+        settled = 0
+        for node, distance, _ in iter_dijkstra(reverse_graph, target, heap_class()):
+            if settled >= ball_size:
+                radius = distance  # First node left outside the ball
+                break
+            buckets.setdefault(node, []).append((column, distance))
+            settled += 1
+        radii.append(radius)
+    return buckets, radii
+
+def _stop_bound(best, radii):
+    """Return the forward distance at which every target's distance is final."""
+    INF = float('inf')
+    bound = -INF
+    for upper, radius in zip(best, radii):
+        if radius != INF and upper - radius > bound:
+            bound = upper - radius
+    return bound
+
+def _forward_search(graph, origin, heap, buckets, radii):
+    """Dijkstra from origin that stops once every target distance is final.
+
+    A target's best known distance is lowered whenever a relaxed node is in
+    its bucket. It is final once the search radius plus the target's ball
+    radius reaches it: any shorter path would have to cross an edge from a
+    settled node into the ball, and that edge has already been scanned.
+
+    Returns:
+        List of distances to the targets, by column.
+    """
+    INF = float('inf')
+    best = [INF] * len(radii)
+    for column, distance in buckets.get(origin, ()):
+        best[column] = min(best[column], distance)
+
+    distances = {origin: 0}  # Tentative distances of touched nodes only
+    heap.push(0, origin)
+    bound = _stop_bound(best, radii)
+
+    while not heap.is_empty():
+        current_node, current_distance = heap.pop()
+
+        # Skip if we've already found a better path
+        if current_distance > distances.get(current_node, INF):
+            continue
+        if current_distance >= bound:
+            # best only ever decreases, so recompute the bound lazily
+            bound = _stop_bound(best, radii)
+            if current_distance >= bound:
+                break
+
+        for neighbor, weight in graph.get(current_node, []):
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, INF):
+                distances[neighbor] = distance
+                for column, to_target in buckets.get(neighbor, ()):
+                    if distance + to_target < best[column]:
+                        best[column] = distance + to_target
+                if hasattr(heap, 'contains') and heap.contains(neighbor):
+                    heap.decrease_key(neighbor, distance)
+                else:
+                    heap.push(distance, neighbor)
+    return best
+
+def distance_matrix(graph, origins, targets, heap_type="BinaryHeap", out=None, ball_size=1, reverse_graph=None):
+    """Shortest distances from every origin to every target.
+
+    Each origin gets one forward search that stops as soon as all target
+    distances are final instead of settling the whole graph. With
+    ball_size > 1, a backward search of ball_size nodes is run once per
+    target and its nodes are put in buckets; forward searches then meet
+    these balls and can stop up to one ball radius earlier, so the
+    backward work is shared by all origins.
+
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of
+              (neighbor, weight) tuples.
+        origins: Iterable of origin nodes (rows).
+        targets: Iterable of target nodes (columns).
+        heap_type: Name of the heap to use, a key of HEAP_TYPES. The early
+                  stop needs pops in nondecreasing order, which every
+                  HEAP_TYPES heap provides.
+        out: Optional preallocated float64 array of shape
+            (len(origins), len(targets)) to write into.
+        ball_size: Number of nodes settled in each target's backward ball;
+                  1 keeps only the target itself.
+        reverse_graph: Graph with every edge reversed, needed only for
+                      directed graphs (defaults to graph).
+
+    Returns:
+        The distance matrix (out if given), with inf for unreachable pairs.
+    """
+    if heap_type not in HEAP_TYPES:
+        raise ValueError(f"Unknown heap type: {heap_type}")
+    if ball_size < 1:
+        raise ValueError("ball_size must be at least 1")
+
+    origins, targets = list(origins), list(targets)
+    shape = (len(origins), len(targets))
+    if out is None:
+        out = np.empty(shape, dtype=np.float64)
+    elif out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+
+    heap_class = HEAP_TYPES[heap_type]
+    buckets, radii = _target_balls(
+        graph if reverse_graph is None else reverse_graph, targets, heap_class, ball_size
+    )
+    for row, origin in enumerate(origins):
+        out[row] = _forward_search(graph, origin, heap_class(), buckets, radii)
+    return out
@@ -0,0 +1,245 @@
+import cProfile
+import os
+import pstats
+import signal
+import sys
+import time
+from collections import Counter
+
+from src.dense_dijkstra import build_weight_matrix, dense_dijkstra_shortest_path, DENSE_MAX_NODES
+from src.dijkstra import dijkstra_shortest_path
+from src.helper import Colors, _filled_heap
+from src.load_graph import load_graph
+
+# Stack samplers for the collapsed-stack output
+SAMPLERS = ["signal", "setprofile", "none"]
+
+# Default directory of the profile files
+PROFILE_DIR = os.path.join("results", "profiles")
+
+def _frame_name(code):
+    """Collapsed-stack name of a code object, e.g. binary_heap.py:BinaryHeap._bubble_down."""
+    return f"{os.path.basename(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}"
+
+def _stack(frame, root):
+    """
+    Semicolon-joined stack of frame, from below the profiled function down to frame.
+
+    The profiled function is the one called by root's frame; it is left out
+    of the stack. Returns None if root is not on the stack.
+    """
+    names = []
+    while frame is not None and frame.f_code is not root:
+        names.append(_frame_name(frame.f_code))
+        frame = frame.f_back
+    if frame is None:
+        return None
+    return ";".join(reversed(names[:-1]))
+
+def _call(run, argument):
+    """Root frame of every recorded stack."""
+    return run(argument)
+
+def sample_stacks(run, setup=None, interval=0.001, min_seconds=1.0):
+    """
+    Sample the call stacks of run(setup()) with a SIGPROF interval timer.
+
+    The run is repeated until the runs have taken at least min_seconds, so
+    short searches still collect enough samples; samples taken in setup are
+    dropped. Unix only, main thread only.
+
+    Args:
+        run: Function to profile, taking the result of setup.
+        setup: Optional unprofiled function called before every run
+              (run gets None without one).
+        interval: CPU seconds between samples.
+        min_seconds: Minimum total wall time of the repeated runs.
+
+    Returns:
+        Counter mapping collapsed stacks ("outer;...;inner") to sample counts.
+    """
+    stacks = Counter()
+
+    def handler(signum, frame):
+        stack = _stack(frame, _call.__code__)
+        if stack:
+            stacks[stack] += 1
+
+    previous = signal.signal(signal.SIGPROF, handler)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        elapsed = 0.0
+        while True:
+            argument = setup() if setup else None
+            start = time.perf_counter()
+            _call(run, argument)
+            elapsed += time.perf_counter() - start
+            if elapsed >= min_seconds:
+                break
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous)
+    return stacks
+
+def trace_stacks(run, setup=None):
+    """
+    Attribute the self time of run(setup()) to exact call stacks with sys.setprofile.
+
+    Deterministic and portable, but every call pays the tracing overhead,
+    which inflates small functions.
+
+    Args:
+        run: Function to profile, taking the result of setup.
+        setup: Optional untraced function called before the run.
+
+    Returns:
+        Counter mapping collapsed stacks to self time in microseconds.
+    """
+    stacks = Counter()
+    stack = []
+    last = [0]
+
+    def tracer(frame, event, arg):
+        now = time.perf_counter_ns()
+        if len(stack) > 1:  # Below run itself
+            stacks[";".join(stack[1:])] += now - last[0]
+        if event == 'call':
+            stack.append(_frame_name(frame.f_code))
+        elif event == 'c_call':
+            stack.append(f"<built-in>:{getattr(arg, '__qualname__', arg.__name__)}")
+        elif event in ('return', 'c_return', 'c_exception') and stack:
+            stack.pop()
+        last[0] = time.perf_counter_ns()
+
+    argument = setup() if setup else None
+    last[0] = time.perf_counter_ns()
+    sys.setprofile(tracer)
+    try:
+        run(argument)
+    finally:
+        sys.setprofile(None)
+    # The trailing setprofile(None) call is not part of the run
+    stacks.pop("<built-in>:setprofile", None)
+    return Counter({stack: nanoseconds // 1000 for stack, nanoseconds in stacks.items() if nanoseconds >= 1000})
+
+def hot_functions(stats, top=10):
+    """
+    Functions with the most self time in a cProfile run.
+
+    Args:
+        stats: pstats.Stats of the run.
+        top: Number of functions to return.
+
+    Returns:
+        List of (name, self_seconds, share, calls) tuples, share being the
+        fraction of the total self time, hottest first.
+    """
+    entries = []
+    for (filename, _, function), (_, calls, self_time, _, _) in stats.stats.items():
+        name = function if filename == '~' else f"{os.path.basename(filename)}:{function}"
+        entries.append((name, self_time, calls))
+    total = sum(self_time for _, self_time, _ in entries) or 1.0
+    entries.sort(key=lambda entry: entry[1], reverse=True)
+    return [(name, self_time, self_time / total, calls) for name, self_time, calls in entries[:top]]
+
+def save_collapsed_stacks(stacks, path):
+    """Write stacks in the collapsed format read by flamegraph.pl and speedscope."""
+    with open(path, 'w') as f:
+        for stack, weight in sorted(stacks.items()):
+            f.write(f"{stack} {weight}\n")
+
+def profile_engine(graph, nodes, engine, source_node=0, sampler="signal", interval=0.001):
+    """
+    Profile one engine's search on a loaded graph.
+
+    The search runs once under cProfile; with a sampler it runs again to
+    collect collapsed call stacks. Building the heap (or weight matrix) is
+    not profiled, as it is not timed by the benchmark.
+
+    Args:
+        graph: Adjacency list where keys are nodes and values are lists of
+              (neighbor, weight) tuples.
+        nodes: List of nodes.
+        engine: A key of HEAP_TYPES or "DenseDijkstra".
+        source_node: Source node of the search.
+        sampler: "signal" (SIGPROF sampling), "setprofile" (exact traced
+                stacks) or "none".
+        interval: Sampling interval of the signal sampler, in seconds.
+
+    Returns:
+        Tuple of (stats, stacks): the pstats.Stats of the cProfile run and
+        the collapsed stacks (None without a sampler), or None if the dense
+        engine is skipped for the graph size.
+    """
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Unknown sampler {sampler!r}; expected one of {SAMPLERS}")
+    if engine == "DenseDijkstra":
+        if len(nodes) > DENSE_MAX_NODES:
+            return None
+        weight_matrix = build_weight_matrix(graph)
+        run = lambda _: dense_dijkstra_shortest_path(graph, source_node, weight_matrix)
+        setup = None
+    else:
+        run = lambda heap: dijkstra_shortest_path(graph, source_node, heap)
+        setup = lambda: _filled_heap(engine, nodes, source_node)
+
+    profiler = cProfile.Profile()
+    profiler.runcall(run, setup() if setup else None)
+    stats = pstats.Stats(profiler)
+
+    stacks = None
+    if sampler == "signal":
+        stacks = sample_stacks(run, setup, interval)
+    elif sampler == "setprofile":
+        stacks = trace_stacks(run, setup)
+    return stats, stacks
+
+def profile_datasets(datasets, engines, sources=None, result_dir=PROFILE_DIR, sampler="signal",
+                     interval=0.001, top=10):
+    """
+    Profile every engine on every dataset, save the profiles and print the hot functions.
+
+    For each (dataset, engine), <dataset>_<engine>.pstats (load it with
+    pstats or snakeviz) and, with a sampler, <dataset>_<engine>.folded
+    (collapsed stacks for flamegraph.pl or speedscope) are written to
+    result_dir.
+
+    Args:
+        datasets: List of (filepath, graph_size, graph_type) tuples.
+        engines: Engines to profile (keys of HEAP_TYPES or "DenseDijkstra").
+        sources: Optional dictionary mapping a dataset filepath to its
+                sampled sources; the first one is profiled (default node 0).
+        result_dir: Output directory.
+        sampler: Stack sampler (see profile_engine).
+        interval: Sampling interval of the signal sampler, in seconds.
+        top: Number of hot functions printed per profile.
+
+    Returns:
+        Dictionary mapping (filepath, engine) to the hot_functions list.
+    """
+    os.makedirs(result_dir, exist_ok=True)
+    hot = {}
+    for filepath, graph_size, graph_type in datasets:
+        graph, nodes = load_graph(filepath)
+        source = sources[filepath][0] if sources else 0
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        for engine in engines:
+            print(f"\n{Colors.MAGENTA}Profiling {engine} on {filepath} from source {source}...{Colors.RESET}")
+            profile = profile_engine(graph, nodes, engine, source, sampler, interval)
+            if profile is None:
+                print(f"Skipped ({graph_size} nodes is over the dense engine limit).")
+                continue
+            stats, stacks = profile
+            base = os.path.join(result_dir, f"{stem}_{engine}")
+            stats.dump_stats(base + ".pstats")
+            saved = [base + ".pstats"]
+            if stacks is not None:
+                save_collapsed_stacks(stacks, base + ".folded")
+                saved.append(base + ".folded")
+
+            hot[(filepath, engine)] = hot_functions(stats, top)
+            print(f"{'Share':>7} {'Self (s)':>10} {'Calls':>10}  Function")
+            for name, self_time, share, calls in hot[(filepath, engine)]:
+                print(f"{share:>7.1%} {self_time:>10.4f} {calls:>10}  {name}")
+            print(f"{Colors.BLUE}Profile saved to {', '.join(saved)}{Colors.RESET}")
+    return hot
@@ -1,7 +1,22 @@
-import math
+import struct
+
+# IEEE 754 bit patterns of non-negative doubles sort like the doubles themselves
+_DOUBLE = struct.Struct('<d')
+_INT64 = struct.Struct('<q')
+
+def _radix_key(priority):
+    """Order-preserving integer key of a non-negative finite priority."""
+    return _INT64.unpack(_DOUBLE.pack(priority))[0]
 
 class RadixHeap:
     """Robust Radix Heap implementation with proper position tracking.
+
+    A finite priority goes to the bucket numbered by the highest bit in which
+    its key differs from the key of the last popped priority (bucket 0 for
+    equal keys). Popping from bucket i only moves the remaining elements of
+    bucket i, and the other buckets stay valid, so pops come out in
+    nondecreasing priority order as long as pushes are not below the last
+    popped priority (smaller priorities are raised to it).
     
     Attributes:
         buckets: A list of 65 buckets (0-63 for finite priorities, 64 for infinity).
@@ -18,11 +33,22 @@ class RadixHeap:
         self.position_map = {}  # {value: (bucket_idx, position)}
         self.size = 0
         self.last_popped = 0
+        self._last_key = 0
 
     def is_empty(self):
         """Check if the heap is empty."""
         return self.size == 0
 
+    def clear(self):
+        """Remove all elements, keeping the allocated buckets for reuse."""
+        for bucket in self.buckets:
+            bucket.clear()
+        self.min_priority = None
+        self.position_map.clear()
+        self.size = 0
+        self.last_popped = 0
+        self._last_key = 0
+
     def push(self, priority, value):
         """Push a value with given priority into the heap.
         
@@ -42,13 +68,9 @@ class RadixHeap:
         if priority == float('inf'):
             bucket_idx = 64
         else:
-            priority = max(priority, self.last_popped)
-            # Calculate diff relative to the last popped priority
-            if self.last_popped is None:
-                diff = priority
-            else:
-                diff = priority - self.last_popped
-            bucket_idx = min(63, self._get_bucket_idx(diff))
+            if priority <= self.last_popped:
+                priority = self.last_popped
+            bucket_idx = self._get_bucket_idx(priority)
         
         # Add to bucket
         self.buckets[bucket_idx].append((priority, value))
@@ -87,6 +109,8 @@ class RadixHeap:
         # Remove the element
         self._remove_from_bucket(bucket_idx, min_idx)
         self.last_popped = min_priority
+        if bucket_idx < 64:
+            self._last_key = _radix_key(min_priority)
         
         # Redistribute remaining elements if needed
         if bucket_idx > 0 and bucket_idx < 64 and self.buckets[bucket_idx]:
@@ -156,30 +180,20 @@ class RadixHeap:
         self.buckets[bucket_idx] = []  # Clear the bucket
         
         for priority, value in elements:
-            diff = priority - self.last_popped
-            new_bucket = min(63, self._get_bucket_idx(diff))
+            new_bucket = self._get_bucket_idx(priority)
             self.buckets[new_bucket].append((priority, value))
             self.position_map[value] = (new_bucket, len(self.buckets[new_bucket])-1)
 
-    def _get_bucket_idx(self, diff):
-        """Calculate bucket index for a given difference.
+    def _get_bucket_idx(self, priority):
+        """Calculate bucket index for a finite priority.
         
         Args:
-            diff: The difference between priority and last_popped.
+            priority: A priority not below last_popped.
             
         Returns:
-            The appropriate bucket index (0-64).
+            The appropriate bucket index (0-63).
         """
-        if diff <= 0:
-            return 0
-        # Handle negative diff by using absolute value
-        abs_diff = abs(diff)
-        if isinstance(abs_diff, int):
-            return min(63, abs_diff.bit_length())
-        try:
-            return min(63, math.floor(math.log2(abs_diff)) + 1)
-        except (ValueError, OverflowError):
-            return 64
+        return (_radix_key(priority) ^ self._last_key).bit_length()
 
     def __len__(self):
         """Return the number of elements in the heap."""
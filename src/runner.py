@@ -0,0 +1,229 @@
+import os
+import statistics
+import time
+from collections import Counter, defaultdict
+from multiprocessing.connection import wait
+
+from src.batch import _pool_context
+from src.helper import Colors, EXPERIMENT_ENGINES, measure_engine, summarize_times, sample_nodes
+from src.load_graph import load_graph
+
+# Run statuses
+OK = "ok"
+TIMED_OUT = "timed out"
+FAILED = "failed"
+
+# Default per-run timeout of the menu benchmark, in seconds
+RUN_TIMEOUT = 1800
+
+def _run_isolated(conn, task, cpu, warmup, memory_samples):
+    """Worker process: measure one (data_file, engine, source, repeat) task and send the result."""
+    data_file, engine, source, repeat = task
+    try:
+        if cpu is not None:
+            os.sched_setaffinity(0, {cpu})
+        graph, nodes = load_graph(data_file)
+        # Memory passes and counters are taken once per engine, in the first repeat
+        measurement = measure_engine(graph, nodes, engine, source, warmup=warmup, repeats=1,
+                                     memory_samples=memory_samples, measure_memory=repeat == 0)
+        conn.send((OK, measurement))
+    except Exception as e:
+        conn.send((FAILED, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+def iter_isolated_runs(tasks, workers=None, pin=False, timeout=None, warmup=1, memory_samples=100):
+    """
+    Run benchmark tasks, each in a fresh process, and yield results as they complete.
+
+    At most workers processes run at once. A process that exceeds the
+    timeout (which includes loading the graph) is killed and its task
+    reported as timed out; one that dies or raises is reported as failed.
+
+    Args:
+        tasks: Iterable of (data_file, engine, source, repeat) tuples,
+              engine being a key of HEAP_TYPES or "DenseDijkstra". Repeat 0
+              also takes the memory measurements and operation counts.
+        workers: Maximum number of concurrent processes (None for one per CPU).
+        pin: Pin every process to its own CPU with os.sched_setaffinity
+            (Linux only); at most one process runs per available CPU.
+        timeout: Seconds after which a run is killed (None to wait forever).
+        warmup: Number of untimed runs before the timed one.
+        memory_samples: Approximate number of heap size samples per run.
+
+    Yields:
+        Tuples of (task, status, measurement): status is OK, TIMED_OUT or
+        FAILED; measurement is the measure_engine tuple, the error message
+        of a failed run, or None.
+    """
+    if pin and not hasattr(os, "sched_setaffinity"):
+        raise ValueError("CPU pinning needs os.sched_setaffinity (Linux)")
+    free_cpus = sorted(os.sched_getaffinity(0), reverse=True) if pin else []
+    if workers is None:
+        workers = len(free_cpus) if pin else os.cpu_count() or 1
+    if pin:
+        workers = min(workers, len(free_cpus))
+
+    ctx = _pool_context()
+    pending = list(tasks)[::-1]
+    running = {}  # Result connection -> (task, process, deadline, cpu)
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                task = pending.pop()
+                cpu = free_cpus.pop() if pin else None
+                reader, writer = ctx.Pipe(duplex=False)
+                process = ctx.Process(target=_run_isolated, args=(writer, task, cpu, warmup, memory_samples),
+                                      daemon=True)
+                process.start()
+                writer.close()  # Before the next fork, so a dead worker's pipe reports EOF
+                deadline = time.monotonic() + timeout if timeout is not None else None
+                running[reader] = (task, process, deadline, cpu)
+
+            deadlines = [deadline for _, _, deadline, _ in running.values() if deadline is not None]
+            ready = wait(list(running), max(0, min(deadlines) - time.monotonic()) if deadlines else None)
+            now = time.monotonic()
+            for conn in list(running):
+                task, process, deadline, cpu = running[conn]
+                if conn in ready:
+                    try:
+                        status, measurement = conn.recv()
+                    except EOFError:
+                        process.join()
+                        status, measurement = FAILED, f"worker exited with code {process.exitcode}"
+                elif deadline is not None and now >= deadline:
+                    process.kill()
+                    status, measurement = TIMED_OUT, None
+                else:
+                    continue
+                process.join()
+                conn.close()
+                del running[conn]
+                if cpu is not None:
+                    free_cpus.append(cpu)
+                yield task, status, measurement
+    finally:
+        for conn, (_, process, _, _) in running.items():
+            process.kill()
+            process.join()
+            conn.close()
+
+def sample_sources(datasets, count, seed=0):
+    """
+    Draw the same seeded sources for every engine of each dataset.
+
+    Sources are drawn from the node list of each loaded graph, so datasets
+    whose nodes are not numbered 0..n-1 get valid sources too.
+
+    Args:
+        datasets: List of (filepath, graph_size, graph_type) tuples.
+        count: Number of sources per dataset (capped at the number of nodes).
+        seed: Seed of the sampling; the same seed gives the same sources.
+
+    Returns:
+        Dictionary mapping each filepath to its sorted list of sources.
+    """
+    sources = {}
+    for filepath, _, _ in datasets:
+        _, nodes = load_graph(filepath)
+        sources[filepath] = sample_nodes(nodes, count, seed)
+    return sources
+
+def source_records(runs):
+    """
+    Reduce isolated runs to one record per (dataset, engine, source).
+
+    Args:
+        runs: (filepath, engine, source, repeat, status, seconds, reached)
+             tuples, as returned by run_isolated_benchmark.
+
+    Returns:
+        List of (filepath, engine, source, seconds, reached) records for
+        print_source_summary: seconds is the median over completed repeats
+        (NaN if none completed), reached comes from repeat 0.
+    """
+    grouped = defaultdict(lambda: ([], None))
+    for filepath, engine, source, repeat, status, seconds, reached in runs:
+        times, count = grouped[filepath, engine, source]
+        if status == OK:
+            times.append(seconds)
+        grouped[filepath, engine, source] = (times, reached if reached is not None else count)
+    return [
+        (filepath, engine, source, statistics.median(times) if times else float('nan'), reached)
+        for (filepath, engine, source), (times, reached) in sorted(grouped.items())
+    ]
+
+def _combine_repeats(runs):
+    """Merge the single-run measurements of one (dataset, engine) into one run_experiment entry.
+
+    runs holds ((source, repeat), status, measurement) tuples; memory and
+    counters come from repeat 0 of the lowest-numbered source.
+    """
+    nan = float('nan')
+    if not runs or any(status != OK for _, status, _ in runs):
+        return (nan,) * 6 + (Counter(),)
+    runs = sorted(runs, key=lambda run: (run[0][1], run[0][0]))
+    median, iqr, minimum = summarize_times([measurement[0] for _, _, measurement in runs])
+    _, memory, _, _, working_set, rss, counters = runs[0][2]
+    return (median, memory, iqr, minimum, working_set, rss, counters)
+
+def run_isolated_benchmark(datasets, repeats=5, workers=None, pin=False, timeout=None, warmup=1,
+                           memory_samples=100, engines=None, sources=None):
+    """
+    Benchmark every engine on every dataset with one fresh process per run.
+
+    Unlike calling run_experiment per dataset, no run sees the garbage or
+    allocator state of another, peak RSS is per engine, and a slow engine
+    only delays its own runs. Running several processes at once shares
+    caches and memory bandwidth, so use pin=True (or workers=1) for the
+    most stable times.
+
+    Args:
+        datasets: List of (filepath, graph_size, graph_type) tuples, as
+                 returned by get_available_datasets.
+        repeats: Number of timed runs (processes) per dataset, engine and source.
+        workers, pin, timeout, warmup, memory_samples: See iter_isolated_runs.
+        engines: Engines to run (default all of EXPERIMENT_ENGINES); the
+                others get NaN entries.
+        sources: Dictionary mapping a filepath to its list of source nodes
+                (default source 0); times are pooled over all sources.
+
+    Returns:
+        Tuple of (results, runs): results is a list of (graph_size,
+        graph_type, radix, binary, d_heap, fibonacci, dense) tuples as the
+        menu builds from run_experiment, with NaN measurements for engines
+        that were not run or had a run time out or fail; runs is a list of
+        (filepath, engine, source, repeat, status, seconds, reached) tuples
+        in completion order (seconds NaN unless completed, reached-node
+        count only for completed repeat 0 runs, else None).
+    """
+    engines = EXPERIMENT_ENGINES if engines is None else engines
+    sources = sources or {}
+    tasks = [(filepath, engine, source, repeat)
+             for filepath, _, _ in datasets
+             for engine in engines
+             for source in sources.get(filepath, [0])
+             for repeat in range(repeats)]
+    collected = defaultdict(list)
+    runs = []
+    done = 0
+    for (filepath, engine, source, repeat), status, measurement in iter_isolated_runs(
+            tasks, workers, pin, timeout, warmup, memory_samples):
+        done += 1
+        collected[filepath, engine].append(((source, repeat), status, measurement))
+        seconds = measurement[0] if status == OK else float('nan')
+        reached = measurement[6].get('reached') if status == OK and repeat == 0 else None
+        runs.append((filepath, engine, source, repeat, status, seconds, reached))
+        label = f"[{done}/{len(tasks)}] {filepath} {engine} source {source} #{repeat}"
+        if status == OK:
+            print(f"{label}: {measurement[0]:.6f} seconds")
+        else:
+            detail = f" ({measurement})" if measurement else ""
+            print(f"{Colors.RED}{label}: {status}{detail}{Colors.RESET}")
+
+    results = [
+        (graph_size, graph_type) + tuple(_combine_repeats(collected[filepath, engine])
+                                         for engine in EXPERIMENT_ENGINES)
+        for filepath, graph_size, graph_type in datasets
+    ]
+    return results, runs
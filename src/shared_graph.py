@@ -0,0 +1,139 @@
+import atexit
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from src.csr_graph import CSRGraph
+
+# Header: n, m, flag telling whether node ids are 0..n-1 (then no id array is stored)
+_HEADER = np.dtype([("n", np.int64), ("m", np.int64), ("dense_ids", np.int64)])
+
+def _attach_untracked(name):
+    """Open an existing segment and take it off the resource tracker.
+
+    Only the publishing process owns the segment; if attaching processes
+    stayed registered, the tracker would unlink it (and warn about a leak)
+    as soon as any of them exits.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    shm = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+class SharedGraph:
+    """
+    A CSR graph stored in one multiprocessing.shared_memory segment.
+
+    The owner publishes a graph with SharedGraph.publish(); worker processes
+    open it with SharedGraph.attach(name) and get a CSRGraph whose arrays are
+    views of the shared segment, so the adjacency is never copied or pickled.
+    Node ids must be integers.
+
+    The owner unlinks the segment on close() (or at interpreter exit if it
+    was never closed); attached processes only unmap it. Arrays taken from
+    .graph must be dropped before close().
+
+    Attributes:
+        name: Name of the shared memory segment, passed to attach().
+        graph: CSRGraph backed by the shared segment.
+        owner: True for the publishing process.
+    """
+
+    def __init__(self, shm, owner):
+        """Wrap an open segment; use publish() or attach() instead."""
+        self._shm = shm
+        self.name = shm.name
+        self.owner = owner
+        self.graph = self._map_graph()
+        if owner:
+            atexit.register(self.close)
+
+    @classmethod
+    def publish(cls, graph, name=None):
+        """
+        Copy a graph into a new shared memory segment.
+
+        Args:
+            graph: Adjacency list (as from load_graph) or a CSRGraph.
+            name: Optional segment name; a random one is chosen by default.
+
+        Returns:
+            The owning SharedGraph.
+        """
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+        n, m = csr.num_nodes, csr.num_edges
+        dense_ids = isinstance(csr.nodes, range)
+
+        size = _HEADER.itemsize + 8 * ((0 if dense_ids else n) + (n + 1) + m + m)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray(1, dtype=_HEADER, buffer=shm.buf)
+        header[0] = (n, m, int(dense_ids))
+        del header
+
+        arrays = cls._layout(shm.buf, n, m, dense_ids)
+        if not dense_ids:
+            arrays["nodes"][:] = csr.nodes
+        arrays["indptr"][:] = csr.indptr
+        arrays["indices"][:] = csr.indices
+        arrays["weights"][:] = csr.weights
+        del arrays
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attach to a graph published by another process, without copying it.
+
+        Args:
+            name: The name of the published segment.
+
+        Returns:
+            A non-owning SharedGraph.
+        """
+        return cls(_attach_untracked(name), owner=False)
+
+    @staticmethod
+    def _layout(buf, n, m, dense_ids):
+        """Return numpy views of the arrays stored after the header."""
+        arrays = {}
+        offset = _HEADER.itemsize
+        fields = [("nodes", np.int64, 0 if dense_ids else n),
+                  ("indptr", np.int64, n + 1),
+                  ("indices", np.int64, m),
+                  ("weights", np.float64, m)]
+        for field, dtype, length in fields:
+            arrays[field] = np.ndarray(length, dtype=dtype, buffer=buf, offset=offset)
+            offset += 8 * length
+        return arrays
+
+    def _map_graph(self):
+        """Build the CSRGraph view over the segment."""
+        header = np.ndarray(1, dtype=_HEADER, buffer=self._shm.buf)
+        n, m, dense_ids = (int(x) for x in header[0])
+        del header
+        arrays = self._layout(self._shm.buf, n, m, bool(dense_ids))
+        nodes = range(n) if dense_ids else arrays["nodes"].tolist()
+        return CSRGraph(nodes, arrays["indptr"], arrays["indices"], arrays["weights"])
+
+    def close(self):
+        """Unmap the segment, and unlink it if this process owns it."""
+        if self._shm is None:
+            return
+        self.graph = None  # Release the views before unmapping
+        self._shm.close()
+        if self.owner:
+            # Child processes share the owner's tracker, so an attach may have
+            # dropped the registration that unlink() is about to remove
+            resource_tracker.register(self._shm._name, "shared_memory")
+            self._shm.unlink()
+            atexit.unregister(self.close)
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,179 @@
+from array import array
+from collections import OrderedDict
+
+from src.dijkstra import dijkstra_shortest_path
+from src.load_graph import HEAP_TYPES
+
+# Rough per-entry bookkeeping cost (key tuple, OrderedDict slot, array headers)
+_ENTRY_OVERHEAD = 256
+
+class SSSPCache:
+    """
+    Memoizing front end for dijkstra_shortest_path.
+
+    Results are keyed by (graph identity, graph version, source, heap type,
+    cutoffs) and stored compactly: a full run as one array('d') in graph
+    node order, a cut-off run as parallel arrays of node indices and
+    distances. Entries are evicted least-recently-used once their total
+    size exceeds byte_budget.
+
+    Graphs are plain dictionaries, so the cache cannot see them change:
+    whoever mutates a graph calls invalidate(graph) (DynamicSSSP does this
+    when given the cache), which bumps its version and drops its entries.
+
+    Dictionaries cannot be weakly referenced, so the cache holds a strong
+    reference to every graph it has entries for (this also keeps id(graph)
+    from being reused by another object). A graph is released once its last
+    entry is evicted or dropped, or by forget() and clear().
+
+    Every call returns a new dictionary rebuilt from the stored arrays, so
+    callers may modify the result without affecting the cache.
+
+    Attributes:
+        byte_budget: Maximum total size of the stored arrays, in bytes.
+        current_bytes: Current total size of the stored arrays.
+        hits, misses, evictions: Counters since creation (or reset_stats()).
+    """
+
+    def __init__(self, byte_budget=64 * 2**20):
+        """Initialize an empty cache with the given byte budget."""
+        self.byte_budget = byte_budget
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (kind, arrays, nbytes)
+        self._graphs = {}  # id(graph) -> [graph, version, nodes, node_index, entry count]
+
+    def get(self, graph, source, heap_type="BinaryHeap", max_distance=None, max_settled=None):
+        """
+        Return shortest distances from source, running a search only on a miss.
+
+        Args:
+            graph: Adjacency list where keys are nodes and values are lists of
+                  (neighbor, weight) tuples.
+            source: The source node.
+            heap_type: Name of the heap to use on a miss, a key of HEAP_TYPES.
+            max_distance, max_settled: Cutoffs, as for dijkstra_shortest_path.
+
+        Returns:
+            New dictionary of distances, as dijkstra_shortest_path would
+            return (a full result is in graph node order).
+        """
+        info = self._graph_info(graph)
+        key = (id(graph), info[1], source, heap_type, max_distance, max_settled)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._expand(info, entry)
+
+        self.misses += 1
+        distances = dijkstra_shortest_path(
+            graph, source, HEAP_TYPES[heap_type](), max_distance=max_distance, max_settled=max_settled
+        )
+        entry = self._compact(info, distances, full=max_distance is None and max_settled is None)
+        if not self._store(key, entry):
+            self._release(key[0])
+        return self._expand(info, entry)
+
+    def invalidate(self, graph):
+        """Drop every entry for graph and bump its version (call after mutating it)."""
+        info = self._graphs.get(id(graph))
+        if info is None:
+            return
+        info[1] += 1
+        info[2] = info[3] = None  # Nodes may have changed too
+        for key in [key for key in self._entries if key[0] == id(graph)]:
+            self._drop(key)
+
+    def forget(self, graph):
+        """Drop every entry for graph and stop tracking it."""
+        self.invalidate(graph)
+        self._graphs.pop(id(graph), None)
+
+    def clear(self):
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+        self._graphs.clear()
+        self.current_bytes = 0
+
+    def reset_stats(self):
+        """Reset the hit, miss and eviction counters."""
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return a dictionary of counters and current usage."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+        }
+
+    def __len__(self):
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    def _graph_info(self, graph):
+        """Return [graph, version, nodes, node_index, entry count] for graph, tracking it if new."""
+        info = self._graphs.get(id(graph))
+        if info is None:
+            # Holding the graph keeps id(graph) from being reused by another object
+            info = self._graphs[id(graph)] = [graph, 0, None, None, 0]
+        if info[2] is None:
+            info[2] = list(graph)
+            info[3] = {node: i for i, node in enumerate(info[2])}
+        return info
+
+    def _compact(self, info, distances, full):
+        """Convert a distances dictionary to ('full' | 'sparse', arrays, nbytes)."""
+        if full:
+            arrays = (array('d', (distances[node] for node in info[2])),)
+            kind = 'full'
+        else:
+            node_index = info[3]
+            arrays = (array('q', (node_index[node] for node in distances)),
+                      array('d', distances.values()))
+            kind = 'sparse'
+        nbytes = sum(len(a) * a.itemsize for a in arrays) + _ENTRY_OVERHEAD
+        return kind, arrays, nbytes
+
+    def _expand(self, info, entry):
+        """Rebuild the distances dictionary from a compact entry."""
+        kind, arrays, _ = entry
+        nodes = info[2]
+        if kind == 'full':
+            return dict(zip(nodes, arrays[0]))
+        return {nodes[i]: distance for i, distance in zip(*arrays)}
+
+    def _store(self, key, entry):
+        """Insert an entry and evict least-recently-used ones over the budget; return whether it was kept."""
+        nbytes = entry[2]
+        if nbytes > self.byte_budget:
+            return False  # Would evict everything and still not fit
+        self._entries[key] = entry
+        self._graphs[key[0]][4] += 1
+        self.current_bytes += nbytes
+        while self.current_bytes > self.byte_budget:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+        return True
+
+    def _drop(self, key):
+        """Remove one entry and release its bytes."""
+        _, _, nbytes = self._entries.pop(key)
+        self.current_bytes -= nbytes
+        info = self._graphs.get(key[0])
+        if info is not None:
+            info[4] -= 1
+            self._release(key[0])
+
+    def _release(self, graph_id):
+        """Stop tracking a graph (and referencing it) once it has no entries left."""
+        info = self._graphs.get(graph_id)
+        if info is not None and info[4] == 0:
+            del self._graphs[graph_id]
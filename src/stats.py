@@ -1,52 +1,165 @@
-import csv, os
+import csv, json, math, os
 from src.helper import Colors
+from src.load_graph import dataset_edge_count
 from collections import defaultdict
 import matplotlib.pyplot as plt
+from collections import Counter
 
-def save_results_to_csv(results, filename):
+# Engines of a result tuple, in order, and the JSON names of their measurements
+RESULT_ENGINES = ["RadixHeap", "BinaryHeap", "DHeap", "FibonacciHeap", "DenseDijkstra"]
+_MEASUREMENT_KEYS = ["time_median", "heap_memory", "time_iqr", "time_min", "working_set", "peak_rss"]
+
+def save_results_to_csv(results, filename, result_dir="results"):
     """Save experiment results to a CSV file.
     
     Args:
         results: List of tuples containing:
                 (graph_size, graph_type, 
-                 (radix_time, radix_memory), 
-                 (binary_time, binary_memory),
-                 (d_heap_time, d_heap_memory),
-                 (fibonacci_time, fibonacci_memory))
+                 radix, binary, d_heap, fibonacci, dense)
+                where each engine entry is the (time, memory, time_iqr,
+                time_min, working_set, peak_rss, counters) tuple from
+                run_experiment. Every counter seen for an engine gets a
+                column (0 where a row lacks it).
         filename: Base name for the output file (without extension).
+        result_dir: Directory of the output file.
     """
-    result_dir = "results"
     filename = filename + ".csv"
     filename = os.path.join(result_dir, filename)
     os.makedirs(result_dir, exist_ok=True)
+    engines = RESULT_ENGINES
+    counter_names = [
+        sorted({name for item in results for name in item[2 + i][6]})
+        for i in range(len(engines))
+    ]
     with open(filename, 'w', newline='') as f:
         writer = csv.writer(f)
-        writer.writerow([
-            "Graph Size", 
-            "Graph Type",
-            "RadixHeap Time (s)", "RadixHeap Memory (B)", 
-            "BinaryHeap Time (s)", "BinaryHeap Memory (B)", 
-            "DHeap Time (s)", "DHeap Memory (B)", 
-            "FibonacciHeap Time (s)", "FibonacciHeap Memory (B)"
-        ])
+        header = ["Graph Size", "Graph Type"]
+        for engine in engines:
+            header += [
+                f"{engine} Time Median (s)", f"{engine} Time IQR (s)",
+                f"{engine} Time Min (s)", f"{engine} Heap Memory (B)",
+                f"{engine} Working Set (B)", f"{engine} Peak RSS (B)"
+            ]
+        for engine, names in zip(engines, counter_names):
+            header += [f"{engine} {name}" for name in names]
+        writer.writerow(header)
         flattened_results = [
-            (item[0], item[1], item[2][0], item[2][1], item[3][0], item[3][1], 
-            item[4][0], item[4][1], item[5][0], item[5][1])
+            [item[0], item[1]] + [
+                value
+                for time, memory, time_iqr, time_min, working_set, rss, _ in item[2:]
+                for value in (time, time_iqr, time_min, memory, working_set, rss)
+            ] + [
+                engine_result[6].get(name, 0)
+                for engine_result, names in zip(item[2:], counter_names)
+                for name in names
+            ]
             for item in results
         ]
         writer.writerows(flattened_results)
     
     print(f"{Colors.BLUE}Results saved to {filename}.{Colors.RESET}")
 
+def save_results_to_json(results, path, datasets=None, runs=None, params=None):
+    """Save experiment results, and optionally the individual runs, to a JSON file.
+
+    NaN measurements (engines not run, skipped or timed out) are written as null.
+
+    Args:
+        results: List of result tuples (same format as save_results_to_csv).
+        path: Output file path.
+        datasets: Optional list of (filepath, graph_size, graph_type) tuples,
+                 one per result, to record the dataset files and their
+                 edge counts.
+        runs: Optional list of (filepath, engine, source, repeat, status,
+             seconds, reached) tuples, as returned by run_isolated_benchmark.
+        params: Optional dictionary of benchmark parameters to record.
+    """
+    def number(value):
+        return None if isinstance(value, float) and math.isnan(value) else value
+
+    document = {
+        "params": params or {},
+        "results": [
+            {
+                "dataset": datasets[i][0] if datasets else None,
+                "num_edges": dataset_edge_count(datasets[i][0]) if datasets else None,
+                "graph_size": item[0],
+                "graph_type": item[1],
+                "engines": {
+                    engine: dict(
+                        {key: number(value) for key, value in zip(_MEASUREMENT_KEYS, entry[:6])},
+                        counters=dict(entry[6])
+                    )
+                    for engine, entry in zip(RESULT_ENGINES, item[2:])
+                },
+            }
+            for i, item in enumerate(results)
+        ],
+        "runs": [
+            {"dataset": filepath, "engine": engine, "source": source, "repeat": repeat, "status": status,
+             "seconds": number(seconds), "reached": reached}
+            for filepath, engine, source, repeat, status, seconds, reached in runs or []
+        ],
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2)
+    print(f"{Colors.BLUE}Results saved to {path}.{Colors.RESET}")
+
+def save_source_results_to_csv(records, filename, result_dir="results"):
+    """Save per-source results to a CSV file.
+
+    Args:
+        records: (data_file, engine, source, seconds, reached) tuples, as
+                collected by run_experiment or source_records.
+        filename: Base name for the output file (without extension).
+        result_dir: Directory of the output file.
+    """
+    filename = os.path.join(result_dir, filename + ".csv")
+    os.makedirs(result_dir, exist_ok=True)
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Dataset", "Engine", "Source", "Time (s)", "Reached Nodes"])
+        writer.writerows(records)
+    print(f"{Colors.BLUE}Per-source results saved to {filename}.{Colors.RESET}")
+
+def load_results_from_json(path):
+    """Load results written by save_results_to_json.
 
-def plot_results(results, filename):
+    Args:
+        path: JSON file path.
+
+    Returns:
+        Tuple of (results, document): results in the save_results_to_csv
+        format (null measurements read back as NaN), document the whole
+        parsed file.
+    """
+    with open(path) as f:
+        document = json.load(f)
+    nan = float('nan')
+    results = []
+    for item in document["results"]:
+        entries = []
+        for engine in RESULT_ENGINES:
+            entry = item["engines"].get(engine, {})
+            values = tuple(nan if entry.get(key) is None else entry[key] for key in _MEASUREMENT_KEYS)
+            entries.append(values + (Counter(entry.get("counters", {})),))
+        results.append((item["graph_size"], item["graph_type"]) + tuple(entries))
+    return results, document
+
+
+def plot_results(results, filename, result_dir="results", fits=None):
     """Plot experiment results with time and memory comparisons.
     
     Args:
         results: List of experiment results (same format as save_results_to_csv).
         filename: Base name for output plot files.
+        result_dir: Directory of the output files.
+        fits: Optional fits from complexity.fit_results; each engine's
+             log-log fit (time ~ c * n^b) is overlaid as a dotted line.
     """
-    result_dir = "results"
     filename = os.path.join(result_dir, filename)
     os.makedirs(result_dir, exist_ok=True)
 
@@ -55,7 +168,8 @@ def plot_results(results, filename):
         "radix_times": [], "radix_memory": [],
         "binary_times": [], "binary_memory": [],
         "d_heap_times": [], "d_heap_memory": [],
-        "fibonacci_times": [], "fibonacci_memory": []
+        "fibonacci_times": [], "fibonacci_memory": [],
+        "dense_times": [], "dense_memory": []
     }))
 
     # Organize results by type and size
@@ -71,6 +185,8 @@ def plot_results(results, filename):
         group["d_heap_memory"].append(result[4][1])
         group["fibonacci_times"].append(result[5][0])
         group["fibonacci_memory"].append(result[5][1])
+        group["dense_times"].append(result[6][0])
+        group["dense_memory"].append(result[6][1])
 
     # Generate plots for each graph type
     for graph_type in type_grouped:
@@ -84,7 +200,9 @@ def plot_results(results, filename):
             "d_heap_time": [],
             "d_heap_memory": [],
             "fibonacci_time": [],
-            "fibonacci_memory": []
+            "fibonacci_memory": [],
+            "dense_time": [],
+            "dense_memory": []
         }
 
         # Calculate averages for each size
@@ -98,14 +216,24 @@ def plot_results(results, filename):
             avg_data["d_heap_memory"].append(sum(group["d_heap_memory"]) / len(group["d_heap_memory"]))
             avg_data["fibonacci_time"].append(sum(group["fibonacci_times"]) / len(group["fibonacci_times"]))
             avg_data["fibonacci_memory"].append(sum(group["fibonacci_memory"]) / len(group["fibonacci_memory"]))
+            avg_data["dense_time"].append(sum(group["dense_times"]) / len(group["dense_times"]))
+            avg_data["dense_memory"].append(sum(group["dense_memory"]) / len(group["dense_memory"]))
 
         # Plot time comparison
         plt.figure(figsize=(14, 6))
         plt.subplot(1, 2, 1)
-        plt.plot(sizes, avg_data["radix_time"], 'o-', label="Radix Heap")
-        plt.plot(sizes, avg_data["binary_time"], 'o-', label="Binary Heap")
-        plt.plot(sizes, avg_data["d_heap_time"], 'o-', label="D-Heap")
-        plt.plot(sizes, avg_data["fibonacci_time"], 'o-', label="Fibonacci Heap")
+        lines = [
+            plt.plot(sizes, avg_data["radix_time"], 'o-', label="Radix Heap")[0],
+            plt.plot(sizes, avg_data["binary_time"], 'o-', label="Binary Heap")[0],
+            plt.plot(sizes, avg_data["d_heap_time"], 'o-', label="D-Heap")[0],
+            plt.plot(sizes, avg_data["fibonacci_time"], 'o-', label="Fibonacci Heap")[0],
+            plt.plot(sizes, avg_data["dense_time"], 'o--', label="Dense (no heap)")[0],
+        ]
+        for engine, line in zip(RESULT_ENGINES, lines):
+            fit = (fits or {}).get((graph_type, engine), {}).get("n")
+            if fit is not None:
+                plt.plot(sizes, [fit["c"] * size ** fit["b"] for size in sizes], ':',
+                         color=line.get_color(), label=f"fit n^{fit['b']:.2f}")
 
         plt.xlabel("Graph Size (Number of Nodes)")
         plt.ylabel("Average Time Consumed (Seconds)")
@@ -115,17 +243,18 @@ def plot_results(results, filename):
         
         # Plot memory comparison as a bar chart
         plt.subplot(1, 2, 2)
-        bar_width = 0.2
+        bar_width = 0.16
         x_pos = range(len(sizes))
         
-        plt.bar([x - 1.5*bar_width for x in x_pos], avg_data["radix_memory"], width=bar_width, label="Radix Heap")
-        plt.bar([x - 0.5*bar_width for x in x_pos], avg_data["binary_memory"], width=bar_width, label="Binary Heap")
-        plt.bar([x + 0.5*bar_width for x in x_pos], avg_data["d_heap_memory"], width=bar_width, label="D-Heap")
-        plt.bar([x + 1.5*bar_width for x in x_pos], avg_data["fibonacci_memory"], width=bar_width, label="Fibonacci Heap")
+        plt.bar([x - 2*bar_width for x in x_pos], avg_data["radix_memory"], width=bar_width, label="Radix Heap")
+        plt.bar([x - 1*bar_width for x in x_pos], avg_data["binary_memory"], width=bar_width, label="Binary Heap")
+        plt.bar([x for x in x_pos], avg_data["d_heap_memory"], width=bar_width, label="D-Heap")
+        plt.bar([x + 1*bar_width for x in x_pos], avg_data["fibonacci_memory"], width=bar_width, label="Fibonacci Heap")
+        plt.bar([x + 2*bar_width for x in x_pos], avg_data["dense_memory"], width=bar_width, label="Dense (no heap)")
 
         plt.xticks(x_pos, sizes)
         plt.xlabel("Graph Size (Number of Nodes)")
-        plt.ylabel("Average Memory Consumed (Bytes)")
+        plt.ylabel("Average Heap Memory (Bytes)")
         plt.title(f"Memory Comparison\nGraph Type: {graph_type}")
         plt.legend()
         plt.grid(True)
@@ -153,7 +282,8 @@ def _plot_combined_results(type_grouped, filename):
         "Redix": ["radix_times", "radix_memory", "Radix Heap"],
         "Binary": ["binary_times", "binary_memory", "Binary Heap"],
         "DHeap": ["d_heap_times", "d_heap_memory", "D-Heap"],
-        "Fibonacci": ["fibonacci_times", "fibonacci_memory", "Fibonacci Heap"]
+        "Fibonacci": ["fibonacci_times", "fibonacci_memory", "Fibonacci Heap"],
+        "Dense": ["dense_times", "dense_memory", "Dense (no heap)"]
     }
 
     for key, value in heap_dicts.items():
@@ -0,0 +1,121 @@
+from src.binary_heap import BinaryHeap
+from src.dijkstra import has_dense_ids
+
+class DijkstraWorkspace:
+    """
+    Reusable state for many Dijkstra queries on one graph.
+
+    Distance and predecessor arrays are allocated once, indexed by dense node
+    id. Each entry carries the generation (query number) that last
+    wrote it, so starting a new query only bumps the generation instead of
+    resetting n entries; the heap is cleared in O(entries left in it).
+
+    Attributes:
+        nodes: List of node ids; position in the list is the dense index.
+        node_index: Dictionary mapping node ids to dense indices.
+        adjacency: List of (neighbor index, weight) lists, by dense index.
+        heap: The heap reused by every query.
+        generation: Number of the current (or last) query.
+    """
+
+    def __init__(self, graph, heap=None):
+        """
+        Bind a workspace to a graph.
+
+        Args:
+            graph: Adjacency list where keys are nodes and values are lists of
+                  (neighbor, weight) tuples.
+            heap: Heap object to reuse (must support clear() and pop in
+                 nondecreasing priority order, which the cutoffs rely on);
+                 defaults to a new BinaryHeap.
+        """
+        self.nodes = list(graph)
+        self.node_index = {node: i for i, node in enumerate(self.nodes)}
+        if has_dense_ids(self.nodes):
+            # Node ids are already dense indices: share the adjacency lists
+            self.adjacency = [graph[node] for node in self.nodes]
+        else:
+            self.adjacency = [
+                [(self.node_index[neighbor], weight) for neighbor, weight in graph[node]]
+                for node in self.nodes
+            ]
+        self.heap = heap if heap is not None else BinaryHeap()
+
+        n = len(self.nodes)
+        self.generation = 0
+        self._dist = [0] * n
+        self._pred = [-1] * n
+        self._touched = [0] * n  # Generation in which dist/pred were last written
+
+    def query(self, source, max_distance=None, max_settled=None):
+        """
+        Run Dijkstra from source, reusing the workspace arrays and heap.
+
+        Args:
+            source: The source node.
+            max_distance: Stop once the closest unsettled node is farther than this.
+            max_settled: Stop after settling this many nodes.
+
+        Returns:
+            Dictionary of settled nodes and their shortest distances, in settle order.
+        """
+        self.generation += 1
+        gen = self.generation
+        heap = self.heap
+        heap.clear()
+        has_contains = hasattr(heap, 'contains')
+
+        dist, pred, touched = self._dist, self._pred, self._touched
+        adjacency, nodes = self.adjacency, self.nodes
+
+        s = self.node_index[source]
+        dist[s], pred[s], touched[s] = 0, -1, gen
+        heap.push(0, s)
+        settled = {}
+
+        while not heap.is_empty():
+            u, d = heap.pop()
+            # Skip stale entries left by re-pushing instead of decreasing a key
+            if d > dist[u]:
+                continue
+            if max_distance is not None and d > max_distance:
+                break
+            settled[nodes[u]] = d
+            if max_settled is not None and len(settled) >= max_settled:
+                break
+
+            for v, weight in adjacency[u]:
+                distance = d + weight
+                if touched[v] != gen:
+                    touched[v], dist[v], pred[v] = gen, distance, u
+                    heap.push(distance, v)
+                elif distance < dist[v]:
+                    dist[v], pred[v] = distance, u
+                    if has_contains and heap.contains(v):
+                        heap.decrease_key(v, distance)
+                    else:
+                        heap.push(distance, v)
+
+        return settled
+
+    def distance(self, node):
+        """Return the tentative distance of node from the last query (inf if untouched)."""
+        i = self.node_index[node]
+        return self._dist[i] if self._touched[i] == self.generation else float('inf')
+
+    def path_to(self, node):
+        """
+        Reconstruct the path from the last query's source to node.
+
+        Returns:
+            List of nodes from the source to node, or an empty list if node
+            was not reached.
+        """
+        i = self.node_index[node]
+        if self._touched[i] != self.generation:
+            return []
+        path = []
+        while i != -1:
+            path.append(self.nodes[i])
+            i = self._pred[i]
+        return path[::-1]
@@ -0,0 +1,59 @@
+import math
+import unittest
+import random
+from collections import Counter
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.binary_heap import BinaryHeap
+from src.approximate_sssp import round_weight, approximate_shortest_path
+from src.generate_data import generate_weighted_graph
+
+class TestApproximateSSSP(unittest.TestCase):
+    def test_round_weight(self):
+        for epsilon in [0.01, 0.1, 0.5, 1]:
+            for weight in [1, 2, 3, 7.5, 10, 1e-3, 123456.789]:
+                with self.subTest(epsilon=epsilon, weight=weight):
+                    rounded = round_weight(weight, epsilon)
+                    self.assertGreaterEqual(rounded, weight)
+                    self.assertLess(rounded, weight * (1 + epsilon))
+        self.assertEqual(round_weight(7, 0), 7)
+        self.assertEqual(round_weight(0, 0.1), 0)
+        self.assertEqual(round_weight(8, 1), 8)
+
+    def test_exact_with_zero_epsilon(self):
+        graph = build_graph_from_edges([0, 1, 2, 3, 4], [(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8)])
+        self.assertEqual(approximate_shortest_path(graph, 0, epsilon=0),
+                         {0: 0, 1: 3, 2: 2, 3: 8, 4: float('inf')})
+
+    def test_error_bound(self):
+        random.seed(8)
+        for num_nodes, num_edges, weight_range in [(300, 900, (1, 10)), (60, 1500, (1, 1000))]:
+            data = generate_weighted_graph(num_nodes, num_edges, weight_range)
+            graph = build_graph_from_edges(data["nodes"], data["edges"])
+            exact = dijkstra_shortest_path(graph, 0, BinaryHeap())
+            self.assertEqual(approximate_shortest_path(graph, 0, epsilon=0), exact)
+            for epsilon in [0.05, 0.25, 1]:
+                with self.subTest(num_nodes=num_nodes, epsilon=epsilon):
+                    approximate = approximate_shortest_path(graph, 0, epsilon)
+                    for node, distance in exact.items():
+                        self.assertGreaterEqual(approximate[node], distance)
+                        self.assertLessEqual(approximate[node], (1 + epsilon) * distance + 1e-9)
+
+    def test_rounding_merges_queues(self):
+        random.seed(3)
+        data = generate_weighted_graph(300, 900)
+        # Float weights in [1, 10): almost every edge has its own weight
+        edges = [(u, v, weight + random.random()) for u, v, weight in data["edges"]]
+        graph = build_graph_from_edges(data["nodes"], edges)
+        exact, rounded = Counter(), Counter()
+        approximate_shortest_path(graph, 0, epsilon=0, counters=exact)
+        approximate_shortest_path(graph, 0, epsilon=0.1, counters=rounded)
+        self.assertGreater(exact['queues'], 500)
+        # Powers of 1.1 between 1 and 11, plus the zero-weight queue
+        self.assertLessEqual(rounded['queues'], math.ceil(math.log(11, 1.1)) + 2)
+
+    def test_zero_weight_edges(self):
+        graph = build_graph_from_edges([0, 1, 2], [(0, 1, 0), (1, 2, 3)])
+        self.assertEqual(approximate_shortest_path(graph, 2, epsilon=0.1)[0], round_weight(3, 0.1))
+
+if __name__ == '__main__':
+    unittest.main()
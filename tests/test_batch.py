@@ -0,0 +1,46 @@
+import unittest
+import random
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.binary_heap import BinaryHeap
+from src.batch import batch_shortest_paths, all_pairs_shortest_paths
+from src.generate_data import generate_weighted_graph
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        data = generate_weighted_graph(80, 240)
+        self.graph = build_graph_from_edges(data["nodes"], data["edges"])
+
+    def test_results_in_source_order(self):
+        sources = [5, 0, 5, 42, 79, 1]
+        for processes in [1, 2]:
+            with self.subTest(processes=processes):
+                results = list(batch_shortest_paths(self.graph, sources, "DHeap", processes=processes))
+                self.assertEqual([source for source, _ in results], sources)
+                for source, distances in results:
+                    self.assertEqual(distances, dijkstra_shortest_path(self.graph, source, BinaryHeap()))
+
+    def test_compact_results(self):
+        sources = [3, 17]
+        for processes in [1, 2]:
+            with self.subTest(processes=processes):
+                results = list(batch_shortest_paths(self.graph, sources, processes=processes, compact=True))
+                for source, (distances, predecessors) in results:
+                    expected = dijkstra_shortest_path(self.graph, source, BinaryHeap())
+                    self.assertEqual(distances.tolist(), [expected[node] for node in self.graph])
+                    self.assertEqual(predecessors[source], -1)
+
+    def test_all_pairs_symmetric(self):
+        graph = build_graph_from_edges([0, 1, 2, 3], [(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8)])
+        all_pairs = all_pairs_shortest_paths(graph, "RadixHeap", processes=2)
+        self.assertEqual(all_pairs[0], {0: 0, 1: 3, 2: 2, 3: 8})
+        for u in graph:
+            for v in graph:
+                self.assertEqual(all_pairs[u][v], all_pairs[v][u])
+
+    def test_unknown_heap_type(self):
+        with self.assertRaises(ValueError):
+            list(batch_shortest_paths(self.graph, [0], "PairingHeap"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -42,6 +42,15 @@ class TestBinaryHeap(unittest.TestCase):
         self.assertEqual(self.heap.pop(), ('B', 2))
         self.assertEqual(self.heap.pop(), ('A', 3))
 
+    def test_clear(self):
+        self.heap.push(2, 'X')
+        self.heap.push(1, 'Y')
+        self.heap.clear()
+        self.assertTrue(self.heap.is_empty())
+        self.assertFalse(self.heap.contains('X'))
+        self.heap.push(5, 'X')
+        self.assertEqual(self.heap.pop(), ('X', 5))
+
     def test_contains(self):
         self.heap.push(2, 'X')
         self.heap.push(1, 'Y')
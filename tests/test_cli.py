@@ -0,0 +1,85 @@
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import tempfile
+import unittest
+from run import main, parse_graph_specs
+from src.helper import filter_datasets
+from src.stats import load_results_from_json
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def run_main(self, *argv):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = main(list(argv))
+        return status, output.getvalue()
+
+    def test_parse_graph_specs(self):
+        self.assertEqual(parse_graph_specs(["100", "200s", "300d", "400m", "5x", "0"]),
+                         ([(100, "random"), (200, "sparse"), (300, "dense"), (400, "middle")], ["5x", "0"]))
+
+    def test_filter_datasets(self):
+        datasets = [("data/graph_n100_e500_random.json", 100, "random"),
+                    ("data/graph_n200_e400_sparse.json", 200, "sparse"),
+                    ("data/graph_n300_e44850_dense.json", 300, "dense")]
+        self.assertEqual(filter_datasets(datasets), datasets)
+        self.assertEqual(filter_datasets(datasets, pattern="*_sparse.json"), datasets[1:2])
+        self.assertEqual(filter_datasets(datasets, graph_types=["random", "dense"]), datasets[::2])
+        self.assertEqual(filter_datasets(datasets, min_size=150, max_size=250), datasets[1:2])
+
+    def test_generate_list_bench_report(self):
+        random.seed(4)
+        status, _ = self.run_main("generate", "30", "40s")
+        self.assertEqual(status, 0)
+        _, listing = self.run_main("list", "--type", "sparse")
+        self.assertIn("graph_n40_e80_sparse.json", listing)
+        self.assertNotIn("random", listing)
+
+        status, _ = self.run_main("bench", "--glob", "*random*", "--heaps", "BinaryHeap", "FibonacciHeap",
+                                  "--sources", "2", "--repeats", "2", "--warmup", "0", "--workers", "2",
+                                  "--json", "out/results.json", "--csv", "out/results.csv")
+        self.assertEqual(status, 0)
+        with open("out/results.json") as f:
+            document = json.load(f)
+        self.assertEqual(len(document["runs"]), 2 * 2 * 2)
+        self.assertEqual({run["status"] for run in document["runs"]}, {"ok"})
+        self.assertEqual(len(document["params"]["sources"]["data/graph_n30_e150_random.json"]), 2)
+        self.assertEqual(document["results"][0]["num_edges"], 150)
+
+        results, _ = load_results_from_json("out/results.json")
+        self.assertEqual([result[:2] for result in results], [(30, "random")])
+        radix, binary, d_heap, fibonacci, dense = results[0][2:]
+        self.assertGreater(binary[0], 0)
+        self.assertGreater(fibonacci[6]["pops"], 0)
+        self.assertTrue(math.isnan(radix[0]) and math.isnan(dense[0]))  # Not selected
+
+        status, report = self.run_main("report", "out/results.json", "--csv", "out/report.csv", "--fit")
+        self.assertEqual(status, 0)
+        self.assertIn("RadixHeap: no result", report)
+        self.assertIn("Not enough sizes", report)  # One size only
+        with open("out/results.csv") as f, open("out/report.csv") as g:
+            self.assertEqual(f.read(), g.read())
+
+        # The runs were recorded in the history; one session has no baseline yet
+        _, sessions = self.run_main("compare", "--list")
+        self.assertIn("8 runs", sessions)
+        status, _ = self.run_main("compare")
+        self.assertEqual(status, 1)
+
+        status, _ = self.run_main("bench", "--glob", "nothing*")
+        self.assertEqual(status, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import math
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+from src.complexity import fit_power_law, fit_results
+from src.load_graph import dataset_edge_count
+
+class TestComplexity(unittest.TestCase):
+    def test_power_law_exponent(self):
+        rng = random.Random(3)
+        sizes = [100, 200, 400, 800, 1600, 3200]
+        times = [2e-7 * n ** 1.3 * math.exp(rng.gauss(0, 0.05)) for n in sizes]
+        fit = fit_power_law(sizes, times)
+        self.assertLess(fit["b_low"], 1.3)
+        self.assertGreater(fit["b_high"], 1.3)
+        self.assertAlmostEqual(fit["b"], 1.3, delta=0.1)
+        self.assertGreater(fit["r2"], 0.99)
+
+        exact = fit_power_law([10, 100], [1.0, 100.0])
+        self.assertAlmostEqual(exact["b"], 2.0)
+        self.assertAlmostEqual(exact["c"], 0.01)
+        self.assertTrue(math.isnan(exact["b_low"]))  # No interval from two points
+        with self.assertRaises(ValueError):
+            fit_power_law([10, 10], [1.0, 2.0])
+
+    def test_fit_results(self):
+        nan = float('nan')
+
+        def entry(time):
+            return (time, 0, 0.0, time, 0, 0, Counter())
+
+        missing = entry(nan)
+        # BinaryHeap scales exactly like n log n on sparse graphs; the other engines lack results
+        results = [
+            (n, "sparse", missing, entry(1e-6 * n * math.log2(n)), missing, missing, missing)
+            for n in (256, 1024, 4096, 4096)
+        ] + [(100, "dense", missing, entry(0.01), missing, missing, missing)]
+        sizes = [item[0] for item in results]
+        fits = fit_results(results, edge_counts=[2 * n for n in sizes])
+        self.assertEqual(list(fits), [("sparse", "BinaryHeap")])
+        models = fits[("sparse", "BinaryHeap")]
+        self.assertEqual(models["n"]["points"], 3)  # Duplicate sizes are averaged
+        self.assertAlmostEqual(models["n log n"]["b"], 1.0)
+        self.assertGreater(models["n"]["b"], 1.0)
+        # With m = 2n edges, m + n log n grows slightly slower than n log n
+        self.assertGreater(models["m + n log n"]["b"], 1.0)
+
+        # The fit uses the given edge counts: with m = n^2, m + n log n outgrows the times
+        dense = fit_results(results, edge_counts=[n * n for n in sizes])[("sparse", "BinaryHeap")]
+        self.assertLess(dense["m + n log n"]["b"], 0.6)
+        # Without every edge count, only the models of n are fitted
+        partial = fit_results(results, edge_counts=[None if n == 1024 else 2 * n for n in sizes])
+        self.assertEqual(list(partial[("sparse", "BinaryHeap")]), ["n", "n log n"])
+        self.assertEqual(list(fit_results(results)[("sparse", "BinaryHeap")]), ["n", "n log n"])
+
+    def test_dataset_edge_count(self):
+        self.assertEqual(dataset_edge_count("data/graph_n40_e80_sparse.json"), 80)
+        self.assertIsNone(dataset_edge_count("missing/other.json"))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "custom.json")
+            with open(path, 'w') as f:
+                json.dump({"nodes": [0, 1, 2], "edges": [[0, 1, 1.0], [1, 2, 2.0]]}, f)
+            self.assertEqual(dataset_edge_count(path), 2)
+
+if __name__ == '__main__':
+    unittest.main()
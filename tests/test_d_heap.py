@@ -49,5 +49,15 @@ class TestDHeap(unittest.TestCase):
         self.assertEqual(heap.pop(), ('B', 2))
         self.assertEqual(heap.pop(), ('A', 3))
 
+    def test_clear(self):
+        heap = DHeap(d=3)
+        heap.push(3, 'A')
+        heap.push(1, 'B')
+        heap.clear()
+        self.assertTrue(heap.is_empty())
+        self.assertFalse(heap.contains('A'))
+        heap.push(2, 'A')
+        self.assertEqual(heap.pop(), ('A', 2))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
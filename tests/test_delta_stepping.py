@@ -0,0 +1,63 @@
+import unittest
+import random
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.binary_heap import BinaryHeap
+from src.csr_graph import CSRGraph
+from src.delta_stepping import delta_stepping_shortest_path, choose_delta
+from src.generate_data import generate_weighted_graph
+
+class TestDeltaStepping(unittest.TestCase):
+    def setUp(self):
+        self.nodes = [0, 1, 2, 3]
+        self.edges = [
+            (0, 1, 4),
+            (0, 2, 2),
+            (1, 2, 1),
+            (1, 3, 5),
+            (2, 3, 8)
+        ]
+        self.graph = build_graph_from_edges(self.nodes, self.edges)
+
+    def test_simple_graph(self):
+        distances = delta_stepping_shortest_path(self.graph, 0)
+        self.assertEqual(distances, {0: 0, 1: 3, 2: 2, 3: 8})
+
+    def test_disconnected_graph(self):
+        graph = build_graph_from_edges([0, 1, 2], [(0, 1, 1)])
+        distances = delta_stepping_shortest_path(graph, 0)
+        self.assertEqual(distances, {0: 0, 1: 1, 2: float('inf')})
+
+    def test_matches_dijkstra_for_any_delta(self):
+        random.seed(7)
+        data = generate_weighted_graph(200, 600)
+        graph = build_graph_from_edges(data["nodes"], data["edges"])
+        expected = dijkstra_shortest_path(graph, 0, BinaryHeap())
+        for delta in [0.5, 1, 3, 10, 100, None]:
+            with self.subTest(delta=delta):
+                self.assertEqual(delta_stepping_shortest_path(graph, 0, delta=delta), expected)
+
+    def test_process_pool(self):
+        random.seed(11)
+        data = generate_weighted_graph(300, 900)
+        graph = build_graph_from_edges(data["nodes"], data["edges"])
+        expected = dijkstra_shortest_path(graph, 5, BinaryHeap())
+        distances = delta_stepping_shortest_path(graph, 5, processes=2, parallel_threshold=1)
+        self.assertEqual(distances, expected)
+
+    def test_choose_delta(self):
+        csr = CSRGraph.from_adjacency(self.graph)
+        delta = choose_delta(csr)
+        self.assertGreaterEqual(delta, 1)
+        self.assertLessEqual(delta, 8)
+
+class TestCSRGraph(unittest.TestCase):
+    def test_round_trip(self):
+        graph = build_graph_from_edges([0, 1, 2], [(0, 1, 3), (1, 2, 4)])
+        csr = CSRGraph.from_adjacency(graph)
+        self.assertEqual(len(csr), 3)
+        self.assertEqual(csr.num_edges, 4)
+        self.assertEqual(csr[1], [(0, 3.0), (2, 4.0)])
+        self.assertEqual(dijkstra_shortest_path(csr, 0, BinaryHeap()), {0: 0, 1: 3, 2: 7})
+
+if __name__ == '__main__':
+    unittest.main()
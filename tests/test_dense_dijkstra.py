@@ -0,0 +1,49 @@
+import unittest
+import random
+import math
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.binary_heap import BinaryHeap
+from src.dense_dijkstra import build_weight_matrix, dense_dijkstra_shortest_path
+from src.generate_data import generate_weighted_graph
+
+class TestDenseDijkstra(unittest.TestCase):
+    def setUp(self):
+        self.nodes = [0, 1, 2, 3]
+        self.edges = [
+            (0, 1, 4),
+            (0, 2, 2),
+            (1, 2, 1),
+            (1, 3, 5),
+            (2, 3, 8)
+        ]
+        self.graph = build_graph_from_edges(self.nodes, self.edges)
+
+    def test_simple_graph(self):
+        distances = dense_dijkstra_shortest_path(self.graph, 0)
+        self.assertEqual(distances, {0: 0, 1: 3, 2: 2, 3: 8})
+
+    def test_weight_matrix(self):
+        graph = build_graph_from_edges([0, 1], [(0, 1, 5), (0, 1, 3)])
+        nodes, matrix = build_weight_matrix(graph)
+        self.assertEqual(nodes, [0, 1])
+        self.assertEqual(matrix[0][1], 3)
+        self.assertEqual(matrix[1][0], 3)
+        self.assertTrue(math.isinf(matrix[0][0]))
+
+    def test_disconnected_graph(self):
+        graph = build_graph_from_edges([0, 1, 2], [(0, 1, 1)])
+        distances = dense_dijkstra_shortest_path(graph, 1)
+        self.assertEqual(distances, {0: 1, 1: 0, 2: float('inf')})
+
+    def test_matches_dijkstra_on_dense_graph(self):
+        random.seed(3)
+        data = generate_weighted_graph(60, 60 * 59 // 2)
+        graph = build_graph_from_edges(data["nodes"], data["edges"])
+        weight_matrix = build_weight_matrix(graph)
+        for source in [0, 17, 59]:
+            with self.subTest(source=source):
+                expected = dijkstra_shortest_path(graph, source, BinaryHeap())
+                self.assertEqual(dense_dijkstra_shortest_path(graph, source, weight_matrix), expected)
+
+if __name__ == '__main__':
+    unittest.main()
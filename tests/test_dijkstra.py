@@ -1,9 +1,12 @@
+import random
+import tracemalloc
 import unittest
-from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges, multi_source_dijkstra, iter_dijkstra
 from src.binary_heap import BinaryHeap
 from src.d_heap import DHeap
 from src.radix_heap import RadixHeap
 from src.fibonacci_heap import FibonacciHeap
+from src.generate_data import generate_weighted_graph
 
 class TestDijkstra(unittest.TestCase):
     def setUp(self):
@@ -81,6 +84,122 @@ class TestDijkstra(unittest.TestCase):
         
         self.assertEqual(distances, {0: 0})
 
+    def test_max_distance(self):
+        for heap_class in [BinaryHeap, DHeap, RadixHeap, FibonacciHeap]:
+            with self.subTest(heap=heap_class.__name__):
+                distances = dijkstra_shortest_path(self.graph, 0, heap_class(), max_distance=3)
+                self.assertEqual(distances, {0: 0, 2: 2, 1: 3})
+
+    def test_max_settled(self):
+        for heap_class in [BinaryHeap, DHeap, RadixHeap, FibonacciHeap]:
+            with self.subTest(heap=heap_class.__name__):
+                distances = dijkstra_shortest_path(self.graph, 0, heap_class(), max_settled=2)
+                self.assertEqual(list(distances.items()), [(0, 0), (2, 2)])
+
+    def test_cutoffs_with_preloaded_heap(self):
+        heap = BinaryHeap()
+        for node in self.disconnected_nodes:
+            heap.push(float('inf'), node)
+        distances = dijkstra_shortest_path(self.disconnected_graph, 0, heap, max_settled=10)
+        self.assertEqual(distances, {0: 0, 1: 1})
+
+    def test_cutoffs_random_graphs(self):
+        for seed in range(20):
+            random.seed(seed)
+            data = generate_weighted_graph(200, 600)
+            graph = build_graph_from_edges(data["nodes"], data["edges"])
+            full = dijkstra_shortest_path(graph, 0, BinaryHeap())
+            within = {node: distance for node, distance in full.items() if distance <= 9}
+            nearest = sorted(full.values())[:20]
+            for heap_class in [BinaryHeap, DHeap, RadixHeap, FibonacciHeap]:
+                with self.subTest(seed=seed, heap=heap_class.__name__):
+                    self.assertEqual(dijkstra_shortest_path(graph, 0, heap_class(), max_distance=9), within)
+                    # Ties may settle in any order, so compare the distances of the 20 nearest nodes
+                    settled = dijkstra_shortest_path(graph, 0, heap_class(), max_settled=20)
+                    self.assertEqual(sorted(settled.values()), nearest)
+
+    def test_iter_dijkstra_settle_order(self):
+        settled = list(iter_dijkstra(self.graph, 0, BinaryHeap()))
+        self.assertEqual(settled, [(0, 0, None), (2, 2, 0), (1, 3, 2), (3, 8, 1)])
+
+    def test_iter_dijkstra_random_graphs(self):
+        for seed in range(10):
+            random.seed(seed)
+            data = generate_weighted_graph(200, 600)
+            graph = build_graph_from_edges(data["nodes"], data["edges"])
+            full = dijkstra_shortest_path(graph, 0, BinaryHeap())
+            for heap_class in [BinaryHeap, DHeap, RadixHeap, FibonacciHeap]:
+                with self.subTest(seed=seed, heap=heap_class.__name__):
+                    settled = list(iter_dijkstra(graph, 0, heap_class()))
+                    distances = [distance for _, distance, _ in settled]
+                    self.assertEqual(distances, sorted(distances))
+                    self.assertEqual({node: distance for node, distance, _ in settled},
+                                     {node: d for node, d in full.items() if d != float('inf')})
+
+    def test_iter_dijkstra_stops_lazily(self):
+        heap = BinaryHeap()
+        search = iter_dijkstra(self.graph, 0, heap)
+        self.assertEqual(next(search), (0, 0, None))
+        # Neighbours of the source are only relaxed once the search resumes
+        self.assertTrue(heap.is_empty())
+        self.assertEqual(next(search), (2, 2, 0))
+        search.close()
+
+    def test_iter_dijkstra_disconnected(self):
+        settled = [node for node, _, _ in iter_dijkstra(self.disconnected_graph, 0, FibonacciHeap())]
+        self.assertEqual(settled, [0, 1])
+
+    def test_multi_source(self):
+        for heap_class in [BinaryHeap, DHeap, RadixHeap, FibonacciHeap]:
+            with self.subTest(heap=heap_class.__name__):
+                distances, owners = multi_source_dijkstra(self.graph, [0, 3], heap_class())
+                self.assertEqual(distances, {0: 0, 1: 3, 2: 2, 3: 0})
+                self.assertEqual(owners, {0: 0, 1: 0, 2: 0, 3: 3})
+
+    def test_multi_source_offsets(self):
+        # Source 3 starts 5 units behind, so it only wins itself
+        distances, owners = multi_source_dijkstra(self.graph, {0: 0, 3: 5}, BinaryHeap())
+        self.assertEqual(distances, {0: 0, 1: 3, 2: 2, 3: 5})
+        self.assertEqual(owners, {0: 0, 1: 0, 2: 0, 3: 3})
+
+    def test_multi_source_disconnected(self):
+        sources = [0, 1]
+        distances, owners = multi_source_dijkstra(self.disconnected_graph, sources, BinaryHeap())
+        self.assertEqual(distances, {0: 0, 1: 0, 2: float('inf')})
+        self.assertEqual(owners, {0: 0, 1: 1, 2: None})
+
+    def test_compact_output(self):
+        for heap_class in [BinaryHeap, DHeap, RadixHeap, FibonacciHeap]:
+            with self.subTest(heap=heap_class.__name__):
+                distances, predecessors = dijkstra_shortest_path(self.graph, 0, heap_class(), compact=True)
+                self.assertEqual(distances.tolist(), [0, 3, 2, 8])
+                self.assertEqual(predecessors.tolist(), [-1, 2, 0, 1])
+
+    def test_compact_output_non_dense_ids(self):
+        graph = build_graph_from_edges(["a", "b", "c"], [("a", "b", 1.5)])
+        distances, predecessors = dijkstra_shortest_path(graph, "b", BinaryHeap(), compact=True)
+        self.assertEqual(distances.tolist(), [1.5, 0, float('inf')])
+        self.assertEqual(predecessors.tolist(), [1, -1, -1])
+
+    def test_compact_uses_less_memory(self):
+        # A path keeps the heap tiny, so the peak is dominated by the result
+        n = 5000
+        graph = build_graph_from_edges(list(range(n)), [(i, i + 1, 1.5) for i in range(n - 1)])
+
+        def peak(compact):
+            tracemalloc.start()
+            try:
+                dijkstra_shortest_path(graph, 0, BinaryHeap(), compact=compact)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        self.assertLess(peak(True), peak(False))
+
+    def test_compact_rejects_cutoffs(self):
+        with self.assertRaises(ValueError):
+            dijkstra_shortest_path(self.graph, 0, BinaryHeap(), max_settled=2, compact=True)
+
     # def test_graph_with_cycle(self):
     #     nodes = [0, 1, 2]
     #     edges = [
@@ -0,0 +1,48 @@
+import io
+import unittest
+from array import array
+from src.binary_heap import BinaryHeap
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.distance_io import dump_distances, load_distances, iter_distances
+
+class TestDistanceIO(unittest.TestCase):
+    def setUp(self):
+        self.graph = build_graph_from_edges(
+            [0, 1, 2, 3, 4], [(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8)]
+        )
+
+    def test_round_trip(self):
+        buffer = io.BytesIO()
+        expected = []
+        for source in self.graph:
+            distances, predecessors = dijkstra_shortest_path(self.graph, source, BinaryHeap(), compact=True)
+            dump_distances(buffer, source, distances, predecessors)
+            expected.append((source, distances, predecessors))
+        buffer.seek(0)
+        self.assertEqual(list(iter_distances(buffer)), expected)
+
+    def test_without_predecessors(self):
+        buffer = io.BytesIO()
+        dump_distances(buffer, 2, [0.5, float('inf')])
+        buffer.seek(0)
+        self.assertEqual(load_distances(buffer), (2, array('d', [0.5, float('inf')]), None))
+        self.assertIsNone(load_distances(buffer))
+
+    def test_record_size(self):
+        buffer = io.BytesIO()
+        dump_distances(buffer, 0, array('d', [0.0] * 10), array('q', [-1] * 10))
+        self.assertEqual(len(buffer.getvalue()), 24 + 10 * 8 + 10 * 8)
+
+    def test_truncated_record(self):
+        buffer = io.BytesIO()
+        dump_distances(buffer, 0, array('d', [1.0, 2.0, 3.0]))
+        buffer = io.BytesIO(buffer.getvalue()[:-4])
+        with self.assertRaises(EOFError):
+            load_distances(buffer)
+
+    def test_bad_magic(self):
+        with self.assertRaises(ValueError):
+            load_distances(io.BytesIO(b"x" * 24))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import random
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.binary_heap import BinaryHeap
+from src.d_heap import DHeap
+from src.radix_heap import RadixHeap
+from src.fibonacci_heap import FibonacciHeap
+from src.dynamic_sssp import DynamicSSSP
+from src.generate_data import generate_weighted_graph
+
+class TestDynamicSSSP(unittest.TestCase):
+    def setUp(self):
+        self.graph = build_graph_from_edges(
+            [0, 1, 2, 3], [(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8)]
+        )
+
+    def test_initial_tree(self):
+        dynamic = DynamicSSSP(self.graph, 0)
+        self.assertEqual(dynamic.dist, {0: 0, 1: 3, 2: 2, 3: 8})
+        self.assertEqual(dynamic.parent, {0: None, 1: 2, 2: 0, 3: 1})
+
+    def test_decrease_and_insert(self):
+        dynamic = DynamicSSSP(self.graph, 0)
+        dynamic.update_edge(2, 3, 1)
+        self.assertEqual(dynamic.dist, {0: 0, 1: 3, 2: 2, 3: 3})
+        self.assertEqual(dynamic.parent[3], 2)
+        dynamic.insert_edge(0, 3, 2)
+        self.assertEqual(dynamic.dist[3], 2)
+        self.assertEqual(dynamic.parent[3], 0)
+
+    def test_increase_and_delete_tree_edge(self):
+        dynamic = DynamicSSSP(self.graph, 0)
+        dynamic.update_edge(0, 2, 10)
+        self.assertEqual(dynamic.dist, {0: 0, 1: 4, 2: 5, 3: 9})
+        dynamic.delete_edge(0, 1)
+        self.assertEqual(dynamic.dist, {0: 0, 1: 11, 2: 10, 3: 16})
+        dynamic.delete_edge(0, 2)
+        self.assertEqual(dynamic.dist, {0: 0, 1: float('inf'), 2: float('inf'), 3: float('inf')})
+        self.assertEqual(dynamic.parent, {0: None, 1: None, 2: None, 3: None})
+
+    def test_random_updates_match_recomputation(self):
+        random.seed(21)
+        data = generate_weighted_graph(60, 150)
+        for heap_class in [BinaryHeap, DHeap, RadixHeap, FibonacciHeap]:
+            graph = build_graph_from_edges(data["nodes"], data["edges"])
+            dynamic = DynamicSSSP(graph, 0, heap_class)
+            with self.subTest(heap=heap_class.__name__):
+                for _ in range(200):
+                    u, v = random.sample(data["nodes"], 2)
+                    action = random.random()
+                    if action < 0.2:
+                        dynamic.delete_edge(u, v)
+                    else:
+                        dynamic.update_edge(u, v, random.randint(1, 10))
+                    expected = dijkstra_shortest_path(graph, 0, BinaryHeap())
+                    self.assertEqual(dynamic.dist, expected)
+                for node, parent in dynamic.parent.items():
+                    if parent is not None:
+                        self.assertEqual(dynamic.dist[node], dynamic.dist[parent] + dynamic.edge_weight(parent, node))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import csv
+import os
+import random
+import tempfile
+import unittest
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.binary_heap import BinaryHeap
+from src.graph_stats import GraphStats
+from src.engine_selector import ENGINES, EngineSelector, run_engine
+from src.load_graph import load_graph_with_stats
+from src.generate_data import generate_weighted_graph, save_graph_to_disk
+
+class TestGraphStats(unittest.TestCase):
+    def test_from_edges_matches_from_graph(self):
+        nodes = [0, 1, 2, 3]
+        edges = [(0, 1, 4), (0, 2, 2.5), (1, 2, 1)]
+        from_edges = GraphStats.from_edges(nodes, edges)
+        from_graph = GraphStats.from_graph(build_graph_from_edges(nodes, edges))
+        for stats in [from_edges, from_graph]:
+            self.assertEqual((stats.num_nodes, stats.num_edges), (4, 6))
+            self.assertFalse(stats.integer_weights)
+            self.assertEqual((stats.min_weight, stats.max_weight), (1, 4))
+            self.assertEqual(stats.average_degree, 1.5)
+            self.assertEqual(stats.density, 0.5)
+
+    def test_load_graph_with_stats(self):
+        random.seed(2)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph.json")
+            save_graph_to_disk(generate_weighted_graph(30, 60), path)
+            graph, nodes, stats = load_graph_with_stats(path)
+        self.assertEqual(len(graph), 30)
+        self.assertEqual(stats.num_edges, 120)
+        self.assertTrue(stats.integer_weights)
+
+class TestEngineSelector(unittest.TestCase):
+    def test_rules(self):
+        selector = EngineSelector()
+        self.assertEqual(selector.choose(GraphStats(100, 9900, True, 1, 10)), "DenseDijkstra")
+        self.assertEqual(selector.choose(GraphStats(100000, 400000, True, 1, 10)), "BucketQueue")
+        self.assertEqual(selector.choose(GraphStats(100000, 400000, False, 0.5, 10)), "DHeap")
+        self.assertEqual(selector.choose(GraphStats(100000, 400000, True, 1, 10**6)), "DHeap")
+
+    def test_engines_agree(self):
+        random.seed(3)
+        data = generate_weighted_graph(50, 200)
+        graph = build_graph_from_edges(data["nodes"], data["edges"])
+        expected = dijkstra_shortest_path(graph, 0, BinaryHeap())
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(run_engine(engine, graph, 0), expected)
+        self.assertEqual(EngineSelector().shortest_paths(graph, 0), expected)
+        self.assertEqual(EngineSelector().shortest_paths(graph, 0, engine="FibonacciHeap"), expected)
+        with self.assertRaises(ValueError):
+            run_engine("NoSuchHeap", graph, 0)
+
+    def test_calibrate(self):
+        header = ["Graph Size", "Graph Type"]
+        for engine in ["RadixHeap", "BinaryHeap", "DHeap", "FibonacciHeap", "DenseDijkstra"]:
+            header += [f"{engine} Time (s)", f"{engine} Memory (B)"]
+        rows = [
+            # size, type, radix, binary, d-ary, fibonacci, dense
+            (1000, "sparse", 0.5, 0.2, 0.3, 0.9, 0.4),
+            (2000, "sparse", 0.9, 0.4, 0.5, 1.5, 1.2),
+            (1000, "middle", 0.5, 0.4, 0.4, 0.9, 0.1),
+            (1000, "dense", 0.9, 0.8, 0.8, 1.0, 0.1),
+            (10000, "sparse", 5.0, 2.0, 2.5, 9.0, "nan"),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.csv")
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                for size, kind, *times in rows:
+                    writer.writerow([size, kind] + [v for t in times for v in (t, 0)])
+            selector = EngineSelector.calibrate([path])
+            overridden = EngineSelector.calibrate([path], default_heap="FibonacciHeap")
+        self.assertEqual(selector.default_heap, "BinaryHeap")
+        # Dense won the middle and dense rows only
+        self.assertEqual(selector.choose(GraphStats(1000, 501500, False, 1, 10)), "DenseDijkstra")
+        self.assertEqual(selector.choose(GraphStats(1000, 100000, False, 1, 10)), "BinaryHeap")
+        self.assertEqual(overridden.default_heap, "FibonacciHeap")
+        self.assertEqual(EngineSelector.calibrate([]).default_heap, "DHeap")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -52,6 +52,15 @@ class TestFibonacciHeap(unittest.TestCase):
         # Verify the heap structure
         self.assertEqual(self.heap.min_node.priority, 2)
 
+    def test_clear(self):
+        self.heap.push(3, 'A')
+        self.heap.push(1, 'B')
+        self.heap.clear()
+        self.assertTrue(self.heap.is_empty())
+        self.assertEqual(len(self.heap), 0)
+        self.heap.push(2, 'C')
+        self.assertEqual(self.heap.pop(), ('C', 2))
+
     def test_large_heap(self):
         for i in range(100, 0, -1):
             self.heap.push(i, str(i))
@@ -0,0 +1,40 @@
+import sys
+import unittest
+from src.binary_heap import BinaryHeap
+from src.fibonacci_heap import FibonacciHeap
+from src.radix_heap import RadixHeap
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.heap_memory import HeapMemorySampler, deep_sizeof, peak_rss
+
+class TestHeapMemory(unittest.TestCase):
+    def test_deep_sizeof_counts_contents(self):
+        inner = [1.5, 2.5]
+        self.assertEqual(deep_sizeof(inner), sys.getsizeof(inner) + 2 * sys.getsizeof(1.5))
+        # Shared objects are counted once
+        self.assertEqual(deep_sizeof([inner, inner]), sys.getsizeof([inner, inner]) + deep_sizeof(inner))
+
+    def test_deep_sizeof_grows_with_heap(self):
+        for heap_class in [BinaryHeap, FibonacciHeap, RadixHeap]:
+            with self.subTest(heap=heap_class.__name__):
+                heap = heap_class()
+                empty = deep_sizeof(heap)
+                for i in range(100):
+                    heap.push(float(i), i)
+                self.assertGreater(deep_sizeof(heap), empty + 100 * sys.getsizeof(1.0))
+
+    def test_sampler_is_transparent(self):
+        graph = build_graph_from_edges([0, 1, 2, 3], [(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8)])
+        for heap_class in [BinaryHeap, FibonacciHeap]:
+            with self.subTest(heap=heap_class.__name__):
+                sampler = HeapMemorySampler(heap_class())
+                self.assertEqual(hasattr(sampler, 'contains'), hasattr(heap_class(), 'contains'))
+                distances = dijkstra_shortest_path(graph, 0, sampler)
+                self.assertEqual(distances, {0: 0, 1: 3, 2: 2, 3: 8})
+                self.assertGreater(sampler.samples, 1)
+                self.assertGreater(sampler.peak_bytes, deep_sizeof(heap_class()))
+
+    def test_peak_rss(self):
+        self.assertGreater(peak_rss(), 1 << 20)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import random
+import tempfile
+import unittest
+from src.binary_heap import BinaryHeap
+from src.fibonacci_heap import FibonacciHeap
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.load_graph import HEAP_TYPES
+from src.heap_trace import HeapTrace, RecordingHeap, record_dijkstra_trace, replay, PUSH, POP, DECREASE_KEY
+
+class TestHeapTrace(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        nodes = list(range(200))
+        edges = [(rng.randrange(200), rng.randrange(200), rng.randint(1, 20)) for _ in range(800)]
+        self.graph = build_graph_from_edges(nodes, edges)
+
+    def test_recording_is_transparent(self):
+        expected = dijkstra_shortest_path(self.graph, 0, BinaryHeap())
+        for heap_class in [BinaryHeap, FibonacciHeap]:
+            with self.subTest(heap=heap_class.__name__):
+                distances, trace = record_dijkstra_trace(self.graph, 0, heap_class())
+                self.assertEqual(distances, expected)
+                counts = trace.counts()
+                self.assertEqual(counts['pushes'], counts['pops'])
+                self.assertEqual(len(trace.values), counts['pushes'] + counts['decrease_keys'])
+                if heap_class is FibonacciHeap:
+                    self.assertEqual(counts['decrease_keys'], 0)  # Dijkstra pushes duplicates instead
+                else:
+                    self.assertGreater(counts['decrease_keys'], 0)
+
+    def test_recorded_operations(self):
+        heap = RecordingHeap(BinaryHeap())
+        heap.push(5.0, 1)
+        heap.push(3.0, 2)
+        heap.decrease_key(1, 1.0)
+        self.assertEqual(heap.pop(), (1, 1.0))
+        self.assertTrue(heap.contains(2))
+        self.assertEqual(list(heap.trace.ops), [PUSH, PUSH, DECREASE_KEY, POP])
+        self.assertEqual(list(heap.trace.values), [1, 2, 1])
+        self.assertEqual(list(heap.trace.priorities), [5.0, 3.0, 1.0])
+        with self.assertRaises(TypeError):
+            heap.push(1.0, "a")
+
+    def test_replay_on_every_heap(self):
+        _, trace = record_dijkstra_trace(self.graph, 0, BinaryHeap())
+        for name, heap_class in HEAP_TYPES.items():
+            with self.subTest(heap=name):
+                heap = heap_class()
+                self.assertEqual(replay(trace, heap), 0)
+                self.assertTrue(heap.is_empty())
+
+    def test_save_and_load(self):
+        _, trace = record_dijkstra_trace(self.graph, 0, BinaryHeap())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "dijkstra.htrc")
+            trace.save(path)
+            loaded = HeapTrace.load(path)
+            self.assertEqual(loaded.ops, trace.ops)
+            self.assertEqual(loaded.values, trace.values)
+            self.assertEqual(loaded.priorities, trace.priorities)
+
+            with open(path, 'r+b') as f:
+                f.truncate(os.path.getsize(path) - 1)
+            with self.assertRaises(EOFError):
+                HeapTrace.load(path)
+            with open(path, 'wb') as f:
+                f.write(b"\0" * 64)
+            with self.assertRaises(ValueError):
+                HeapTrace.load(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import gc
+import os
+import random
+import tempfile
+import unittest
+import contextlib
+import io
+from src.helper import measure_time, summarize_times, run_experiment, sample_nodes, print_source_summary
+from src.stats import save_results_to_csv
+from src.engine_selector import EngineSelector
+from src.generate_data import generate_weighted_graph, save_graph_to_disk
+
+class TestTimingHarness(unittest.TestCase):
+    def test_measure_time(self):
+        calls = []
+        samples = measure_time(lambda arg: calls.append((arg, gc.isenabled())),
+                               setup=lambda: len(calls), warmup=2, repeats=3)
+        self.assertEqual(len(samples), 3)
+        self.assertEqual([arg for arg, _ in calls], [0, 1, 2, 3, 4])
+        self.assertFalse(any(enabled for _, enabled in calls))  # GC off while timed
+        self.assertTrue(gc.isenabled())
+
+    def test_gc_restored_on_error(self):
+        def fail(_):
+            raise RuntimeError
+        with self.assertRaises(RuntimeError):
+            measure_time(fail)
+        self.assertTrue(gc.isenabled())
+
+    def test_summarize_times(self):
+        self.assertEqual(summarize_times([3.0, 1.0, 2.0, 5.0, 4.0]), (3.0, 2.0, 1.0))
+        self.assertEqual(summarize_times([0.5]), (0.5, 0.0, 0.5))
+
+    def test_run_experiment_to_csv(self):
+        random.seed(6)
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                path = os.path.join("data", "graph_n60_e300_random.json")
+                os.makedirs("data")
+                save_graph_to_disk(generate_weighted_graph(60, 300), path)
+                measurements = run_experiment(path, 60, warmup=0, repeats=3)
+                self.assertEqual(len(measurements), 5)
+                for median, memory, iqr, minimum, working_set, rss, _ in measurements:
+                    self.assertLessEqual(minimum, median)
+                    self.assertGreaterEqual(iqr, 0)
+                    self.assertGreater(memory, 0)
+                    self.assertGreater(working_set, 0)
+                    self.assertGreater(rss, 0)
+
+                save_results_to_csv([(60, "random") + measurements], "results-test")
+                with open(os.path.join("results", "results-test.csv")) as f:
+                    header = f.readline().strip().split(",")
+                self.assertEqual(len([name for name in header if name.endswith("(s)") or name.endswith("(B)")]), 5 * 6)
+                self.assertIn("FibonacciHeap links", header)
+                self.assertIn("BinaryHeap sift_steps", header)
+                # The pre-filled BinaryHeap pops every node once and only decreases keys
+                self.assertEqual(measurements[1][6]["pops"], 60)
+                self.assertEqual(measurements[1][6]["pushes"], 0)
+                self.assertIn("FibonacciHeap Time IQR (s)", header)
+                selector = EngineSelector.calibrate()
+                self.assertIn(selector.default_heap, ["RadixHeap", "BinaryHeap", "DHeap", "FibonacciHeap"])
+            finally:
+                os.chdir(cwd)
+
+class TestSourceSampling(unittest.TestCase):
+    def test_sample_nodes(self):
+        nodes = list(range(100))
+        sources = sample_nodes(nodes, 10, seed=3)
+        self.assertEqual(sources, sample_nodes(nodes, 10, seed=3))
+        self.assertNotEqual(sources, sample_nodes(nodes, 10, seed=4))
+        self.assertEqual(sources, sorted(set(sources)))
+        self.assertEqual(sample_nodes(nodes[:5], 10), nodes[:5])
+
+    def test_paired_sources(self):
+        random.seed(11)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph_n80_e120_random.json")
+            # Few edges: some sources reach only part of the graph
+            save_graph_to_disk(generate_weighted_graph(80, 60), path)
+            records = []
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_experiment(path, 80, warmup=0, repeats=1, memory_samples=10, num_sources=6, seed=2,
+                               per_source=records)
+        by_engine = {}
+        for data_file, engine, source, seconds, reached in records:
+            by_engine.setdefault(engine, []).append((source, reached))
+            self.assertGreater(seconds, 0)
+        self.assertEqual(len(by_engine), 5)
+        # Every engine ran from the same sources and reached the same nodes
+        expected = by_engine["BinaryHeap"]
+        self.assertEqual([source for source, _ in expected], sample_nodes(range(80), 6, seed=2))
+        for engine, per_source in by_engine.items():
+            self.assertEqual(per_source, expected, engine)
+        self.assertTrue(all(1 <= reached <= 80 for _, reached in expected))
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            print_source_summary(records)
+        self.assertIn("Reached nodes: min", output.getvalue())
+        self.assertIn("paired vs BinaryHeap", output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import random
+import tempfile
+import unittest
+from src.history import BenchmarkHistory, file_sha256, git_commit, machine_fingerprint
+
+class TestBenchmarkHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dataset = os.path.join(self.tmp.name, "graph_n10_e20_sparse.json")
+        with open(self.dataset, 'w') as f:
+            f.write('{"nodes": [], "edges": []}')
+        self.datasets = [(self.dataset, 10, "sparse")]
+        self.history = BenchmarkHistory(os.path.join(self.tmp.name, "history.sqlite"))
+
+    def tearDown(self):
+        self.history.close()
+        self.tmp.cleanup()
+
+    def record(self, times, params=None, label=None, sources=(0,)):
+        runs = [(self.dataset, engine, source, repeat, "ok", seconds, 10 if repeat == 0 else None)
+                for engine, samples in times.items() for source in sources
+                for repeat, seconds in enumerate(samples)]
+        runs.append((self.dataset, "DHeap", 0, 0, "timed out", float('nan'), None))
+        return self.history.record_runs(runs, self.datasets, params or {"warmup": 1}, label)
+
+    def test_fingerprints(self):
+        self.assertEqual(len(file_sha256(self.dataset)), 64)
+        self.assertEqual(machine_fingerprint(), machine_fingerprint())
+        commit = git_commit()
+        self.assertTrue(commit is None or len(commit.split("-")[0]) == 40)
+
+    def test_record_and_find(self):
+        first = self.record({"BinaryHeap": [1.0, 1.1]}, label="baseline")
+        second = self.record({"BinaryHeap": [1.0, 1.1]})
+        sessions = self.history.sessions()
+        self.assertEqual([row[0] for row in sessions], [first, second])
+        self.assertEqual(sessions[0][4], "baseline")
+        self.assertEqual(sessions[0][5], 3)  # Timed-out runs are kept too
+        self.assertEqual(self.history.find_session("baseline"), first)
+        self.assertEqual(self.history.find_session(second), second)
+        self.assertIsNone(self.history.find_session("nothing"))
+        samples = self.history.samples(first)
+        self.assertEqual([times for _, _, times in samples.values()], [[1.0, 1.1]])
+
+    def test_compare_flags_slowdowns(self):
+        rng = random.Random(0)
+        baseline = self.record({
+            "BinaryHeap": [1.0 + rng.random() * 0.05 for _ in range(10)],
+            "FibonacciHeap": [2.0 + rng.random() * 0.05 for _ in range(10)],
+        })
+        current = self.record({
+            "BinaryHeap": [1.0 + rng.random() * 0.05 for _ in range(10)],
+            "FibonacciHeap": [2.6 + rng.random() * 0.05 for _ in range(10)],
+        })
+        rows = {row[1]: row for row in self.history.compare(current, baseline)}
+        self.assertEqual(set(rows), {"BinaryHeap", "FibonacciHeap"})
+        self.assertFalse(rows["BinaryHeap"][6])
+        dataset, _, baseline_median, current_median, ratio, p_value, slowdown, same_machine = rows["FibonacciHeap"]
+        self.assertTrue(slowdown)
+        self.assertTrue(same_machine)
+        self.assertLess(p_value, 0.001)
+        self.assertAlmostEqual(ratio, current_median / baseline_median)
+
+        # Runs with other timing parameters are not compared
+        other = self.record({"BinaryHeap": [5.0] * 10}, params={"warmup": 0})
+        self.assertEqual(self.history.compare(other, baseline), [])
+
+    def test_compare_needs_same_sources(self):
+        baseline = self.record({"BinaryHeap": [1.0] * 5})
+        sampled = self.record({"BinaryHeap": [2.0] * 5}, sources=(0, 3, 7))
+        self.assertEqual(self.history.compare(sampled, baseline), [])
+        again = self.record({"BinaryHeap": [2.0] * 5}, sources=(7, 3, 0))
+        rows = self.history.compare(again, sampled)
+        self.assertEqual(len(rows), 1)
+        self.assertFalse(rows[0][6])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import random
+import unittest
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.load_graph import HEAP_TYPES
+from src.instrumented import (
+    INSTRUMENTED_HEAP_TYPES, InstrumentedBinaryHeap, InstrumentedDHeap,
+    InstrumentedFibonacciHeap, counted_dijkstra_shortest_path
+)
+from src.generate_data import generate_weighted_graph
+
+class TestInstrumented(unittest.TestCase):
+    def setUp(self):
+        random.seed(12)
+        data = generate_weighted_graph(200, 800)
+        self.graph = build_graph_from_edges(data["nodes"], data["edges"])
+
+    def test_same_results_as_plain_heaps(self):
+        num_entries = sum(len(edges) for edges in self.graph.values())
+        for name, heap_class in INSTRUMENTED_HEAP_TYPES.items():
+            with self.subTest(heap=name):
+                self.assertTrue(issubclass(heap_class, HEAP_TYPES[name]))
+                expected = dijkstra_shortest_path(self.graph, 0, HEAP_TYPES[name]())
+                distances, counters = counted_dijkstra_shortest_path(self.graph, 0, heap_class())
+                self.assertEqual(distances, expected)
+                self.assertEqual(counters['reached'], sum(d < float('inf') for d in expected.values()))
+                # Every pushed entry is popped exactly once
+                self.assertEqual(counters['pops'], counters['pushes'])
+                if name == "RadixHeap":
+                    # Out-of-order pops can scan a node again
+                    self.assertGreaterEqual(counters['relaxations'], num_entries)
+                else:
+                    self.assertEqual(counters['relaxations'], num_entries)
+                    self.assertEqual(counters['pops'] - counters['stale_pops'], len(self.graph))
+
+    def test_heap_specific_counters(self):
+        _, binary = counted_dijkstra_shortest_path(self.graph, 0, InstrumentedBinaryHeap())
+        _, four_ary = counted_dijkstra_shortest_path(self.graph, 0, InstrumentedDHeap(d=4))
+        _, fibonacci = counted_dijkstra_shortest_path(self.graph, 0, InstrumentedFibonacciHeap())
+        self.assertGreater(binary['sift_steps'], 0)
+        self.assertGreaterEqual(binary['comparisons'], binary['sift_steps'])
+        self.assertLess(four_ary['sift_steps'], binary['sift_steps'])
+        self.assertGreater(fibonacci['links'], 0)
+        self.assertGreater(fibonacci['stale_pops'], 0)  # Fibonacci pushes duplicates
+        self.assertEqual(fibonacci['decrease_keys'], 0)
+
+    def test_sift_matches_plain_heap(self):
+        plain, counted = HEAP_TYPES["DHeap"](d=3), InstrumentedDHeap(d=3)
+        for i in range(300):
+            priority = random.random()
+            plain.push(priority, i)
+            counted.push(priority, i)
+        self.assertEqual(plain.heap, counted.heap)
+        self.assertEqual([plain.pop() for _ in range(300)], [counted.pop() for _ in range(300)])
+
+    def test_exact_sift_counts(self):
+        heap = InstrumentedBinaryHeap()
+        heap.push(1, "a")  # Root: no comparison
+        heap.push(2, "b")  # One comparison, stays
+        heap.push(0, "c")  # One comparison and one step to the root
+        self.assertEqual((heap.counters['comparisons'], heap.counters['sift_steps']), (2, 1))
+        heap.pop()  # The last entry "a" moves to the root (not a sift step) and beats its one child
+        self.assertEqual((heap.counters['comparisons'], heap.counters['sift_steps']), (3, 1))
+
+    def test_counts_from_the_plain_search(self):
+        distances, counters = counted_dijkstra_shortest_path(self.graph, 0, InstrumentedBinaryHeap())
+        self.assertEqual(distances, dijkstra_shortest_path(self.graph, 0, HEAP_TYPES["BinaryHeap"]()))
+        # Every improvement pushes or decreases its node; the source adds one more call
+        self.assertEqual(counters['improvements'], counters['pushes'] + counters['decrease_keys'] - 1)
+        # The search events are counted without an instrumented heap too
+        _, plain = counted_dijkstra_shortest_path(self.graph, 0, HEAP_TYPES["BinaryHeap"]())
+        for key in ['relaxations', 'improvements', 'stale_pops', 'reached']:
+            self.assertEqual(plain[key], counters[key])
+        self.assertNotIn('pops', plain)
+
+if __name__ == '__main__':
+    unittest.main()
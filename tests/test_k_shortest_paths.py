@@ -0,0 +1,83 @@
+import unittest
+import random
+import networkx as nx
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.binary_heap import BinaryHeap
+from src.fibonacci_heap import FibonacciHeap
+from src.k_shortest_paths import shortest_path, k_shortest_paths
+from src.generate_data import generate_weighted_graph
+from src.load_graph import HEAP_TYPES
+
+class TestKShortestPaths(unittest.TestCase):
+    def setUp(self):
+        self.graph = build_graph_from_edges(
+            [0, 1, 2, 3, 4],
+            [(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8), (3, 4, 1)]
+        )
+
+    def test_shortest_path(self):
+        self.assertEqual(shortest_path(self.graph, 0, 4, BinaryHeap()), (9, [0, 2, 1, 3, 4]))
+        self.assertEqual(shortest_path(self.graph, 0, 4, FibonacciHeap()), (9, [0, 2, 1, 3, 4]))
+
+    def test_shortest_path_masks(self):
+        self.assertEqual(shortest_path(self.graph, 0, 3, BinaryHeap(), banned_nodes={1}), (10, [0, 2, 3]))
+        self.assertEqual(shortest_path(self.graph, 0, 3, BinaryHeap(), banned_edges={(2, 1)}), (9, [0, 1, 3]))
+        self.assertEqual(shortest_path(self.graph, 0, 3, BinaryHeap(), banned_nodes={3}), (float('inf'), []))
+        # Masks never touch the graph itself
+        self.assertEqual(dijkstra_shortest_path(self.graph, 0, BinaryHeap())[3], 8)
+
+    def test_shortest_path_random_graphs(self):
+        for seed in range(10):
+            random.seed(seed)
+            data = generate_weighted_graph(200, 600)
+            graph = build_graph_from_edges(data["nodes"], data["edges"])
+            expected = dijkstra_shortest_path(graph, 0, BinaryHeap())
+            for heap_class in HEAP_TYPES.values():
+                with self.subTest(seed=seed, heap=heap_class.__name__):
+                    for target in range(1, 200, 7):
+                        distance, path = shortest_path(graph, 0, target, heap_class())
+                        self.assertEqual(distance, expected[target])
+                        if path:
+                            self.assertEqual((path[0], path[-1]), (0, target))
+
+    def test_heaps_agree(self):
+        random.seed(4)
+        data = generate_weighted_graph(60, 150)
+        graph = build_graph_from_edges(data["nodes"], data["edges"])
+        expected = [cost for cost, _ in k_shortest_paths(graph, 0, 59, 5, "BinaryHeap")]
+        for heap_type in HEAP_TYPES:
+            with self.subTest(heap=heap_type):
+                self.assertEqual([cost for cost, _ in k_shortest_paths(graph, 0, 59, 5, heap_type)], expected)
+
+    def test_small_graph(self):
+        paths = k_shortest_paths(self.graph, 0, 3, 10)
+        self.assertEqual(paths, [(8, [0, 2, 1, 3]), (9, [0, 1, 3]), (10, [0, 2, 3]), (13, [0, 1, 2, 3])])
+
+    def test_unreachable(self):
+        graph = build_graph_from_edges([0, 1, 2], [(0, 1, 1)])
+        self.assertEqual(k_shortest_paths(graph, 0, 2, 3), [])
+
+    def test_matches_networkx(self):
+        random.seed(4)
+        data = generate_weighted_graph(60, 150)
+        graph = build_graph_from_edges(data["nodes"], data["edges"])
+        reference = nx.Graph()
+        for u, v, weight in data["edges"]:
+            if not reference.has_edge(u, v) or reference[u][v]["weight"] > weight:
+                reference.add_edge(u, v, weight=weight)
+
+        expected = []
+        for path in nx.shortest_simple_paths(reference, 0, 59, weight="weight"):
+            expected.append(nx.path_weight(reference, path, "weight"))
+            if len(expected) == 10:
+                break
+        for processes in [1, 2]:
+            with self.subTest(processes=processes):
+                paths = k_shortest_paths(graph, 0, 59, 10, "DHeap", processes=processes)
+                self.assertEqual([cost for cost, _ in paths], expected)
+                self.assertEqual(len({tuple(path) for _, path in paths}), 10)
+                for _, path in paths:
+                    self.assertEqual(len(set(path)), len(path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import random
+import numpy as np
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.binary_heap import BinaryHeap
+from src.many_to_many import distance_matrix
+from src.generate_data import generate_weighted_graph
+
+class TestManyToMany(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        data = generate_weighted_graph(150, 300)
+        self.graph = build_graph_from_edges(data["nodes"], data["edges"])
+        self.origins = random.sample(data["nodes"], 12)
+        self.targets = random.sample(data["nodes"], 9) + [self.origins[0]]
+
+    def expected(self, graph, origins, targets):
+        rows = []
+        for origin in origins:
+            distances = dijkstra_shortest_path(graph, origin, BinaryHeap())
+            rows.append([distances[target] for target in targets])
+        return np.array(rows)
+
+    def test_matches_full_dijkstra(self):
+        expected = self.expected(self.graph, self.origins, self.targets)
+        for heap_type in ["BinaryHeap", "DHeap", "RadixHeap", "FibonacciHeap"]:
+            for ball_size in [1, 5, 40, 1000]:
+                with self.subTest(heap=heap_type, ball_size=ball_size):
+                    matrix = distance_matrix(self.graph, self.origins, self.targets, heap_type, ball_size=ball_size)
+                    np.testing.assert_allclose(matrix, expected)
+
+    def test_random_graphs(self):
+        # The early stop relies on pops in nondecreasing order, so check every heap on several graphs
+        for seed in range(5):
+            random.seed(seed)
+            data = generate_weighted_graph(200, 600)
+            graph = build_graph_from_edges(data["nodes"], data["edges"])
+            origins, targets = random.sample(data["nodes"], 8), random.sample(data["nodes"], 8)
+            expected = self.expected(graph, origins, targets)
+            for heap_type in ["BinaryHeap", "DHeap", "RadixHeap", "FibonacciHeap"]:
+                with self.subTest(seed=seed, heap=heap_type):
+                    np.testing.assert_allclose(distance_matrix(graph, origins, targets, heap_type, ball_size=10),
+                                               expected)
+
+    def test_writes_into_out(self):
+        out = np.zeros((len(self.origins), len(self.targets)))
+        result = distance_matrix(self.graph, self.origins, self.targets, out=out, ball_size=10)
+        self.assertIs(result, out)
+        np.testing.assert_allclose(out, self.expected(self.graph, self.origins, self.targets))
+
+    def test_out_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            distance_matrix(self.graph, self.origins, self.targets, out=np.zeros((1, 1)))
+
+    def test_unreachable_and_empty(self):
+        graph = build_graph_from_edges([0, 1, 2, 3], [(0, 1, 2), (2, 3, 1)])
+        matrix = distance_matrix(graph, [0, 2], [1, 3], ball_size=2)
+        np.testing.assert_array_equal(matrix, [[2, np.inf], [np.inf, 1]])
+        self.assertEqual(distance_matrix(graph, [0], []).shape, (1, 0))
+
+    def test_directed_graph(self):
+        # Directed edges have weight 1; the reverse graph is needed for the balls
+        edges = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)]
+        graph = build_graph_from_edges([0, 1, 2, 3], edges)
+        reverse = build_graph_from_edges([0, 1, 2, 3], [(v, u) for u, v in edges])
+        matrix = distance_matrix(graph, [0, 1, 3], [0, 2, 3], ball_size=2, reverse_graph=reverse)
+        np.testing.assert_array_equal(matrix, self.expected(graph, [0, 1, 3], [0, 2, 3]))
+
+if __name__ == '__main__':
+    unittest.main()
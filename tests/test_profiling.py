@@ -0,0 +1,69 @@
+import contextlib
+import io
+import os
+import pstats
+import random
+import tempfile
+import unittest
+from src.generate_data import generate_weighted_graph, save_graph_to_disk
+from src.helper import EXPERIMENT_ENGINES
+from src.load_graph import load_graph
+from src.profiling import hot_functions, profile_datasets, profile_engine, sample_stacks
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "graph_n200_e1000_random.json")
+        save_graph_to_disk(generate_weighted_graph(200, 1000), self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hot_functions_and_traced_stacks(self):
+        graph, nodes = load_graph(self.path)
+        stats, stacks = profile_engine(graph, nodes, "BinaryHeap", sampler="setprofile")
+        hot = hot_functions(stats, top=5)
+        self.assertEqual(len(hot), 5)
+        self.assertEqual([entry[1] for entry in hot], sorted((entry[1] for entry in hot), reverse=True))
+        self.assertIn("binary_heap.py:_bubble_down", [entry[0] for entry in hot])
+        self.assertLessEqual(sum(entry[2] for entry in hot), 1.0 + 1e-9)
+
+        # Every stack starts at the search; the heap filling is not traced
+        self.assertTrue(stacks)
+        self.assertTrue(all(stack.startswith("dijkstra.py:dijkstra_shortest_path") for stack in stacks))
+        self.assertTrue(any(stack.endswith("BinaryHeap._bubble_down") for stack in stacks))
+        self.assertFalse(any("_filled_heap" in stack for stack in stacks))
+
+    def test_sample_stacks(self):
+        def spin(_):
+            total = 0
+            for i in range(200000):
+                total += i * i
+            return total
+
+        stacks = sample_stacks(spin, interval=0.001, min_seconds=0.05)
+        # The sampled function itself is the root, so its own samples have an empty stack and are dropped
+        self.assertEqual(stacks, {})
+        stacks = sample_stacks(lambda _: spin(None), interval=0.001, min_seconds=0.05)
+        self.assertGreater(stacks["test_profiling.py:TestProfiling.test_sample_stacks.<locals>.spin"], 0)
+
+    def test_profile_datasets(self):
+        result_dir = os.path.join(self.tmp.name, "profiles")
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            hot = profile_datasets([(self.path, 200, "random")], EXPERIMENT_ENGINES,
+                                   result_dir=result_dir, sampler="signal", top=3)
+        self.assertEqual(set(hot), {(self.path, engine) for engine in EXPERIMENT_ENGINES})
+        self.assertIn("_consolidate", output.getvalue())
+        for engine in EXPERIMENT_ENGINES:
+            with self.subTest(engine=engine):
+                base = os.path.join(result_dir, f"graph_n200_e1000_random_{engine}")
+                self.assertGreater(pstats.Stats(base + ".pstats").total_calls, 0)
+                with open(base + ".folded") as f:
+                    for line in f:
+                        stack, count = line.rsplit(" ", 1)
+                        self.assertGreater(int(count), 0)
+                        self.assertNotIn(" ", stack.split(";")[0])
+
+if __name__ == '__main__':
+    unittest.main()
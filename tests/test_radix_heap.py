@@ -1,5 +1,6 @@
 import unittest
 import math
+import random
 from src.radix_heap import RadixHeap
 
 class TestRadixHeap(unittest.TestCase):
@@ -55,6 +56,16 @@ class TestRadixHeap(unittest.TestCase):
         self.assertEqual(self.heap.pop(), ('X', 100))
         self.assertEqual(self.heap.pop(), ('Y', 150))
 
+    def test_clear(self):
+        self.heap.push(100, 'X')
+        self.heap.push(200, 'Y')
+        self.heap.pop()
+        self.heap.clear()
+        self.assertTrue(self.heap.is_empty())
+        # last_popped is reset, so smaller priorities are accepted again
+        self.heap.push(5, 'X')
+        self.assertEqual(self.heap.pop(), ('X', 5))
+
     def test_infinity_handling(self):
         self.heap.push(float('inf'), 'A')
         self.heap.push(100, 'B')
@@ -67,6 +78,28 @@ class TestRadixHeap(unittest.TestCase):
         values = {self.heap.pop()[0], self.heap.pop()[0]}
         self.assertEqual(values, {'A', 'C'})
 
+    def test_pops_in_order(self):
+        # Monotone use, as in Dijkstra: pushes and decrease-keys never go below the last pop
+        rng = random.Random(1)
+        last, priorities = 0, {}
+        for i in range(20000):
+            if priorities and rng.random() < 0.4:
+                value, priority = self.heap.pop()
+                self.assertGreaterEqual(priority, last)
+                self.assertEqual(priority, priorities.pop(value))
+                last = priority
+            elif priorities and rng.random() < 0.3:
+                value = rng.choice(list(priorities))
+                new_priority = last + (priorities[value] - last) * rng.random()
+                if self.heap.decrease_key(value, new_priority):
+                    priorities[value] = new_priority
+            else:
+                priority = last + rng.choice([0, 1, 3, 100]) * rng.random()
+                if rng.random() < 0.5:
+                    priority = int(priority)  # Mixed int and float priorities
+                self.heap.push(max(priority, last), i)
+                priorities[i] = max(priority, last)
+
     # def test_negative_numbers(self):
     #     self.heap.push(-5, 'A')
     #     self.heap.push(-3, 'B')
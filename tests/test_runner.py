@@ -0,0 +1,88 @@
+import math
+import os
+import random
+import tempfile
+import unittest
+from src.helper import EXPERIMENT_ENGINES
+from src.generate_data import generate_weighted_graph, save_graph_to_disk
+from src.runner import OK, TIMED_OUT, FAILED, iter_isolated_runs, run_isolated_benchmark, sample_sources, source_records
+
+class TestIsolatedRunner(unittest.TestCase):
+    def setUp(self):
+        random.seed(8)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "graph_n50_e200_random.json")
+        save_graph_to_disk(generate_weighted_graph(50, 200), self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_run_isolated_benchmark(self):
+        results, runs = run_isolated_benchmark([(self.path, 50, "random")], repeats=2, workers=2, warmup=0)
+        self.assertEqual(len(runs), 2 * len(EXPERIMENT_ENGINES))
+        self.assertTrue(all(run[4] == OK for run in runs))
+        self.assertEqual(len(results), 1)
+        graph_size, graph_type, *entries = results[0]
+        self.assertEqual((graph_size, graph_type), (50, "random"))
+        self.assertEqual(len(entries), len(EXPERIMENT_ENGINES))
+        for engine, (time, memory, iqr, minimum, working_set, rss, counters) in zip(EXPERIMENT_ENGINES, entries):
+            with self.subTest(engine=engine):
+                self.assertGreater(time, 0)
+                self.assertLessEqual(minimum, time)
+                self.assertGreater(memory, 0)  # From repeat 0
+                self.assertGreater(rss, 0)
+                if engine in ("BinaryHeap", "DHeap"):
+                    self.assertEqual(counters['pops'], 50)  # Pre-filled heap: each node popped once
+                elif engine != "DenseDijkstra":
+                    self.assertGreaterEqual(counters['pops'], 50)
+
+    def test_timeout_and_failure(self):
+        outcomes = list(iter_isolated_runs([(self.path, "BinaryHeap", 0, 0)], timeout=0))
+        self.assertEqual(outcomes, [((self.path, "BinaryHeap", 0, 0), TIMED_OUT, None)])
+
+        missing = os.path.join(self.tmp.name, "missing.json")
+        [(task, status, message)] = iter_isolated_runs([(missing, "BinaryHeap", 0, 0)], timeout=60)
+        self.assertEqual(status, FAILED)
+        self.assertIn("missing.json", message)
+
+        results, runs = run_isolated_benchmark([(missing, 50, "random")], repeats=1)
+        self.assertTrue(all(math.isnan(entry[0]) for entry in results[0][2:]))
+
+    def test_sources_and_engines(self):
+        sources = sample_sources([(self.path, 50, "random")], 3, seed=1)
+        self.assertEqual(sources, sample_sources([(self.path, 50, "random")], 3, seed=1))
+        self.assertEqual(len(sources[self.path]), 3)
+        results, runs = run_isolated_benchmark([(self.path, 50, "random")], repeats=1, warmup=0,
+                                               engines=["BinaryHeap"], sources=sources)
+        self.assertEqual(sorted(run[2] for run in runs), sources[self.path])
+        records = source_records(runs)
+        self.assertEqual([record[2] for record in records], sources[self.path])
+        for _, engine, _, seconds, reached in records:
+            self.assertEqual(engine, "BinaryHeap")
+            self.assertGreater(seconds, 0)
+            self.assertGreaterEqual(reached, 1)
+        binary = results[0][2 + EXPERIMENT_ENGINES.index("BinaryHeap")]
+        self.assertGreater(binary[0], 0)
+        self.assertTrue(math.isnan(results[0][2][0]))  # RadixHeap not run
+
+    @unittest.skipUnless(hasattr(os, "sched_setaffinity"), "needs sched_setaffinity")
+    def test_pinned(self):
+        tasks = [(self.path, "DHeap", 0, repeat) for repeat in range(3)]
+        statuses = [status for _, status, _ in iter_isolated_runs(tasks, pin=True, warmup=0)]
+        self.assertEqual(statuses, [OK] * 3)
+
+    def test_sources_come_from_the_node_list(self):
+        path = os.path.join(self.tmp.name, "graph_n30_e60_offset.json")
+        data = generate_weighted_graph(30, 60)
+        # Node ids 100..129: sampling range(30) would give ids that do not exist
+        save_graph_to_disk({"nodes": [node + 100 for node in data["nodes"]],
+                            "edges": [(u + 100, v + 100, w) for u, v, w in data["edges"]]}, path)
+        sources = sample_sources([(path, 30, "offset")], 4, seed=5)
+        self.assertEqual(len(sources[path]), 4)
+        self.assertTrue(all(100 <= source < 130 for source in sources[path]))
+        _, runs = run_isolated_benchmark([(path, 30, "offset")], repeats=1, warmup=0,
+                                         engines=["BinaryHeap"], sources=sources)
+        self.assertTrue(all(run[4] == OK and run[6] > 0 for run in runs))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import multiprocessing as mp
+import numpy as np
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.binary_heap import BinaryHeap
+from src.shared_graph import SharedGraph
+
+def _distances_in_child(name):
+    shared = SharedGraph.attach(name)
+    distances = dijkstra_shortest_path(shared.graph, 0, BinaryHeap())
+    shared.close()
+    return distances
+
+class TestSharedGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = build_graph_from_edges(
+            [0, 1, 2, 3], [(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8)]
+        )
+        self.expected = {0: 0, 1: 3, 2: 2, 3: 8}
+
+    def test_attach_in_same_process(self):
+        with SharedGraph.publish(self.graph) as shared:
+            attached = SharedGraph.attach(shared.name)
+            self.assertFalse(attached.owner)
+            self.assertEqual(dijkstra_shortest_path(attached.graph, 0, BinaryHeap()), self.expected)
+            attached.close()
+
+    def test_attach_in_worker_process(self):
+        with SharedGraph.publish(self.graph) as shared:
+            with mp.get_context("spawn").Pool(2) as pool:
+                results = pool.map(_distances_in_child, [shared.name] * 2)
+        self.assertEqual(results, [self.expected] * 2)
+
+    def test_numpy_node_ids(self):
+        with SharedGraph.publish(self.graph) as shared:
+            attached = SharedGraph.attach(shared.name)
+            # Dense-id graphs use a range index, which must accept NumPy integers
+            self.assertEqual(attached.graph[np.int64(3)], attached.graph[3])
+            self.assertIn(np.int32(2), attached.graph)
+            self.assertNotIn(4, attached.graph)
+            self.assertNotIn("a", attached.graph)
+            attached.close()
+
+    def test_non_dense_node_ids(self):
+        graph = build_graph_from_edges([10, 20, 30], [(10, 20, 1), (20, 30, 2)])
+        with SharedGraph.publish(graph) as shared:
+            attached = SharedGraph.attach(shared.name)
+            self.assertEqual(list(attached.graph), [10, 20, 30])
+            self.assertEqual(attached.graph[20], [(10, 1.0), (30, 2.0)])
+            attached.close()
+
+    def test_close_unlinks_segment(self):
+        shared = SharedGraph.publish(self.graph)
+        name = shared.name
+        shared.close()
+        shared.close()  # Closing twice is harmless
+        with self.assertRaises(FileNotFoundError):
+            SharedGraph.attach(name)
+
+if __name__ == '__main__':
+    unittest.main()
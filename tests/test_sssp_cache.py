@@ -0,0 +1,83 @@
+import unittest
+from src.dijkstra import build_graph_from_edges
+from src.dynamic_sssp import DynamicSSSP
+from src.sssp_cache import SSSPCache
+
+class TestSSSPCache(unittest.TestCase):
+    def setUp(self):
+        self.graph = build_graph_from_edges(
+            [0, 1, 2, 3], [(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8)]
+        )
+        self.cache = SSSPCache()
+
+    def test_hit_and_miss(self):
+        expected = {0: 0, 1: 3, 2: 2, 3: 8}
+        self.assertEqual(self.cache.get(self.graph, 0), expected)
+        self.assertEqual(self.cache.get(self.graph, 0), expected)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        # Heap type and cutoffs are part of the key
+        self.cache.get(self.graph, 0, heap_type="RadixHeap")
+        self.assertEqual(self.cache.get(self.graph, 0, max_settled=2), {0: 0, 2: 2})
+        self.assertEqual(self.cache.get(self.graph, 0, max_settled=2), {0: 0, 2: 2})
+        self.assertEqual(self.cache.stats()['hits'], 2)
+        self.assertEqual(self.cache.stats()['misses'], 3)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_results_are_copies(self):
+        first = self.cache.get(self.graph, 0)
+        first[3] = -1
+        second = self.cache.get(self.graph, 0)
+        self.assertEqual(second[3], 8)
+        second[3] = -1
+        self.assertEqual(self.cache.get(self.graph, 0)[3], 8)
+        self.assertIsNot(self.cache.get(self.graph, 0), self.cache.get(self.graph, 0))
+
+    def test_graph_released_with_last_entry(self):
+        probe = SSSPCache()
+        probe.get(self.graph, 0)
+        cache = SSSPCache(byte_budget=probe.current_bytes)
+        other = build_graph_from_edges([0, 1], [(0, 1, 7)])
+        cache.get(other, 0)
+        self.assertIn(id(other), cache._graphs)
+        cache.get(self.graph, 0)  # Evicts other's only entry
+        self.assertNotIn(id(other), cache._graphs)
+        self.assertEqual(cache.get(other, 0), {0: 0, 1: 7})
+        # A result over the budget is returned but neither stored nor tracked
+        tiny = SSSPCache(byte_budget=1)
+        self.assertEqual(tiny.get(self.graph, 0)[3], 8)
+        self.assertEqual((len(tiny), tiny._graphs), (0, {}))
+
+    def test_lru_eviction_under_budget(self):
+        probe = SSSPCache()
+        probe.get(self.graph, 0)
+        entry_size = probe.current_bytes
+
+        cache = SSSPCache(byte_budget=2 * entry_size)
+        cache.get(self.graph, 0)
+        cache.get(self.graph, 1)
+        cache.get(self.graph, 0)  # 0 becomes most recently used
+        cache.get(self.graph, 2)  # Evicts 1
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.current_bytes, cache.byte_budget)
+        cache.get(self.graph, 0)
+        self.assertEqual(cache.hits, 2)
+        cache.get(self.graph, 1)
+        self.assertEqual(cache.misses, 4)
+
+    def test_invalidation_on_mutation(self):
+        dynamic = DynamicSSSP(self.graph, 0, cache=self.cache)
+        self.assertEqual(self.cache.get(self.graph, 3)[0], 8)
+        dynamic.update_edge(0, 3, 1)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.get(self.graph, 3)[0], 1)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_separate_graphs(self):
+        other = build_graph_from_edges([0, 1], [(0, 1, 7)])
+        self.assertEqual(self.cache.get(other, 0), {0: 0, 1: 7})
+        self.assertEqual(self.cache.get(self.graph, 0)[1], 3)
+        self.cache.forget(other)
+        self.assertEqual(len(self.cache), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import random
+from src.dijkstra import dijkstra_shortest_path, build_graph_from_edges
+from src.binary_heap import BinaryHeap
+from src.d_heap import DHeap
+from src.radix_heap import RadixHeap
+from src.fibonacci_heap import FibonacciHeap
+from src.workspace import DijkstraWorkspace
+from src.generate_data import generate_weighted_graph
+
+class TestDijkstraWorkspace(unittest.TestCase):
+    def setUp(self):
+        self.graph = build_graph_from_edges(
+            [0, 1, 2, 3], [(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8)]
+        )
+
+    def test_query_and_path(self):
+        workspace = DijkstraWorkspace(self.graph)
+        self.assertEqual(workspace.query(0), {0: 0, 2: 2, 1: 3, 3: 8})
+        self.assertEqual(workspace.path_to(3), [0, 2, 1, 3])
+        self.assertEqual(workspace.distance(1), 3)
+
+    def test_repeated_queries_match_fresh_runs(self):
+        random.seed(9)
+        data = generate_weighted_graph(150, 400)
+        graph = build_graph_from_edges(data["nodes"], data["edges"])
+        for heap in [BinaryHeap(), DHeap(d=4), RadixHeap(), FibonacciHeap()]:
+            workspace = DijkstraWorkspace(graph, heap)
+            with self.subTest(heap=type(heap).__name__):
+                for source in [0, 5, 0, 149, 77]:
+                    expected = dijkstra_shortest_path(graph, source, BinaryHeap())
+                    reached = {node: d for node, d in expected.items() if d != float('inf')}
+                    self.assertEqual(workspace.query(source), reached)
+                    # A cut-off query leaves the heap non-empty; the next one must not see it
+                    self.assertEqual(len(workspace.query(source, max_settled=3)), 3)
+
+    def test_cutoffs(self):
+        workspace = DijkstraWorkspace(self.graph, RadixHeap())
+        self.assertEqual(workspace.query(0, max_distance=3), {0: 0, 2: 2, 1: 3})
+        self.assertEqual(workspace.query(3, max_settled=2), {3: 0, 1: 5})
+        # Node 0 was touched by the previous query only, not by this one
+        self.assertEqual(workspace.distance(0), float('inf'))
+        self.assertEqual(workspace.distance(2), 8)
+        workspace.query(2, max_settled=1)
+        self.assertEqual(workspace.distance(3), float('inf'))
+        self.assertEqual(workspace.path_to(2), [2])
+
+    def test_cutoffs_random_graphs(self):
+        for seed in range(10):
+            random.seed(seed)
+            data = generate_weighted_graph(200, 600)
+            graph = build_graph_from_edges(data["nodes"], data["edges"])
+            for heap in [BinaryHeap(), DHeap(d=4), RadixHeap(), FibonacciHeap()]:
+                workspace = DijkstraWorkspace(graph, heap)
+                with self.subTest(seed=seed, heap=type(heap).__name__):
+                    for source in [0, 50, 199]:
+                        full = dijkstra_shortest_path(graph, source, BinaryHeap())
+                        within = {node: d for node, d in full.items() if d <= 9}
+                        self.assertEqual(workspace.query(source, max_distance=9), within)
+                        # Ties may settle in any order, so compare the distances of the 20 nearest nodes
+                        nearest = workspace.query(source, max_settled=20)
+                        self.assertEqual(sorted(nearest.values()), sorted(full.values())[:20])
+
+    def test_non_integer_nodes(self):
+        graph = build_graph_from_edges(['a', 'b', 'c'], [('a', 'b', 2), ('b', 'c', 2)])
+        workspace = DijkstraWorkspace(graph)
+        self.assertEqual(workspace.query('c'), {'c': 0, 'b': 2, 'a': 4})
+        self.assertEqual(workspace.path_to('a'), ['c', 'b', 'a'])
+
+if __name__ == '__main__':
+    unittest.main()